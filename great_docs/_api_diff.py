@@ -7,6 +7,7 @@ import tempfile
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from great_docs._pyyaml import safe_loader
 from great_docs._translations import get_translation
 
 # ---------------------------------------------------------------------------
@@ -752,10 +753,8 @@ def _read_cli_module_at_tag(
 
             if cfg_file == "pyproject.toml":
                 # Parse [tool.great-docs.cli] section
-                try:
-                    import tomllib
-                except ImportError:
-                    import tomli as tomllib  # type: ignore[no-redef]
+                import tomllib
+
                 data = tomllib.loads(content)
                 cli_cfg = data.get("tool", {}).get("great-docs", {}).get("cli", {})
                 if cli_cfg.get("enabled"):
@@ -765,7 +764,7 @@ def _read_cli_module_at_tag(
                 try:
                     import yaml
 
-                    data = yaml.safe_load(content) or {}
+                    data = yaml.load(content, Loader=safe_loader(yaml)) or {}
                     cli_cfg = data.get("cli", {})
                     if cli_cfg.get("enabled"):
                         return cli_cfg.get("module")
@@ -2351,10 +2350,7 @@ def _detect_package_name(project_root: Path) -> str | None:
         return None
 
     try:
-        try:
-            import tomllib
-        except ImportError:
-            import tomli as tomllib
+        import tomllib
 
         with open(pyproject, "rb") as f:
             data = tomllib.load(f)
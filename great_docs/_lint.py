@@ -523,13 +523,17 @@ def _check_stale_versions(project_root: Path, result: LintResult) -> None:
     """
     import yaml
 
+    from ._pyyaml import safe_loader
+
     # Load great-docs.yml for versions list and optional lint config
     config_path = project_root / "great-docs.yml"
     if not config_path.exists():
         return
 
     try:
-        raw_config = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
+        raw_config = (
+            yaml.load(config_path.read_text(encoding="utf-8"), Loader=safe_loader(yaml)) or {}
+        )
     except Exception:
         return
 
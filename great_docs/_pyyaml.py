@@ -0,0 +1,21 @@
+"""
+Helpers for the few call sites that parse or emit YAML with PyYAML rather than yaml12.
+
+PyYAML ships libyaml-backed `CSafeLoader`/`CSafeDumper` classes only when it was built against
+libyaml; these helpers pick them when present and fall back to the pure-Python safe classes
+otherwise. The `yaml` module is passed in so callers keep importing PyYAML lazily.
+"""
+
+from __future__ import annotations
+
+from types import ModuleType
+
+
+def safe_loader(yaml: ModuleType) -> type:
+    """Return PyYAML's libyaml-backed safe loader when available, else the pure-Python one."""
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def safe_dumper(yaml: ModuleType) -> type:
+    """Return PyYAML's libyaml-backed safe dumper when available, else the pure-Python one."""
+    return getattr(yaml, "CSafeDumper", yaml.SafeDumper)
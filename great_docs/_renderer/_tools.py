@@ -75,6 +75,8 @@ def render_code_variable(code: str, name: str | None = None) -> str:
 
     If name is None, return code rendered as a module
     """
+    # Visit the code afresh on every call: the module is mutable (aliases resolve in place)
+    # and its rendering depends on the mutable exclusion globals, so neither can be reused
     with gf.temporary_visited_package(
         "package", {"__init__.py": code}, docstring_parser="numpy"
     ) as m:
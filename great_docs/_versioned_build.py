@@ -11,6 +11,7 @@ from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_compl
 from pathlib import Path
 from typing import Any, Callable
 
+from great_docs._pyyaml import safe_dumper, safe_loader
 from great_docs._versioning import (
     VersionEntry,
     build_version_map,
@@ -253,7 +254,7 @@ def _prune_quarto_cli_sidebar(dest_dir: Path, valid_stems: set[str]) -> None:
     try:
         import yaml
 
-        content = yaml.safe_load(quarto_yml.read_text(encoding="utf-8"))
+        content = yaml.load(quarto_yml.read_bytes(), Loader=safe_loader(yaml))
         if not content:
             return
 
@@ -285,6 +286,7 @@ def _prune_quarto_cli_sidebar(dest_dir: Path, valid_stems: set[str]) -> None:
                 default_flow_style=False,
                 sort_keys=False,
                 allow_unicode=True,
+                Dumper=safe_dumper(yaml),
             )
     except Exception:
         pass  # Best-effort
@@ -876,7 +878,7 @@ def _prune_quarto_sidebar(
     try:
         import yaml
 
-        content = yaml.safe_load(quarto_yml.read_text(encoding="utf-8"))
+        content = yaml.load(quarto_yml.read_bytes(), Loader=safe_loader(yaml))
         if not content:
             return
 
@@ -945,6 +947,7 @@ def _prune_quarto_sidebar(
                 default_flow_style=False,
                 sort_keys=False,
                 allow_unicode=True,
+                Dumper=safe_dumper(yaml),
             )
     except Exception:
         pass  # Best-effort
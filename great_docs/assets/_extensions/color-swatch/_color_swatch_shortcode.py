@@ -326,11 +326,17 @@ def compute_contrast_info(hex_str: str) -> dict[str, Any]:
 # YAML parsing
 # ---------------------------------------------------------------------------
 
+
+def _yaml_safe_loader(yaml):
+    """Return PyYAML's libyaml-backed safe loader when available, else the pure-Python one."""
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 try:
     import yaml as _yaml
 
     def _parse_yaml(text: str) -> list[dict[str, Any]]:
-        data = _yaml.safe_load(text)
+        data = _yaml.load(text, Loader=_yaml_safe_loader(_yaml))
         if isinstance(data, list):
             return data
         return []
@@ -79,6 +79,11 @@ def _t(key: str, fallback: str | None = None) -> str:
     return _i18n_bundle.get(key, fallback if fallback is not None else key)
 
 
+def _yaml_safe_loader(yaml):
+    """Return PyYAML's libyaml-backed safe loader when available, else the pure-Python one."""
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 # Load objects.json inventory for resolving interlinks
 # Maps qualified names -> {uri, dispname} for cross-reference resolution
 _interlinks_inventory: dict[str, dict[str, str]] = {}
@@ -3870,7 +3875,7 @@ def inject_page_metadata():
                         import yaml
 
                         try:
-                            frontmatter = yaml.safe_load(parts[1]) or {}
+                            frontmatter = yaml.load(parts[1], Loader=_yaml_safe_loader(yaml)) or {}
                         except Exception:
                             pass
             except Exception:
@@ -4781,7 +4786,7 @@ for html_file in glob.glob("_site/**/*.html", recursive=True):
             continue
         import yaml
 
-        fm = yaml.safe_load(parts[1]) or {}
+        fm = yaml.load(parts[1], Loader=_yaml_safe_loader(yaml)) or {}
     except Exception:
         continue
 
@@ -23,11 +23,7 @@ def _detect_python_version_from_pyproject(project_root: Path) -> str | None:
         return None
 
     try:
-        # Use tomllib (Python 3.11+) or tomli as fallback
-        try:
-            import tomllib
-        except ImportError:
-            import tomli as tomllib
+        import tomllib
 
         with open(pyproject_path, "rb") as f:
             data = tomllib.load(f)
@@ -93,10 +89,7 @@ def _detect_optional_dependencies(project_root: Path) -> list[str]:
         return []
 
     try:
-        try:
-            import tomllib
-        except ImportError:
-            import tomli as tomllib
+        import tomllib
 
         with open(pyproject_path, "rb") as f:
             data = tomllib.load(f)
@@ -1,7 +1,10 @@
+import copy
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from yaml12 import read_yaml
+from yaml12 import parse_yaml
 
 # Default configuration values
 DEFAULT_CONFIG: dict[str, Any] = {
@@ -363,6 +366,18 @@ DEFAULT_CONFIG: dict[str, Any] = {
 }
 
 
+@lru_cache(maxsize=128)
+def _parse_config_text(text: str) -> Any:
+    """
+    Parse great-docs.yml content, caching on the text itself.
+
+    A build constructs `Config` many times over an unchanged file; keying on content (rather
+    than mtime) means an in-place rewrite is never served stale. Callers must copy the result
+    before mutating it.
+    """
+    return parse_yaml(text) or {}
+
+
 class Config:
     """
     Configuration manager for Great Docs.
@@ -384,6 +399,32 @@ class Config:
         self.config_path = project_root / "great-docs.yml"
         self._config = self._load_config()
 
+    @classmethod
+    def from_mapping(cls, data: dict[str, Any], project_root: Path | None = None) -> "Config":
+        """
+        Create a configuration from already-parsed great-docs.yml data.
+
+        Nothing is read from disk; `data` is merged with the defaults exactly as the contents of
+        great-docs.yml would be.
+
+        Parameters
+        ----------
+        data
+            The user configuration (the parsed great-docs.yml mapping).
+        project_root
+            Path to the project root directory. Defaults to the current directory.
+
+        Returns
+        -------
+        Config
+            The configuration.
+        """
+        config = cls.__new__(cls)
+        config.project_root = project_root if project_root is not None else Path.cwd()
+        config.config_path = config.project_root / "great-docs.yml"
+        config._config = config._merge_config(DEFAULT_CONFIG.copy(), copy.deepcopy(data))
+        return config
+
     def _load_config(self) -> dict[str, Any]:
         """
         Load configuration from great-docs.yml.
@@ -395,10 +436,10 @@ class Config:
         """
         config = DEFAULT_CONFIG.copy()
 
-        if self.config_path.exists():
+        if os.path.isfile(self.config_path):
             try:
                 with open(self.config_path, "r", encoding="utf-8") as f:
-                    user_config = read_yaml(f) or {}
+                    user_config = copy.deepcopy(_parse_config_text(f.read()))
 
                 # Deep merge user config with defaults
                 config = self._merge_config(config, user_config)
@@ -451,6 +492,10 @@ class Config:
         Any
             The configuration value or default.
         """
+        # Most settings are top-level; look those up directly
+        if "." not in key:
+            return self._config.get(key, default)
+
         keys = key.split(".")
         value = self._config
 
@@ -1502,7 +1547,7 @@ class Config:
 
     def exists(self) -> bool:
         """Check if the configuration file exists."""
-        return self.config_path.exists()
+        return os.path.isfile(self.config_path)
 
     def to_dict(self) -> dict[str, Any]:
         """
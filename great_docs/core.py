@@ -1,8 +1,13 @@
+import contextlib
+import copy
+import io
 import json
 import os
 import re
 import shutil
+from collections.abc import Iterator
 from datetime import datetime
+from functools import lru_cache
 from importlib import resources
 from pathlib import Path
 
@@ -49,6 +54,209 @@ def _ensure_quarto_installed() -> None:
     )
 
 
+def _scandir_files(root: Path, suffixes: tuple[str, ...]) -> Iterator[Path]:
+    """Recursively yield files under *root* whose names end with one of *suffixes*.
+
+    Uses `os.scandir()` so file-type checks come from the cached directory entries instead of a
+    separate `stat()` call per path (as `Path.rglob()` does). Symlinked directories are not
+    descended into and unreadable directories are skipped.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _scandir_files(Path(entry.path), suffixes)
+        elif entry.name.endswith(suffixes) and entry.is_file():
+            yield Path(entry.path)
+
+
+@lru_cache(maxsize=128)
+def _parse_toml_bytes(data: bytes) -> dict:
+    import tomllib
+
+    return tomllib.loads(data.decode("utf-8"))
+
+
+@lru_cache(maxsize=128)
+def _parse_yaml_text(text: str) -> dict:
+    return parse_yaml(text) or {}
+
+
+def _read_toml_cached(path: Path) -> dict:
+    """Parse a TOML file, reusing the parsed result while its contents are unchanged.
+
+    The cache is keyed on the file's bytes, so repeated reads of an unchanged `pyproject.toml`
+    skip the parse while any edit on disk is picked up. A deep copy is returned so callers are
+    free to mutate the result.
+    """
+    return copy.deepcopy(_parse_toml_bytes(path.read_bytes()))
+
+
+def _read_yaml_cached(path: Path) -> dict:
+    """Parse a YAML file, reusing the parsed result while its contents are unchanged.
+
+    Works like `_read_toml_cached()`; an empty document yields an empty dict.
+    """
+    return copy.deepcopy(_parse_yaml_text(path.read_text()))
+
+
+@lru_cache(maxsize=256)
+def _extract_dunder_all(source: str) -> tuple[str, ...] | None:
+    """Extract the string entries of a list-literal `__all__` from module source.
+
+    Results are cached on the source text, so re-parsing an unchanged `__init__.py` is free.
+    Returns `None` when no `__all__` list assignment is present.
+    """
+    # Most modules without `__all__` can be answered without parsing at all
+    if "__all__" not in source:
+        return None
+
+    import ast
+
+    tree = ast.parse(source)
+
+    all_exports = None
+
+    # Only statements can assign `__all__`, so walk the module body and the bodies of compound
+    # statements (`if`, `try`, ...) without descending into expressions, functions, or classes
+    stack = list(reversed(tree.body))
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                # Extract __all__
+                if isinstance(target, ast.Name) and target.id == "__all__":
+                    if isinstance(node.value, ast.List):
+                        all_exports = []
+                        for elt in node.value.elts:
+                            if isinstance(elt, ast.Constant) and isinstance(elt.value, str):
+                                all_exports.append(elt.value)
+        elif not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            for field in ("finalbody", "orelse", "handlers", "cases", "body"):
+                stack.extend(reversed(getattr(node, field, None) or []))
+
+    return tuple(all_exports) if all_exports is not None else None
+
+
+def _content_hasher():
+    """Return a fresh 128-bit hasher for cache keys (not for anything security-sensitive).
+
+    Uses `xxhash.xxh3_128` when the optional `xxhash` package is installed, since it hashes
+    source trees several times faster; otherwise falls back to `hashlib.blake2b`. Both expose
+    `update()` and a 32-character `hexdigest()`.
+    """
+    try:
+        import xxhash
+    except ImportError:
+        import hashlib
+
+        return hashlib.blake2b(digest_size=16)
+    return xxhash.xxh3_128()
+
+
+def _installed_distributions_signature() -> bytes:
+    """Return the sorted `name==version` of every installed distribution, for use in cache keys.
+
+    Results that come from introspecting a package also depend on its environment: the installed
+    griffe and the package's own dependencies. Keying on this signature makes any install,
+    upgrade or removal produce a new key.
+    """
+    from importlib.metadata import distributions
+
+    entries = sorted({f"{dist.metadata['Name']}=={dist.version}" for dist in distributions()})
+    return "\n".join(entries).encode()
+
+
+def _griffe_source_fingerprint(filepath) -> tuple:
+    """Summarize the on-disk state of a griffe-loaded module as `(path, mtime_ns, size)` entries.
+
+    `filepath` is a griffe object's `filepath`: a single file for modules and regular packages
+    (their `__init__.py`) or a list of directories for namespace packages. For packages, every
+    `.py`/`.pyi` file below the package directory is included.
+    """
+    paths = filepath if isinstance(filepath, list) else [filepath]
+    entries = []
+    for path in paths:
+        path = Path(path)
+        root = path.parent if path.stem == "__init__" else path
+        files = _scandir_files(root, (".py", ".pyi")) if root.is_dir() else [root]
+        for file in files:
+            try:
+                st = file.stat()
+            except OSError:
+                continue
+            entries.append((str(file), st.st_mtime_ns, st.st_size))
+    return tuple(sorted(entries))
+
+
+# Docstring style markers, combined so each docstring is scanned once:
+# - numpy: section headers followed by dashes (e.g., "Parameters\n----------")
+# - google: section headers with colons (e.g., "Args:", "Returns:")
+# - sphinx: field markers (e.g., ":param name:", ":returns:")
+_DOCSTRING_STYLE_RE = re.compile(
+    r"(?P<numpy>^\s*(?:Parameters|Returns|Yields|Raises|Examples|Attributes|Methods|See Also"
+    r"|Notes|References|Warnings)\s*\n\s*-{3,})"
+    r"|(?P<google>^\s*(?:Args|Arguments|Returns|Yields|Raises|Examples|Attributes|Note|Notes"
+    r"|Todo|Warning|Warnings):\s*$)"
+    r"|(?P<sphinx>^\s*:(?:param|type|returns|rtype|raises|var|ivar|cvar)\s)",
+    re.MULTILINE,
+)
+
+# Inline global flag groups such as "(?i)" or "(?x)" (scoped "(?i:...)" groups don't match)
+_INLINE_GLOBAL_FLAGS_RE = re.compile(r"\(\?[aiLmsux]+\)")
+
+# Upper bound on the griffe packages each `GreatDocs` instance keeps loaded
+_GRIFFE_CACHE_MAXSIZE = 16
+
+
+# Directories never treated as the documented package when auto-discovering one
+_INIT_PRUNE_DIRS = frozenset(
+    {
+        "tests",
+        "test",
+        "docs",
+        "doc",
+        "examples",
+        "scripts",
+        "build",
+        "dist",
+        "__pycache__",
+        "venv",
+        ".venv",
+        "node_modules",
+        "site-packages",
+    }
+)
+
+# Link-checker patterns, compiled once rather than on every `check_links()` call.
+# URL regex pattern - matches http and https URLs
+_URL_RE = re.compile(
+    r'https?://[^\s<>"\')\]}`\\]+',
+    re.IGNORECASE,
+)
+
+# Pattern to detect URLs marked with {.gd-no-link} in .qmd files
+# This allows marking example/fake links for exclusion: http://example.com{.gd-no-link}
+# Also handles URLs in inline code: `http://example.com`{.gd-no-link}
+_GD_NO_LINK_RE = re.compile(
+    r'`?(https?://[^\s<>"\')\]}`\\{]+)`?\{\.gd-no-link\}',
+    re.IGNORECASE,
+)
+
+_FENCED_CODE_RE = re.compile(r"```[^`]*```", re.DOTALL)
+_INLINE_CODE_RE = re.compile(r"`[^`]+`")
+
+# Maximum number of concurrent link-check workers (file reads and HTTP requests)
+_LINK_CHECK_WORKERS = 16
+
+# Maximum number of concurrent file copies when staging assets and user guide pages
+_COPY_WORKERS = 8
+
+
 class GreatDocs:
     """
     GreatDocs class for creating beautiful API documentation sites.
@@ -134,6 +342,28 @@ class GreatDocs:
         # Whether API reference was successfully configured (set during build)
         self._has_api_reference = True
 
+        # Located package __init__.py files, keyed by package name
+        self._package_init_cache: dict[str, Path] = {}
+
+        # Number of `_categorize_api_objects_fallback()` runs, so degraded results aren't cached
+        self._categorize_fallback_calls = 0
+
+        # Loaded griffe packages keyed on (module name, search paths), each stored with the source
+        # fingerprint it was loaded from so edits to the package invalidate the entry
+        self._griffe_cache: dict[tuple, tuple[tuple, object]] = {}
+
+        # Detected docstring style per package, stored with the griffe package it was derived from
+        self._docstring_style_cache: dict[str, tuple[object, str]] = {}
+
+        # Last `_get_package_metadata()` result as (source file contents, metadata, config)
+        self._metadata_cache: tuple | None = None
+
+        # Quarto interpreter and PYTHONPATH entries as (package root, python path, dirs)
+        self._quarto_env_cache: tuple[Path, str, list[str]] | None = None
+
+        # Last auto-discovered user guide as ((source dir, file fingerprints), user guide info)
+        self._user_guide_cache: tuple | None = None
+
         # Set environment variables needed by the qrenderer
         _, _, url = self._get_github_repo_info()
         if url:
@@ -334,16 +564,57 @@ class GreatDocs:
 
         dest_assets = self.project_path / "assets"
 
-        # Remove existing assets directory to ensure clean copy
-        if dest_assets.exists():
-            shutil.rmtree(dest_assets)
+        # Build the new tree next to the old one and swap it in afterwards, so an interrupted
+        # copy never leaves a half-populated assets directory behind
+        staging_assets = dest_assets.with_name("assets.new")
+        if staging_assets.exists():
+            shutil.rmtree(staging_assets)  # pragma: no cover
+
+        from concurrent.futures import ThreadPoolExecutor
 
-        # Copy entire assets directory
-        shutil.copytree(source_assets, dest_assets)
+        # Copy the entire assets tree: the walk creates the directories while the file copies
+        # (which release the GIL) run on a thread pool; the futures also give the file count.
+        # Directory metadata is applied only once every copy has finished, since writing into a
+        # directory changes its mtime
+        copies = []
+        directories = []
+        try:
+            with ThreadPoolExecutor(max_workers=_COPY_WORKERS) as pool:
+                pending = [(source_assets, staging_assets)]
+                while pending:
+                    src_dir, dst_dir = pending.pop()
+                    dst_dir.mkdir(parents=True)
+                    directories.append((src_dir, dst_dir))
+                    with os.scandir(src_dir) as it:
+                        for entry in it:
+                            if entry.is_dir():
+                                pending.append((Path(entry.path), dst_dir / entry.name))
+                            else:
+                                copies.append(
+                                    pool.submit(shutil.copy2, entry.path, dst_dir / entry.name)
+                                )
+                for future in copies:
+                    future.result()
+
+            for src_dir, dst_dir in reversed(directories):
+                shutil.copystat(src_dir, dst_dir)
+        except BaseException:
+            # Leaving the `with` block waited for any copies still running, so nothing writes
+            # into the staging tree any more
+            shutil.rmtree(staging_assets, ignore_errors=True)
+            raise
+
+        # Swap the fresh copy in with renames, then remove the previous tree
+        old_assets = dest_assets.with_name("assets.old")
+        if old_assets.exists():
+            shutil.rmtree(old_assets)  # pragma: no cover
+        if dest_assets.exists():
+            os.replace(dest_assets, old_assets)
+        os.replace(staging_assets, dest_assets)
+        if old_assets.exists():
+            shutil.rmtree(old_assets)
 
-        # Count files for reporting
-        file_count = sum(1 for _ in dest_assets.rglob("*") if _.is_file())
-        print(f"\n📦 Copied {file_count} asset file(s) to great-docs/assets/")
+        print(f"\n📦 Copied {len(copies)} asset file(s) to great-docs/assets/")
 
         return True
 
@@ -458,6 +729,13 @@ class GreatDocs:
         """
         print("Initializing great-docs...")
 
+        # Package layout may have changed since this instance last looked
+        self._package_init_cache.clear()
+        self._griffe_cache.clear()
+        self._metadata_cache = None
+        self._quarto_env_cache = None
+        self._user_guide_cache = None
+
         # Generate great-docs.yml with discovered exports
         self._generate_initial_config(force=force)
 
@@ -579,16 +857,13 @@ class GreatDocs:
         # Look for pyproject.toml
         pyproject_path = self.project_root / "pyproject.toml"
         if pyproject_path.exists():
-            import tomllib
-
-            with open(pyproject_path, "rb") as f:
-                try:
-                    data = tomllib.load(f)
-                    name = data.get("project", {}).get("name")
-                    if name:
-                        return name
-                except Exception:
-                    pass
+            try:
+                data = _read_toml_cached(pyproject_path)
+                name = data.get("project", {}).get("name")
+                if name:
+                    return name
+            except Exception:
+                pass
 
         # Look for setup.cfg
         setup_cfg = self.project_root / "setup.cfg"
@@ -957,11 +1232,8 @@ class GreatDocs:
         # Check pyproject.toml for explicit package configuration
         pyproject_path = package_root / "pyproject.toml"
         if pyproject_path.exists():
-            import tomllib
-
             try:
-                with open(pyproject_path, "rb") as f:
-                    data = tomllib.load(f)
+                data = _read_toml_cached(pyproject_path)
 
                 # Check [tool.maturin] for PyO3/Rust projects
                 maturin = data.get("tool", {}).get("maturin", {})
@@ -1134,6 +1406,41 @@ class GreatDocs:
                 extra.append(candidate)
         return extra + sys.path
 
+    def _load_griffe_package(self, normalized_name: str, search_paths: list[str | Path]):
+        """Load a package with `griffe.load()`, reusing it while its sources are unchanged.
+
+        Several steps of a build (export discovery, docstring-style detection, categorization,
+        directive extraction, source links) inspect the same package; loading it once saves
+        walking and parsing the whole tree for each of them. The cache belongs to this instance, so
+        state griffe resolves on a package never leaks into another `GreatDocs`. Loader errors
+        propagate to the caller and are never cached.
+        """
+        import griffe
+
+        key = (normalized_name, tuple(str(p) for p in search_paths))
+        cached = self._griffe_cache.get(key)
+        if cached is not None:
+            fingerprint, pkg = cached
+            if _griffe_source_fingerprint(pkg.filepath) == fingerprint:
+                return pkg
+
+        pkg = griffe.load(normalized_name, search_paths=search_paths)
+
+        try:
+            fingerprint = _griffe_source_fingerprint(pkg.filepath)
+        except (AttributeError, TypeError):
+            fingerprint = ()
+
+        if not fingerprint:
+            # Not backed by files we can stat, so there is nothing to validate a cache entry against
+            self._griffe_cache.pop(key, None)
+            return pkg
+
+        if key not in self._griffe_cache and len(self._griffe_cache) >= _GRIFFE_CACHE_MAXSIZE:
+            self._griffe_cache.pop(next(iter(self._griffe_cache)))
+        self._griffe_cache[key] = (fingerprint, pkg)
+        return pkg
+
     def _get_quarto_env(self) -> dict[str, str]:
         """
         Get environment variables for running Quarto commands.
@@ -1155,11 +1462,43 @@ class GreatDocs:
         dict[str, str]
             Environment variables dictionary with QUARTO_PYTHON and PYTHONPATH set.
         """
-        import sys
-
-        env = os.environ.copy()
         package_root = self._find_package_root()
 
+        # The interpreter and layout probes only depend on the package root, so run them once
+        cached = self._quarto_env_cache
+        if cached is not None and cached[0] == package_root:
+            _, python_path, pythonpath_dirs = cached
+        else:
+            python_path, pythonpath_dirs = self._probe_quarto_python(package_root)
+            self._quarto_env_cache = (package_root, python_path, pythonpath_dirs)
+
+        new_pythonpath = os.pathsep.join(pythonpath_dirs)
+        existing_pythonpath = os.environ.get("PYTHONPATH", "")
+        if existing_pythonpath:
+            # Prepend our paths to existing PYTHONPATH
+            new_pythonpath = f"{new_pythonpath}{os.pathsep}{existing_pythonpath}"
+
+        # Build the environment in one pass rather than copying os.environ and then updating it
+        return {**os.environ, "QUARTO_PYTHON": python_path, "PYTHONPATH": new_pythonpath}
+
+    @staticmethod
+    def _probe_quarto_python(package_root: Path) -> tuple[str, list[str]]:
+        """
+        Find the Python interpreter and PYTHONPATH entries Quarto should use for a package.
+
+        Parameters
+        ----------
+        package_root
+            The package root directory.
+
+        Returns
+        -------
+        tuple[str, list[str]]
+            The interpreter path (a project virtual environment if one exists, otherwise the
+            running interpreter) and the directories to prepend to PYTHONPATH.
+        """
+        import sys
+
         # Look for a virtual environment in the project
         venv_paths = [
             package_root / ".venv" / "bin" / "python",  # Unix
@@ -1178,8 +1517,6 @@ class GreatDocs:
         if python_path is None:
             python_path = sys.executable
 
-        env["QUARTO_PYTHON"] = python_path
-
         # Add package root to PYTHONPATH so griffe can find the package
         # even if it's not installed (e.g., during development)
         pythonpath_dirs = [str(package_root)]
@@ -1194,15 +1531,7 @@ class GreatDocs:
         if python_dir.exists() and python_dir.is_dir():
             pythonpath_dirs.append(str(python_dir))
 
-        existing_pythonpath = env.get("PYTHONPATH", "")
-        new_pythonpath = os.pathsep.join(pythonpath_dirs)
-        if existing_pythonpath:
-            # Prepend our paths to existing PYTHONPATH
-            env["PYTHONPATH"] = f"{new_pythonpath}{os.pathsep}{existing_pythonpath}"
-        else:
-            env["PYTHONPATH"] = new_pythonpath
-
-        return env
+        return python_path, pythonpath_dirs
 
     def _get_package_metadata(self) -> dict:
         """
@@ -1211,72 +1540,105 @@ class GreatDocs:
         Reads project metadata (license, authors, URLs, etc.) from pyproject.toml
         and Great Docs configuration from great-docs.yml.
 
+        The result is reused for as long as the contents of `pyproject.toml`, `setup.cfg`, and
+        `great-docs.yml` are unchanged, so the many call sites during a build don't each reload
+        the configuration.
+
         Returns
         -------
         dict
             Dictionary containing package metadata and great-docs configuration.
         """
-        metadata = {}
         package_root = self._find_package_root()
+
+        key: list = [package_root]
+        for name in ("pyproject.toml", "setup.cfg", "great-docs.yml"):
+            try:
+                key.append((package_root / name).read_bytes())
+            except OSError:
+                key.append(None)
+        key = tuple(key)
+
+        # Only the metadata dict is cached: a hit leaves `self._config` as it is, so runtime
+        # overrides of (or replacements for) the configuration are kept
+        if self._metadata_cache is not None and self._metadata_cache[0] == key:
+            return copy.deepcopy(self._metadata_cache[1])
+
+        metadata = self._read_package_metadata(package_root)
+        self._metadata_cache = (key, copy.deepcopy(metadata))
+        return metadata
+
+    def _read_package_metadata(self, package_root: Path) -> dict:
+        """
+        Build the package metadata dict (uncached); also reloads `self._config`.
+
+        Parameters
+        ----------
+        package_root
+            The package root directory (see `_find_package_root()`).
+
+        Returns
+        -------
+        dict
+            Dictionary containing package metadata and great-docs configuration.
+        """
+        metadata = {}
         pyproject_path = package_root / "pyproject.toml"
 
         # Read project metadata from pyproject.toml
         if pyproject_path.exists():
-            import tomllib
-
             try:
-                with open(pyproject_path, "rb") as f:
-                    data = tomllib.load(f)
-                    project = data.get("project", {})
-
-                    # Extract relevant fields from [project] section
-                    # License can be a string (PEP 639) or a dict with "text"/"file" keys
-                    license_val = project.get("license", "")
-                    classifiers = project.get("classifiers", [])
-
-                    # Try to extract license identifier from classifiers first
-                    # e.g., "License :: OSI Approved :: MIT License" -> "MIT"
-                    license_from_classifiers = ""
-                    for classifier in classifiers:
-                        if classifier.startswith("License :: OSI Approved ::"):
-                            # Extract the license name from the classifier
-                            license_name = classifier.split("::")[-1].strip()
-                            # Map common patterns to SPDX identifiers
-                            license_map = {
-                                "MIT License": "MIT",
-                                "Apache Software License": "Apache-2.0",
-                                "GNU General Public License v3 (GPLv3)": "GPL-3.0",
-                                "GNU General Public License v2 (GPLv2)": "GPL-2.0",
-                                "BSD License": "BSD-3-Clause",
-                                "ISC License (ISCL)": "ISC",
-                                "Mozilla Public License 2.0 (MPL 2.0)": "MPL-2.0",
-                            }
-                            license_from_classifiers = license_map.get(license_name, license_name)
-                            break
+                data = _read_toml_cached(pyproject_path)
+                project = data.get("project", {})
 
-                    # Determine the license identifier
-                    if license_from_classifiers:
-                        # Prefer classifier-derived license (cleaner identifier)
-                        metadata["license"] = license_from_classifiers
-                    elif isinstance(license_val, dict):
-                        # If it's a dict with "text", use that; if "file", we need
-                        # to fall back to classifiers or leave as-is
-                        text_val = license_val.get("text", "")
-                        if text_val:
-                            metadata["license"] = text_val
-                        else:
-                            # File reference - not useful for JSON-LD, leave empty
-                            # unless we have a better source
-                            metadata["license"] = ""
+                # Extract relevant fields from [project] section
+                # License can be a string (PEP 639) or a dict with "text"/"file" keys
+                license_val = project.get("license", "")
+                classifiers = project.get("classifiers", [])
+
+                # Try to extract license identifier from classifiers first
+                # e.g., "License :: OSI Approved :: MIT License" -> "MIT"
+                license_from_classifiers = ""
+                for classifier in classifiers:
+                    if classifier.startswith("License :: OSI Approved ::"):
+                        # Extract the license name from the classifier
+                        license_name = classifier.split("::")[-1].strip()
+                        # Map common patterns to SPDX identifiers
+                        license_map = {
+                            "MIT License": "MIT",
+                            "Apache Software License": "Apache-2.0",
+                            "GNU General Public License v3 (GPLv3)": "GPL-3.0",
+                            "GNU General Public License v2 (GPLv2)": "GPL-2.0",
+                            "BSD License": "BSD-3-Clause",
+                            "ISC License (ISCL)": "ISC",
+                            "Mozilla Public License 2.0 (MPL 2.0)": "MPL-2.0",
+                        }
+                        license_from_classifiers = license_map.get(license_name, license_name)
+                        break
+
+                # Determine the license identifier
+                if license_from_classifiers:
+                    # Prefer classifier-derived license (cleaner identifier)
+                    metadata["license"] = license_from_classifiers
+                elif isinstance(license_val, dict):
+                    # If it's a dict with "text", use that; if "file", we need
+                    # to fall back to classifiers or leave as-is
+                    text_val = license_val.get("text", "")
+                    if text_val:
+                        metadata["license"] = text_val
                     else:
-                        metadata["license"] = str(license_val) if license_val else ""
-                    metadata["authors"] = project.get("authors", [])
-                    metadata["maintainers"] = project.get("maintainers", [])
-                    metadata["urls"] = project.get("urls", {})
-                    metadata["requires_python"] = project.get("requires-python", "")
-                    metadata["keywords"] = project.get("keywords", [])
-                    metadata["description"] = project.get("description", "")
-                    metadata["optional_dependencies"] = project.get("optional-dependencies", {})
+                        # File reference - not useful for JSON-LD, leave empty
+                        # unless we have a better source
+                        metadata["license"] = ""
+                else:
+                    metadata["license"] = str(license_val) if license_val else ""
+                metadata["authors"] = project.get("authors", [])
+                metadata["maintainers"] = project.get("maintainers", [])
+                metadata["urls"] = project.get("urls", {})
+                metadata["requires_python"] = project.get("requires-python", "")
+                metadata["keywords"] = project.get("keywords", [])
+                metadata["description"] = project.get("description", "")
+                metadata["optional_dependencies"] = project.get("optional-dependencies", {})
 
             except Exception:
                 pass
@@ -2188,10 +2550,8 @@ class GreatDocs:
         if not quarto_yml.is_file():
             return
 
-        import yaml
-
         with open(quarto_yml, encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+            config = read_yaml(f) or {}
 
         if "format" not in config or "html" not in config.get("format", {}):
             return  # pragma: no cover
@@ -2229,7 +2589,7 @@ class GreatDocs:
             entries.append(inline_entry)  # pragma: no cover
 
         with open(quarto_yml, "w", encoding="utf-8") as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+            write_yaml(config, f)
 
     @staticmethod
     def _tag_slug(tag_name: str) -> str:
@@ -2415,10 +2775,8 @@ class GreatDocs:
         if not quarto_yml.is_file():
             return
 
-        import yaml
-
         with open(quarto_yml, encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+            config = read_yaml(f) or {}
 
         if "format" not in config or "html" not in config.get("format", {}):
             return  # pragma: no cover
@@ -2454,7 +2812,7 @@ class GreatDocs:
             entries.append(inline_entry)
 
         with open(quarto_yml, "w", encoding="utf-8") as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+            write_yaml(config, f)
 
     def _process_page_statuses(self) -> bool:
         """
@@ -3643,11 +4001,8 @@ class GreatDocs:
         if not pyproject_path.exists():
             return None
 
-        import tomllib
-
         try:
-            with open(pyproject_path, "rb") as f:
-                data = tomllib.load(f)
+            data = _read_toml_cached(pyproject_path)
 
             # Look for [project.scripts]
             scripts = data.get("project", {}).get("scripts", {})
@@ -4142,20 +4497,19 @@ class GreatDocs:
         guide_files = []
         valid_extensions = {".qmd", ".md"}
         # Check if directory is completely empty
-        dir_contents = list(user_guide_dir.iterdir())
+        with os.scandir(user_guide_dir) as it:
+            dir_contents = list(it)
         if not dir_contents:
             print(f"   ⚠️  User guide directory '{user_guide_dir}' is empty")
             return None
 
-        for item in dir_contents:
-            if item.is_file() and item.suffix in valid_extensions:
-                guide_files.append(item)
-            elif item.is_dir():
+        # Directory entries carry their file type, so no extra stat() is needed per item
+        for entry in dir_contents:
+            if entry.is_file() and os.path.splitext(entry.name)[1] in valid_extensions:
+                guide_files.append(Path(entry.path))
+            elif entry.is_dir():
                 # Recursively check subdirectories for guide files at any depth
-                for ext in valid_extensions:
-                    for subitem in item.rglob(f"*{ext}"):
-                        if subitem.is_file():
-                            guide_files.append(subitem)
+                guide_files.extend(_scandir_files(Path(entry.path), (".qmd", ".md")))
 
         if not guide_files:
             print(f"   ⚠️  User guide directory '{user_guide_dir}' contains no .qmd or .md files")
@@ -4171,6 +4525,18 @@ class GreatDocs:
             )
         )
 
+        # Reuse the previous result while the same guide files are present and unchanged
+        fingerprint = []
+        for guide_file in guide_files:
+            try:
+                st = guide_file.stat()
+            except OSError:  # pragma: no cover
+                continue  # pragma: no cover
+            fingerprint.append((str(guide_file), st.st_mtime_ns, st.st_size))
+        cache_key = (user_guide_dir, tuple(fingerprint))
+        if self._user_guide_cache is not None and self._user_guide_cache[0] == cache_key:
+            return copy.deepcopy(self._user_guide_cache[1])
+
         # Parse each file to extract section and title from frontmatter
         files_info = []
         sections: dict[str, list] = {}
@@ -4195,13 +4561,15 @@ class GreatDocs:
         if not files_info:
             return None  # pragma: no cover
 
-        return {
+        user_guide_info = {
             "files": files_info,
             "sections": sections,
             "has_index": has_index,
             "source_dir": user_guide_dir,
             "explicit": False,
         }
+        self._user_guide_cache = (cache_key, copy.deepcopy(user_guide_info))
+        return user_guide_info
 
     def _parse_user_guide_file(self, qmd_path: Path) -> dict | None:
         """
@@ -4223,13 +4591,14 @@ class GreatDocs:
         except Exception:
             return None
 
-        # Extract YAML frontmatter
+        # Extract YAML frontmatter, slicing out just the fenced block rather than splitting
+        # (and copying) the whole page body
         frontmatter = {}
         if content.startswith("---"):
-            parts = content.split("---", 2)
-            if len(parts) >= 3:
+            end = content.find("---", 3)
+            if end != -1:
                 try:
-                    frontmatter = parse_yaml(parts[1]) or {}
+                    frontmatter = parse_yaml(content[3:end]) or {}
                 except ValueError:  # pragma: no cover
                     pass  # pragma: no cover
 
@@ -4239,7 +4608,7 @@ class GreatDocs:
             # Derive title from filename: "01-getting-started.qmd" -> "Getting Started"
             name = qmd_path.stem
             # Remove leading number prefix like "01-" or "00_"
-            name = re.sub(r"^\d+[-_]", "", name)
+            name = self._strip_numeric_prefix(name)
             # Convert to title case
             title = name.replace("-", " ").replace("_", " ").title()
 
@@ -4274,10 +4643,12 @@ class GreatDocs:
         str
             The filename with numeric prefix stripped, or unchanged if no prefix.
         """
-        # Pattern matches: digits followed by a hyphen or underscore at the start
+        # Strip leading digits followed by a hyphen or underscore
         # e.g., "00-", "01-", "1-", "0001-", "00_", etc.
-        pattern = r"^\d+-|^\d+_"
-        return re.sub(pattern, "", filename)
+        rest = filename.lstrip("0123456789")
+        if rest != filename and rest[:1] in ("-", "_"):
+            return rest[1:]
+        return filename
 
     def _copy_user_guide_to_docs(self, user_guide_info: dict) -> list[str]:
         """
@@ -4308,6 +4679,8 @@ class GreatDocs:
 
         is_explicit = user_guide_info.get("explicit", False)
         copied_files = []
+        copy_jobs: list[tuple[Path, Path]] = []
+        made_dirs = {target_dir}
 
         for file_info in user_guide_info["files"]:
             src_path = file_info["path"]
@@ -4328,7 +4701,15 @@ class GreatDocs:
                 dest_rel_path = Path(*clean_parts) if clean_parts else rel_path
 
             dst_path = target_dir / dest_rel_path
-            dst_path.parent.mkdir(parents=True, exist_ok=True)
+            if dst_path.parent not in made_dirs:
+                dst_path.parent.mkdir(parents=True, exist_ok=True)
+                made_dirs.add(dst_path.parent)
+
+            copy_jobs.append((src_path, dst_path))
+            copied_files.append(f"user-guide/{dest_rel_path}")
+
+        def _copy_page(job: tuple[Path, Path]) -> None:
+            src_path, dst_path = job
 
             # Read the source file and modify frontmatter
             with open(src_path, "r", encoding="utf-8") as f:
@@ -4341,7 +4722,13 @@ class GreatDocs:
             with open(dst_path, "w", encoding="utf-8") as f:
                 f.write(content)
 
-            copied_files.append(f"user-guide/{dest_rel_path}")
+        # Directories exist now, so the pages can be copied concurrently
+        if copy_jobs:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(_COPY_WORKERS, len(copy_jobs))) as pool:
+                # Consume the results so a failed copy raises here
+                list(pool.map(_copy_page, copy_jobs))
 
         # Also copy any asset directories (directories without .qmd files)
         for item in source_dir.iterdir():
@@ -4451,6 +4838,27 @@ class GreatDocs:
         source_dir = user_guide_info["source_dir"]
         contents = []
 
+        # Sidebar entry for one config item, or None when it should be skipped
+        def get_entry(item) -> str | dict | None:
+            if isinstance(item, str):
+                filename = item
+                custom_text = None
+            elif isinstance(item, dict):
+                filename = item.get("href", "")
+                custom_text = item.get("text")
+            else:
+                return None  # pragma: no cover
+
+            if not filename:
+                return None  # pragma: no cover
+
+            # Verify the file exists in the source directory
+            if not (source_dir / filename).exists():
+                return None
+
+            href = f"user-guide/{filename}"
+            return {"text": custom_text, "href": href} if custom_text else href
+
         for section_entry in explicit_config:
             section_name = section_entry.get("section", "")
             section_contents = section_entry.get("contents", [])
@@ -4458,32 +4866,9 @@ class GreatDocs:
             if not section_name or not section_contents:
                 continue  # pragma: no cover
 
-            sidebar_section_contents = []
-
-            for item in section_contents:
-                if isinstance(item, str):
-                    filename = item
-                    custom_text = None
-                elif isinstance(item, dict):
-                    filename = item.get("href", "")
-                    custom_text = item.get("text")
-                else:
-                    continue  # pragma: no cover
-
-                if not filename:
-                    continue  # pragma: no cover
-
-                # Verify the file exists in the source directory
-                file_path = source_dir / filename
-                if not file_path.exists():
-                    continue
-
-                href = f"user-guide/{filename}"
-
-                if custom_text:
-                    sidebar_section_contents.append({"text": custom_text, "href": href})
-                else:
-                    sidebar_section_contents.append(href)
+            sidebar_section_contents = [
+                entry for entry in map(get_entry, section_contents) if entry is not None
+            ]
 
             if sidebar_section_contents:
                 contents.append(
@@ -4531,9 +4916,6 @@ class GreatDocs:
 
         # If we have sections, organize by section
         if sections:
-            # Track which files have been assigned to sections
-            assigned_files = set()
-
             # First, preserve section order based on first file appearance
             section_order = []
             for file_info in files_info:
@@ -4541,41 +4923,35 @@ class GreatDocs:
                 if section and section not in section_order:
                     section_order.append(section)
 
-            # Build section entries
-            for section_name in section_order:
-                section_files = sections[section_name]
-                section_contents = []
+            # Use custom text for index.qmd if it has a title
+            def get_entry(file_info: dict) -> str | dict:
+                href = get_clean_href(file_info)
+                if file_info["path"].name == "index.qmd":
+                    return {"text": file_info["title"], "href": href}
+                return href
 
-                for file_info in section_files:
-                    href = get_clean_href(file_info)
-                    assigned_files.add(file_info["path"])
-
-                    # Use custom text for index.qmd if it has a title
-                    if file_info["path"].name == "index.qmd":
-                        section_contents.append(
-                            {
-                                "text": file_info["title"],
-                                "href": href,
-                            }
-                        )
-                    else:
-                        section_contents.append(href)
+            # Build section entries
+            contents = [
+                {
+                    "section": section_name,
+                    "contents": [get_entry(file_info) for file_info in sections[section_name]],
+                }
+                for section_name in section_order
+            ]
 
-                contents.append(
-                    {
-                        "section": section_name,
-                        "contents": section_contents,
-                    }
-                )
+            # Track which files have been assigned to sections
+            assigned_files = {
+                file_info["path"]
+                for section_name in section_order
+                for file_info in sections[section_name]
+            }
 
             # Add any files without sections at the end
-            unsectioned = []
-            for file_info in files_info:
-                if file_info["path"] not in assigned_files:
-                    unsectioned.append(get_clean_href(file_info))
-
-            if unsectioned:
-                contents.extend(unsectioned)
+            contents.extend(
+                get_clean_href(file_info)
+                for file_info in files_info
+                if file_info["path"] not in assigned_files
+            )
 
         else:
             # Check if files span multiple subdirectories — if so, group by
@@ -4926,15 +5302,13 @@ class GreatDocs:
             Dictionary with file path and line numbers, or None if not found.
         """
         try:
-            import griffe
-
             _patch_griffe()
 
             normalized_name = package_name.replace("-", "_")
 
             # Load the package with griffe
             try:
-                pkg = griffe.load(normalized_name, search_paths=self._griffe_search_paths())
+                pkg = self._load_griffe_package(normalized_name, self._griffe_search_paths())
             except Exception:
                 return None
 
@@ -5167,6 +5541,8 @@ class GreatDocs:
 
         This handles packages with non-standard structures like Rust bindings
         that may have their Python code in subdirectories like python/, src/, etc.
+        A successful lookup is remembered for the lifetime of the instance (as long
+        as the file still exists), so repeated calls skip the directory probing.
 
         Parameters
         ----------
@@ -5178,6 +5554,17 @@ class GreatDocs:
         Path | None
             Path to the __init__.py file, or None if not found.
         """
+        cached = self._package_init_cache.get(package_name)
+        if cached is not None and cached.exists():
+            return cached
+
+        init_file = self._locate_package_init(package_name)
+        if init_file is not None:
+            self._package_init_cache[package_name] = init_file
+        return init_file
+
+    def _locate_package_init(self, package_name: str) -> Path | None:
+        """Search the project for a package's __init__.py (uncached)."""
         # Normalize package name (replace dashes with underscores)
         normalized_name = package_name.replace("-", "_")
 
@@ -5187,11 +5574,8 @@ class GreatDocs:
         explicit_packages = []
 
         if pyproject_path.exists():
-            import tomllib
-
             try:
-                with open(pyproject_path, "rb") as f:
-                    data = tomllib.load(f)
+                data = _read_toml_cached(pyproject_path)
 
                 # Check [tool.setuptools.packages] for explicit package list
                 setuptools = data.get("tool", {}).get("setuptools", {})
@@ -5266,29 +5650,27 @@ class GreatDocs:
             ]
         )
 
-        # First pass: look for __init__.py with __version__ or __all__
-        for package_dir in search_paths:
-            if not package_dir.exists() or not package_dir.is_dir():
-                continue
-
+        # Candidate __init__.py files, each checked with a single stat (a missing package
+        # directory makes `is_file()` false as well)
+        candidates = []
+        for package_dir in dict.fromkeys(search_paths):
             init_file = package_dir / "__init__.py"
-            if init_file.exists():
-                try:
-                    with open(init_file, "r", encoding="utf-8") as f:
-                        content = f.read()
-                        if "__version__" in content or "__all__" in content:
-                            return init_file
-                except Exception:  # pragma: no cover
-                    continue
+            if init_file.is_file():
+                candidates.append(init_file)
 
-        # Second pass: accept any __init__.py in a matching directory
-        for package_dir in search_paths:
-            if not package_dir.exists() or not package_dir.is_dir():
+        # First pass: look for __init__.py with __version__ or __all__
+        for init_file in candidates:
+            try:
+                with open(init_file, "r", encoding="utf-8") as f:
+                    content = f.read()
+                    if "__version__" in content or "__all__" in content:
+                        return init_file
+            except Exception:  # pragma: no cover
                 continue
 
-            init_file = package_dir / "__init__.py"
-            if init_file.exists():
-                return init_file
+        # Second pass: accept any __init__.py in a matching directory
+        if candidates:
+            return candidates[0]
 
         # Third pass: auto-discover any Python package in common locations
         # This handles cases where the package name doesn't match the project name
@@ -5300,29 +5682,18 @@ class GreatDocs:
         ]
 
         for base_dir in auto_discover_dirs:
-            if not base_dir.exists():
+            try:
+                with os.scandir(base_dir) as it:
+                    entries = list(it)
+            except OSError:
                 continue
-            for item in base_dir.iterdir():
-                if not item.is_dir():
-                    continue
+            for entry in entries:
                 # Skip common non-package directories
-                if item.name.startswith((".", "_")) or item.name in (
-                    "tests",
-                    "test",
-                    "docs",
-                    "doc",
-                    "examples",
-                    "scripts",
-                    "build",
-                    "dist",
-                    "__pycache__",
-                    "venv",
-                    ".venv",
-                    "node_modules",
-                    "site-packages",
-                ):
+                if entry.name.startswith((".", "_")) or entry.name in _INIT_PRUNE_DIRS:
                     continue
-                init_file = item / "__init__.py"
+                if not entry.is_dir():
+                    continue
+                init_file = Path(entry.path) / "__init__.py"
                 if init_file.exists():
                     return init_file
 
@@ -5369,23 +5740,9 @@ class GreatDocs:
             with open(init_file, "r", encoding="utf-8") as f:
                 content = f.read()
 
-            # Try to extract __all__ using AST (safer than eval)
-            import ast
-
-            tree = ast.parse(content)
-
-            all_exports = None
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Assign):
-                    for target in node.targets:
-                        # Extract __all__
-                        if isinstance(target, ast.Name) and target.id == "__all__":
-                            if isinstance(node.value, ast.List):
-                                all_exports = []
-                                for elt in node.value.elts:
-                                    if isinstance(elt, ast.Constant) and isinstance(elt.value, str):
-                                        all_exports.append(elt.value)
+            # Extract __all__ using AST (safer than eval); cached on the source text
+            parsed = _extract_dunder_all(content)
+            all_exports = list(parsed) if parsed is not None else None
 
             if all_exports:
                 print(f"Successfully parsed __all__ with {len(all_exports)} exports")
@@ -5471,7 +5828,7 @@ class GreatDocs:
 
             # Load the package using griffe
             try:
-                pkg = griffe.load(normalized_name, search_paths=griffe_search_paths)
+                pkg = self._load_griffe_package(normalized_name, griffe_search_paths)
             except Exception as e:
                 print(f"Warning: Could not load package with griffe ({type(e).__name__})")
                 if package_name != normalized_name:
@@ -5697,8 +6054,6 @@ class GreatDocs:
             Defaults to "numpy" if detection is inconclusive.
         """
         try:
-            import griffe
-
             _patch_griffe()
 
             # Normalize package name
@@ -5706,116 +6061,122 @@ class GreatDocs:
 
             # Load the package using griffe
             try:
-                pkg = griffe.load(normalized_name, search_paths=self._griffe_search_paths())
+                pkg = self._load_griffe_package(normalized_name, self._griffe_search_paths())
             except Exception as e:
                 print(
                     f"Warning: Could not load package for docstring detection ({type(e).__name__})"
                 )
                 return "numpy"
 
-            # Collect docstrings from the package
-            docstrings = []
+            # Reuse the previous verdict while griffe hands back the same (unchanged) package
+            cached = self._docstring_style_cache.get(normalized_name)
+            if cached is not None and cached[0] is pkg:
+                return cached[1]
 
-            def collect_docstrings(obj, depth=0):
-                """Recursively collect docstrings from an object and its members."""
-                if depth > 2:  # Limit recursion depth
-                    return  # pragma: no cover
+            style = self._docstring_style_of(pkg)
+            self._docstring_style_cache[normalized_name] = (pkg, style)
+            return style
 
-                # Get the object's docstring
-                if hasattr(obj, "docstring") and obj.docstring:
-                    docstrings.append(obj.docstring.value)
+        except ImportError:  # pragma: no cover
+            print("Warning: griffe not available for docstring detection, defaulting to numpy")
+            return "numpy"
+        except Exception as e:  # pragma: no cover
+            print(f"Error detecting docstring style: {type(e).__name__}: {e}")
+            return "numpy"
 
-                # Recurse into members
-                if hasattr(obj, "members"):
-                    for member in obj.members.values():
-                        try:
-                            # Skip aliases to avoid infinite loops
-                            if hasattr(member, "is_alias") and member.is_alias:
-                                continue  # pragma: no cover
-                            collect_docstrings(member, depth + 1)
-                        except Exception:  # pragma: no cover
-                            continue
+    def _docstring_style_of(self, pkg) -> str:
+        """
+        Classify the docstring style of a griffe-loaded package.
 
-            collect_docstrings(pkg)
+        Parameters
+        ----------
+        pkg
+            The package object returned by griffe.
 
-            if not docstrings:
-                print("No docstrings found, defaulting to numpy style")
-                return "numpy"
+        Returns
+        -------
+        str
+            The detected docstring style: "numpy", "google", or "sphinx".
+        """
+        # Collect docstrings from the package
+        docstrings = []
 
-            # Analyze docstrings for style indicators
-            numpy_indicators = 0
-            google_indicators = 0
-            sphinx_indicators = 0
+        def collect_docstrings(obj, depth=0):
+            """Recursively collect docstrings from an object and its members."""
+            if depth > 2:  # Limit recursion depth
+                return  # pragma: no cover
 
-            # Patterns for detection
-            # NumPy: section headers followed by dashes (e.g., "Parameters\n----------")
-            numpy_section_pattern = re.compile(
-                r"^\s*(Parameters|Returns|Yields|Raises|Examples|Attributes|Methods|See Also|Notes|References|Warnings)\s*\n\s*-{3,}",
-                re.MULTILINE,
-            )
+            # Get the object's docstring
+            if hasattr(obj, "docstring") and obj.docstring:
+                docstrings.append(obj.docstring.value)
 
-            # Google: section headers with colons (e.g., "Args:", "Returns:")
-            google_section_pattern = re.compile(
-                r"^\s*(Args|Arguments|Returns|Yields|Raises|Examples|Attributes|Note|Notes|Todo|Warning|Warnings):\s*$",
-                re.MULTILINE,
-            )
+            # Recurse into members
+            if hasattr(obj, "members"):
+                for member in obj.members.values():
+                    try:
+                        # Skip aliases to avoid infinite loops
+                        if hasattr(member, "is_alias") and member.is_alias:
+                            continue  # pragma: no cover
+                        collect_docstrings(member, depth + 1)
+                    except Exception:  # pragma: no cover
+                        continue
 
-            # Sphinx: field markers (e.g., ":param name:", ":returns:")
-            sphinx_pattern = re.compile(
-                r"^\s*:(param|type|returns|rtype|raises|var|ivar|cvar)\s",
-                re.MULTILINE,
-            )
+        collect_docstrings(pkg)
 
-            # Example blocks with >>> are common in both NumPy and Google styles
-            # but the presence/absence of --- is the key differentiator
+        if not docstrings:
+            print("No docstrings found, defaulting to numpy style")
+            return "numpy"
 
-            for docstring in docstrings:
-                if not docstring:
-                    continue  # pragma: no cover
+        # Analyze docstrings for style indicators
+        numpy_indicators = 0
+        google_indicators = 0
+        sphinx_indicators = 0
 
-                # Check for NumPy style (section + dashes)
-                if numpy_section_pattern.search(docstring):
-                    numpy_indicators += 1
+        # Example blocks with >>> are common in both NumPy and Google styles
+        # but the presence/absence of --- is the key differentiator
 
-                # Check for Google style (section headers with colons, no dashes)
-                if google_section_pattern.search(docstring):
-                    # Only count as Google if there are NO numpy-style dashes nearby
-                    if not numpy_section_pattern.search(docstring):
-                        google_indicators += 1
+        for docstring in docstrings:
+            if not docstring:
+                continue  # pragma: no cover
 
-                # Check for Sphinx style
-                if sphinx_pattern.search(docstring):
-                    sphinx_indicators += 1
+            # One scan collects every style marker present in this docstring
+            found = {m.lastgroup for m in _DOCSTRING_STYLE_RE.finditer(docstring)}
 
-            # Determine the winner
-            total_indicators = numpy_indicators + google_indicators + sphinx_indicators
+            # Check for NumPy style (section + dashes)
+            if "numpy" in found:
+                numpy_indicators += 1
 
-            if total_indicators == 0:
-                print("No clear docstring style detected, defaulting to numpy")
-                return "numpy"
+            # Check for Google style (section headers with colons), but only count it
+            # if there are NO numpy-style dashes nearby
+            elif "google" in found:
+                google_indicators += 1
 
-            # Report findings
-            print(
-                f"Docstring style detection: numpy={numpy_indicators}, "
-                f"google={google_indicators}, sphinx={sphinx_indicators}"
-            )
+            # Check for Sphinx style
+            if "sphinx" in found:
+                sphinx_indicators += 1
 
-            # Return the style with most indicators
-            if sphinx_indicators > numpy_indicators and sphinx_indicators > google_indicators:
-                print("Detected sphinx docstring style")
-                return "sphinx"
-            elif google_indicators > numpy_indicators:
-                print("Detected google docstring style")
-                return "google"
-            else:
-                print("Detected numpy docstring style")
-                return "numpy"
+        # Determine the winner
+        total_indicators = numpy_indicators + google_indicators + sphinx_indicators
 
-        except ImportError:  # pragma: no cover
-            print("Warning: griffe not available for docstring detection, defaulting to numpy")
+        if total_indicators == 0:
+            print("No clear docstring style detected, defaulting to numpy")
             return "numpy"
-        except Exception as e:  # pragma: no cover
-            print(f"Error detecting docstring style: {type(e).__name__}: {e}")
+
+        # Report findings
+        print(
+            f"Docstring style detection: numpy={numpy_indicators}, "
+            f"google={google_indicators}, sphinx={sphinx_indicators}"
+        )
+
+        # Return the style with most indicators
+        if sphinx_indicators > numpy_indicators and sphinx_indicators > google_indicators:
+            print("Detected sphinx docstring style")
+            return "sphinx"
+        elif google_indicators > numpy_indicators:
+            print("Detected google docstring style")
+            return "google"
+        else:
+            print("Detected numpy docstring style")
             return "numpy"
 
     def _detect_dynamic_mode(self, package_name: str) -> bool:
@@ -5854,7 +6215,7 @@ class GreatDocs:
 
         # Get a sample of exports to test
         try:
-            pkg = griffe.load(normalized_name, search_paths=self._griffe_search_paths())
+            pkg = self._load_griffe_package(normalized_name, self._griffe_search_paths())
             exports = [
                 name
                 for name in list(pkg.members.keys())[:10]  # Test first 10
@@ -6333,7 +6694,7 @@ class GreatDocs:
 
             # Try to load the package with griffe
             try:
-                pkg = griffe.load(normalized_name, search_paths=self._griffe_search_paths())
+                pkg = self._load_griffe_package(normalized_name, self._griffe_search_paths())
             except Exception as e:
                 print(f"Warning: Could not load package with griffe ({type(e).__name__})")
                 # Fallback: use importlib + inspect to categorize exports
@@ -6805,6 +7166,8 @@ class GreatDocs:
         """
         import inspect
 
+        self._categorize_fallback_calls += 1
+
         skip_names = {"__version__", "__author__", "__email__", "__all__"}
         filtered_exports = [e for e in exports if e not in skip_names]
         categories = self._empty_categories()
@@ -6881,6 +7244,117 @@ class GreatDocs:
 
         return categories
 
+    def _api_categories_cache_path(self, package_name: str, exports: list) -> Path | None:
+        """
+        Get the on-disk cache file for a package's categorized exports.
+
+        The file name embeds a digest of the great-docs and Python versions, every installed
+        distribution and its version (covering griffe and the package's dependencies), the
+        package name, the export list, the path and contents of every `.py`/`.pyi` file in the
+        package directory, and the path, size and modification time of every compiled extension
+        module (`.so`/`.pyd`) there. Any source edit, rebuilt extension or environment change
+        therefore maps to a new file and a stale entry is never read.
+
+        Parameters
+        ----------
+        package_name
+            The name of the package.
+        exports
+            List of exported names to categorize.
+
+        Returns
+        -------
+        Path | None
+            The cache file path, or `None` if the package sources could not be located.
+        """
+        import sys
+
+        from . import __version__
+
+        init_file = self._find_package_init(package_name)
+        if init_file is None:
+            return None
+
+        package_dir = init_file.parent
+        digest = _content_hasher()
+        digest.update(f"{__version__}\0{sys.version}\0{package_name}\0".encode())
+        digest.update(json.dumps(list(exports)).encode())
+        try:
+            for source in sorted(_scandir_files(package_dir, (".py", ".pyi"))):
+                digest.update(str(source.relative_to(package_dir)).encode() + b"\0")
+                digest.update(source.read_bytes())
+            # Extension modules can be large binaries, so they are keyed on their stat instead
+            for extension in sorted(_scandir_files(package_dir, (".so", ".pyd"))):
+                st = extension.stat()
+                rel_path = extension.relative_to(package_dir)
+                digest.update(f"{rel_path}\0{st.st_size}\0{st.st_mtime_ns}\0".encode())
+        except OSError:
+            return None
+        digest.update(_installed_distributions_signature())
+
+        normalized_name = package_name.replace("-", "_")
+        return (
+            self.project_root
+            / ".great-docs-cache"
+            / "api"
+            / f"{normalized_name}-{digest.hexdigest()}.json"
+        )
+
+    def _categorize_api_objects_cached(self, package_name: str, exports: list) -> dict:
+        """
+        Categorize API objects, reusing the result from a previous build if sources are unchanged.
+
+        Results of `_categorize_api_objects()` are stored as JSON under `.great-docs-cache/api/`
+        (see `_api_categories_cache_path()`), which saves loading and introspecting the package
+        again on rebuilds. The messages printed while categorizing are stored alongside and
+        replayed on a cache hit. Results from the importlib fallback (used when griffe can't load
+        the package) depend on what happens to be importable, and are never stored; neither are
+        results that can't be serialized.
+
+        Parameters
+        ----------
+        package_name
+            The name of the package.
+        exports
+            List of exported names from __all__.
+
+        Returns
+        -------
+        dict
+            The same dictionary `_categorize_api_objects()` returns.
+        """
+        cache_file = self._api_categories_cache_path(package_name, exports)
+
+        if cache_file is not None and cache_file.exists():
+            try:
+                cached = json.loads(cache_file.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                cached = None
+            if (
+                isinstance(cached, dict)
+                and isinstance(cached.get("categories"), dict)
+                and isinstance(cached.get("messages"), str)
+            ):
+                print(cached["messages"], end="")
+                return cached["categories"]
+
+        # Capture the warnings printed while categorizing so a cache hit can replay them
+        fallback_calls = self._categorize_fallback_calls
+        messages = io.StringIO()
+        with contextlib.redirect_stdout(messages):
+            categories = self._categorize_api_objects(package_name, exports)
+        print(messages.getvalue(), end="")
+
+        if cache_file is not None and self._categorize_fallback_calls == fallback_calls:
+            try:
+                payload = json.dumps({"categories": categories, "messages": messages.getvalue()})
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(payload, encoding="utf-8")
+            except (OSError, TypeError, ValueError):
+                pass
+
+        return categories
+
     def _create_api_sections(self, package_name: str) -> list | None:
         """
         Create API reference sections based on discovered package exports.
@@ -6916,7 +7390,7 @@ class GreatDocs:
         print(f"Found {len(exports)} exported names to document")
 
         # Categorize the exports
-        categories = self._categorize_api_objects(package_name, exports)
+        categories = self._categorize_api_objects_cached(package_name, exports)
 
         sections = []
 
@@ -7108,7 +7582,7 @@ class GreatDocs:
             normalized_name = package_name.replace("-", "_")
 
             try:
-                pkg = griffe.load(normalized_name, search_paths=self._griffe_search_paths())
+                pkg = self._load_griffe_package(normalized_name, self._griffe_search_paths())
             except Exception as e:
                 print(f"Warning: Could not load package with griffe ({type(e).__name__})")
                 return {}
@@ -7215,38 +7689,11 @@ class GreatDocs:
             if not contents_config:
                 continue
 
-            section_contents = []
-
-            for item in contents_config:
-                if isinstance(item, str):
-                    # Simple string reference - use as-is
-                    section_contents.append(item)
-                elif isinstance(item, dict):
-                    # Dict with name and optional members config
-                    name = item.get("name", "")
-                    if not name:
-                        continue
-
-                    members = item.get("members", True)
-                    include_inherited = item.get("include_inherited", None)
-
-                    if members is False:
-                        # Don't document methods - just the class
-                        section_contents.append({"name": name, "members": []})
-                    elif isinstance(members, list):
-                        # Explicit member list — pass through directly
-                        entry: dict = {"name": name, "members": members}
-                        if include_inherited is not None:
-                            entry["include_inherited"] = include_inherited
-                        section_contents.append(entry)
-                    else:
-                        # Default: inline documentation (members: true)
-                        if include_inherited is not None:
-                            section_contents.append(
-                                {"name": name, "include_inherited": include_inherited}
-                            )
-                        else:
-                            section_contents.append(name)
+            section_contents = [
+                entry
+                for entry in map(self._normalize_reference_entry, contents_config)
+                if entry is not None
+            ]
 
             if section_contents:
                 sections.append(
@@ -7259,6 +7706,51 @@ class GreatDocs:
 
         return sections if sections else None
 
+    @staticmethod
+    def _normalize_reference_entry(item) -> str | dict | None:
+        """
+        Normalize one `contents` entry of a reference section for the renderer.
+
+        Parameters
+        ----------
+        item
+            A string reference, or a dict with `name` and optional `members` and
+            `include_inherited` keys.
+
+        Returns
+        -------
+        str | dict | None
+            The entry to place in the section's contents, or `None` if it should be skipped.
+        """
+        if isinstance(item, str):
+            # Simple string reference - use as-is
+            return item
+        if not isinstance(item, dict):
+            return None
+
+        # Dict with name and optional members config
+        name = item.get("name", "")
+        if not name:
+            return None
+
+        members = item.get("members", True)
+        include_inherited = item.get("include_inherited", None)
+
+        if members is False:
+            # Don't document methods - just the class
+            return {"name": name, "members": []}
+        if isinstance(members, list):
+            # Explicit member list — pass through directly
+            entry: dict = {"name": name, "members": members}
+            if include_inherited is not None:
+                entry["include_inherited"] = include_inherited
+            return entry
+
+        # Default: inline documentation (members: true)
+        if include_inherited is not None:
+            return {"name": name, "include_inherited": include_inherited}
+        return name
+
     def _create_api_sections_from_config(self, package_name: str) -> list | None:
         """
         Create API reference sections from the `reference` config in great-docs.yml.
@@ -7290,7 +7782,7 @@ class GreatDocs:
             exports = []
 
         # Categorize exports to get class method info
-        categories = self._categorize_api_objects(package_name, exports)
+        categories = self._categorize_api_objects_cached(package_name, exports)
 
         # Build a mapping of module names → their expanded member names across
         # all categories.  When a user lists a bare module name (e.g. "parser")
@@ -7531,44 +8023,28 @@ class GreatDocs:
             return []
 
         try:
-            import tomllib
-
-            with open(pyproject_path, "rb") as f:
-                data = tomllib.load(f)
-                project = data.get("project", {})
-
-            authors_list = project.get("authors", [])
-            maintainers_list = project.get("maintainers", [])
-
-            # Track seen names to avoid duplicates
-            seen_names: set[str] = set()
-            result: list[dict[str, str]] = []
-
-            # Process maintainers first (they get "Maintainer" role)
-            for maintainer in maintainers_list:
-                if isinstance(maintainer, dict):
-                    name = maintainer.get("name", "")
-                    email = maintainer.get("email", "")
-                    if name and name not in seen_names:
-                        seen_names.add(name)
-                        author_entry: dict[str, str] = {"name": name, "role": "Maintainer"}
-                        if email:
-                            author_entry["email"] = email
-                        result.append(author_entry)
-
-            # Process authors (they get "Author" role, unless already added as maintainer)
-            for author in authors_list:
-                if isinstance(author, dict):
-                    name = author.get("name", "")
-                    email = author.get("email", "")
-                    if name and name not in seen_names:
-                        seen_names.add(name)
-                        author_entry = {"name": name, "role": "Author"}
-                        if email:
-                            author_entry["email"] = email
-                        result.append(author_entry)
+            data = _read_toml_cached(pyproject_path)
+            project = data.get("project", {})
+
+            # One entry per name; maintainers go first so their role wins over "Author"
+            by_name: dict[str, dict[str, str]] = {}
+            for role, people in (
+                ("Maintainer", project.get("maintainers", [])),
+                ("Author", project.get("authors", [])),
+            ):
+                for person in people:
+                    if not isinstance(person, dict):
+                        continue
+                    name = person.get("name", "")
+                    if not name or name in by_name:
+                        continue
+                    author_entry: dict[str, str] = {"name": name, "role": role}
+                    email = person.get("email", "")
+                    if email:
+                        author_entry["email"] = email
+                    by_name[name] = author_entry
 
-            return result
+            return list(by_name.values())
 
         except Exception:  # pragma: no cover
             return []  # pragma: no cover
@@ -9688,9 +10164,24 @@ body-classes: "gd-homepage"
             "# Generated by Great Docs - Do not modify this file by hand.\n"
             "# Configure settings in great-docs.yml instead.\n\n"
         )
-        with open(quarto_yml, "w") as f:
-            f.write(header_comment)
-            write_yaml(config, f)
+        buffer = io.StringIO()
+        buffer.write(header_comment)
+        write_yaml(config, buffer)
+        content = buffer.getvalue()
+
+        # Leave the file (and its mtime) alone when the configuration is unchanged
+        try:
+            if quarto_yml.read_text() == content:
+                return
+        except (OSError, ValueError):
+            pass
+
+        # Write to a sibling file and rename it over the target, so Quarto (or an interrupted
+        # build) never sees a partially written _quarto.yml
+        tmp_path = quarto_yml.with_name(quarto_yml.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            f.write(content)
+        os.replace(tmp_path, quarto_yml)
 
     def _translate_navbar_labels(self, config: dict) -> None:
         """
@@ -11301,8 +11792,7 @@ body-classes: "gd-homepage"
         if not quarto_yml.exists():
             return
 
-        with open(quarto_yml, "r") as f:
-            config = read_yaml(f) or {}
+        config = _read_yaml_cached(quarto_yml)
 
         # Get API reference sections and package info
         if "api-reference" not in config:
@@ -12618,6 +13108,12 @@ body-classes: "gd-homepage"
         """
         print("Uninstalling great-docs from your project...")
 
+        self._package_init_cache.clear()
+        self._griffe_cache.clear()
+        self._metadata_cache = None
+        self._quarto_env_cache = None
+        self._user_guide_cache = None
+
         # Remove the great-docs.yml configuration file
         config_path = self.project_root / "great-docs.yml"
         if config_path.exists():
@@ -13661,16 +14157,7 @@ body-classes: "gd-homepage"
             return ""
 
         try:
-            import tomllib
-        except ImportError:  # pragma: no cover
-            try:
-                import tomli as tomllib  # type: ignore[no-redef]
-            except ImportError:
-                return ""
-
-        try:
-            with open(pyproject, "rb") as f:
-                data = tomllib.load(f)
+            data = _read_toml_cached(pyproject)
         except Exception:
             return ""
 
@@ -13896,21 +14383,9 @@ body-classes: "gd-homepage"
         )
         ```
         """
-        import requests
-
-        # URL regex pattern - matches http and https URLs
-        url_pattern = re.compile(
-            r'https?://[^\s<>"\')\]}`\\]+',
-            re.IGNORECASE,
-        )
+        from concurrent.futures import ThreadPoolExecutor
 
-        # Pattern to detect URLs marked with {.gd-no-link} in .qmd files
-        # This allows marking example/fake links for exclusion: http://example.com{.gd-no-link}
-        # Also handles URLs in inline code: `http://example.com`{.gd-no-link}
-        gd_no_link_pattern = re.compile(
-            r'`?(https?://[^\s<>"\')\]}`\\{]+)`?\{\.gd-no-link\}',
-            re.IGNORECASE,
-        )
+        import requests
 
         # Compile ignore patterns
         ignore_regexes = []
@@ -13922,6 +14397,27 @@ body-classes: "gd-homepage"
                     # Treat as literal string if not valid regex
                     ignore_regexes.append(re.compile(re.escape(pattern), re.IGNORECASE))
 
+            # Fold group-free patterns into one alternation so each URL needs a single search.
+            # Patterns with groups (whose numbers and backreferences would shift) or inline global
+            # flags (which would apply to the whole alternation) keep their own regex
+            default_flags = re.compile("", re.IGNORECASE).flags
+            foldable = [
+                r
+                for r in ignore_regexes
+                if r.groups == 0
+                and r.flags == default_flags
+                and not _INLINE_GLOBAL_FLAGS_RE.search(r.pattern)
+            ]
+            if len(foldable) > 1:
+                try:
+                    combined = re.compile(
+                        "|".join(f"(?:{r.pattern})" for r in foldable), re.IGNORECASE
+                    )
+                except re.error:  # pragma: no cover
+                    pass
+                else:
+                    ignore_regexes = [combined] + [r for r in ignore_regexes if r not in foldable]
+
         # Collect all files to scan
         files_to_scan: list[Path] = []
 
@@ -13931,7 +14427,7 @@ body-classes: "gd-homepage"
             if package_name:
                 package_dir = self.project_root / package_name.replace("-", "_")
                 if package_dir.exists():
-                    files_to_scan.extend(package_dir.rglob("*.py"))
+                    files_to_scan.extend(_scandir_files(package_dir, (".py",)))
 
         if include_docs:
             # Scan documentation files
@@ -13941,12 +14437,12 @@ body-classes: "gd-homepage"
             user_guide_dir = self.project_root / "user_guide"
             if user_guide_dir.exists():
                 # Scan user_guide source directory instead of generated docs/
-                files_to_scan.extend(user_guide_dir.rglob("*.qmd"))
-                files_to_scan.extend(user_guide_dir.rglob("*.md"))
+                files_to_scan.extend(_scandir_files(user_guide_dir, (".qmd", ".md")))
             elif self.project_path.exists():  # pragma: no cover
                 # No user_guide/, scan docs directory directly
-                files_to_scan.extend(self.project_path.rglob("*.qmd"))  # pragma: no cover
-                files_to_scan.extend(self.project_path.rglob("*.md"))  # pragma: no cover
+                files_to_scan.extend(
+                    _scandir_files(self.project_path, (".qmd", ".md"))
+                )  # pragma: no cover
 
             # Also check README in project root
             readme = self.project_root / "README.md"
@@ -13957,23 +14453,34 @@ body-classes: "gd-homepage"
         url_to_files: dict[str, list[str]] = {}
         by_file: dict[str, list[str]] = {}
 
-        for file_path in files_to_scan:
+        def _read(path: Path) -> tuple[str | None, Exception | None]:
+            try:
+                return path.read_text(encoding="utf-8", errors="ignore"), None
+            except Exception as e:  # pragma: no cover
+                return None, e
+
+        # Read files on a thread pool (file reads release the GIL); parsing stays sequential
+        with ThreadPoolExecutor(max_workers=_LINK_CHECK_WORKERS) as pool:
+            file_contents = list(pool.map(_read, files_to_scan))
+
+        for file_path, (content, read_error) in zip(files_to_scan, file_contents):
             try:
-                content = file_path.read_text(encoding="utf-8", errors="ignore")
+                if read_error is not None:
+                    raise read_error  # pragma: no cover
 
                 # For .qmd and .md files, find URLs marked with {.gd-no-link} and exclude them
                 # Also strip code blocks to avoid checking example URLs
                 excluded_urls: set[str] = set()
                 if file_path.suffix in (".qmd", ".md"):
-                    for match in gd_no_link_pattern.finditer(content):
+                    for match in _GD_NO_LINK_RE.finditer(content):
                         excluded_urls.add(match.group(1))
 
                     # Remove fenced code blocks (``` ... ```) before URL extraction
                     # This prevents example URLs in code blocks from being checked
-                    content = re.sub(r"```[^`]*```", "", content, flags=re.DOTALL)
+                    content = _FENCED_CODE_RE.sub("", content)
 
                     # Also remove inline code (`...`) to avoid example URLs
-                    content = re.sub(r"`[^`]+`", "", content)
+                    content = _INLINE_CODE_RE.sub("", content)
 
                 # For Python files, exclude URLs in comments (lines starting with #)
                 # This prevents example URLs in code comments from being checked
@@ -13994,7 +14501,7 @@ body-classes: "gd-homepage"
                             non_comment_lines.append(line)
                     content = "\n".join(non_comment_lines)
 
-                urls = url_pattern.findall(content)
+                urls = _URL_RE.findall(content)
 
                 # Clean URLs (remove trailing punctuation)
                 cleaned_urls = []
@@ -14039,6 +14546,29 @@ body-classes: "gd-homepage"
         if verbose:
             print(f"\n🔍 Found {len(url_to_files)} unique URLs to check\n")
 
+        def _probe(url: str):
+            # Use HEAD request first (faster), fall back to GET if needed
+            response = requests.head(
+                url,
+                timeout=timeout,
+                allow_redirects=False,
+                headers={"User-Agent": "great-docs-link-checker/1.0"},
+            )
+
+            # Some servers don't support HEAD, try GET
+            if response.status_code == 405:
+                response = requests.get(
+                    url,
+                    timeout=timeout,
+                    allow_redirects=False,
+                    headers={"User-Agent": "great-docs-link-checker/1.0"},
+                    stream=True,  # Don't download body
+                )
+                response.close()
+
+            return response
+
+        urls_to_check: list[str] = []
         for url in url_to_files:
             # Check if URL matches any ignore pattern
             should_skip = False
@@ -14053,100 +14583,91 @@ body-classes: "gd-homepage"
                     print(f"⏭️  Skipped: {url}")
                 continue
 
-            try:
-                # Use HEAD request first (faster), fall back to GET if needed
-                response = requests.head(
-                    url,
-                    timeout=timeout,
-                    allow_redirects=False,
-                    headers={"User-Agent": "great-docs-link-checker/1.0"},
-                )
+            urls_to_check.append(url)
 
-                # Some servers don't support HEAD, try GET
-                if response.status_code == 405:
-                    response = requests.get(
-                        url,
-                        timeout=timeout,
-                        allow_redirects=False,
-                        headers={"User-Agent": "great-docs-link-checker/1.0"},
-                        stream=True,  # Don't download body
-                    )
-                    response.close()
+        # Requests are I/O-bound, so issue them concurrently; results are still
+        # collected in discovery order so the report is deterministic
+        workers = max(1, min(_LINK_CHECK_WORKERS, len(urls_to_check)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending = [(url, pool.submit(_probe, url)) for url in urls_to_check]
 
-                status = response.status_code
+            for url, future in pending:
+                try:
+                    response = future.result()
+                    status = response.status_code
+
+                    if 200 <= status < 300:
+                        results["ok"].append(url)
+                        if verbose:
+                            print(f"✅ {status} {url}")
+                    elif 300 <= status < 400:  # pragma: no cover
+                        location = response.headers.get("Location", "Unknown")
+                        results["redirects"].append(
+                            {
+                                "url": url,
+                                "status": status,
+                                "location": location,
+                                "files": url_to_files[url],
+                            }
+                        )
+                        if verbose:
+                            print(f"↪️  {status} {url} -> {location}")
+                    else:  # pragma: no cover
+                        results["broken"].append(
+                            {
+                                "url": url,
+                                "status": status,
+                                "error": f"HTTP {status}",
+                                "files": url_to_files[url],
+                            }
+                        )
+                        if verbose:
+                            print(f"❌ {status} {url}")
 
-                if 200 <= status < 300:
-                    results["ok"].append(url)
+                except requests.exceptions.Timeout:  # pragma: no cover
+                    results["broken"].append(
+                        {
+                            "url": url,
+                            "status": None,
+                            "error": "Timeout",
+                            "files": url_to_files[url],
+                        }
+                    )
                     if verbose:
-                        print(f"✅ {status} {url}")
-                elif 300 <= status < 400:  # pragma: no cover
-                    location = response.headers.get("Location", "Unknown")
-                    results["redirects"].append(
+                        print(f"⏱️  Timeout: {url}")
+                except requests.exceptions.SSLError as e:  # pragma: no cover
+                    results["broken"].append(
                         {
                             "url": url,
-                            "status": status,
-                            "location": location,
+                            "status": None,
+                            "error": f"SSL Error: {str(e)[:50]}",
                             "files": url_to_files[url],
                         }
                     )
                     if verbose:
-                        print(f"↪️  {status} {url} -> {location}")
-                else:  # pragma: no cover
+                        print(f"🔐 SSL Error: {url}")
+                except requests.exceptions.ConnectionError:  # pragma: no cover
                     results["broken"].append(
                         {
                             "url": url,
-                            "status": status,
-                            "error": f"HTTP {status}",
+                            "status": None,
+                            "error": "Connection failed",
                             "files": url_to_files[url],
                         }
                     )
                     if verbose:
-                        print(f"❌ {status} {url}")
-
-            except requests.exceptions.Timeout:  # pragma: no cover
-                results["broken"].append(
-                    {
-                        "url": url,
-                        "status": None,
-                        "error": "Timeout",
-                        "files": url_to_files[url],
-                    }
-                )
-                if verbose:
-                    print(f"⏱️  Timeout: {url}")
-            except requests.exceptions.SSLError as e:  # pragma: no cover
-                results["broken"].append(
-                    {
-                        "url": url,
-                        "status": None,
-                        "error": f"SSL Error: {str(e)[:50]}",
-                        "files": url_to_files[url],
-                    }
-                )
-                if verbose:
-                    print(f"🔐 SSL Error: {url}")
-            except requests.exceptions.ConnectionError:  # pragma: no cover
-                results["broken"].append(
-                    {
-                        "url": url,
-                        "status": None,
-                        "error": "Connection failed",
-                        "files": url_to_files[url],
-                    }
-                )
-                if verbose:
-                    print(f"🔌 Connection failed: {url}")
-            except Exception as e:  # pragma: no cover
-                results["broken"].append(
-                    {
-                        "url": url,
-                        "status": None,
-                        "error": str(e)[:100],
-                        "files": url_to_files[url],
-                    }
-                )
-                if verbose:
-                    print(f"⚠️  Error: {url} - {e}")
+                        print(f"🔌 Connection failed: {url}")
+                except Exception as e:  # pragma: no cover
+                    results["broken"].append(
+                        {
+                            "url": url,
+                            "status": None,
+                            "error": str(e)[:100],
+                            "files": url_to_files[url],
+                        }
+                    )
+                    if verbose:
+                        print(f"⚠️  Error: {url} - {e}")
 
         return results
 
@@ -9,7 +9,8 @@ package is as simple as dropping a new file into ``specs/``.
 from __future__ import annotations
 
 import importlib
-from typing import Any
+
+from .specs._types import Spec
 
 # ── Ordered list of all package names ─────────────────────────────────────────
 # The canonical ordering follows the numbering in SYNTHETIC_TEST_PLAN.md.
@@ -2122,11 +2123,15 @@ PACKAGE_DESCRIPTIONS: dict[str, str] = {
 
 
 # ── Spec access ──────────────────────────────────────────────────────────────
+# Spec modules (and the file payloads they embed) are imported only on the
+# first get_spec() call for that name. Callers that need just names, dimension
+# labels, or descriptions should use ALL_PACKAGES, DIMENSIONS, and
+# PACKAGE_DESCRIPTIONS, which never touch the payloads.
 
-_spec_cache: dict[str, dict[str, Any]] = {}
+_spec_cache: dict[str, Spec] = {}
 
 
-def get_spec(name: str) -> dict[str, Any]:
+def get_spec(name: str) -> Spec:
     """
     Load and return the spec dict for the given package name.
 
@@ -2148,7 +2153,7 @@ def get_spec(name: str) -> dict[str, Any]:
 
     # Import from specs sub-package
     mod = importlib.import_module(f".specs.{name}", package=__package__)
-    spec: dict[str, Any] = mod.SPEC  # type: ignore[attr-defined]
+    spec: Spec = mod.SPEC  # type: ignore[attr-defined]
 
     # Validate minimal required keys
     assert spec.get("name") == name, f"Spec 'name' must be {name!r}, got {spec.get('name')!r}"
@@ -2158,7 +2163,7 @@ def get_spec(name: str) -> dict[str, Any]:
     return spec
 
 
-def get_specs_by_dimension(dim_code: str) -> list[dict[str, Any]]:
+def get_specs_by_dimension(dim_code: str) -> list[Spec]:
     """
     Return all specs whose ``dimensions`` list contains *dim_code*.
 
@@ -2172,9 +2177,9 @@ def get_specs_by_dimension(dim_code: str) -> list[dict[str, Any]]:
     list[dict]
         Matched specs (loaded lazily).
     """
-    results: list[dict[str, Any]] = []
+    results: list[Spec] = []
     for name in ALL_PACKAGES:
         spec = get_spec(name)
-        if dim_code in spec.get("dimensions", []):
+        if dim_code in spec.get("dimensions", ()):
             results.append(spec)
     return results
@@ -9,14 +9,17 @@ minimal GDG test package.
 from __future__ import annotations
 
 import textwrap
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 
 from yaml12 import format_yaml
 
+from .specs._types import Spec
+
 
 def generate_package(
-    spec: dict[str, Any],
+    spec: Spec,
     target_dir: Path,
     config_override: Path | str | None = None,
 ) -> Path:
@@ -27,6 +30,8 @@ def generate_package(
     ----------
     spec
         Package specification dict. Must have at least ``"name"`` and ``"files"``.
+        The optional ``"pyproject_toml"`` entry may be a nested dict or a
+        pre-serialized TOML string (written verbatim after dedenting).
     target_dir
         Parent directory in which to create the package folder.
     config_override
@@ -57,9 +62,13 @@ def generate_package(
 
     # --- Arbitrary files -------------------------------------------------
     files: dict[str, str] = spec.get("files", {})
+    # Create each parent directory once rather than once per file
+    made_dirs: set[Path] = {pkg_dir}
     for rel_path, content in files.items():
         file_path = pkg_dir / rel_path
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        if file_path.parent not in made_dirs:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            made_dirs.add(file_path.parent)
         # Dedent the content to allow indented multi-line strings in specs
         file_path.write_text(textwrap.dedent(content), encoding="utf-8")
 
@@ -86,14 +95,19 @@ def generate_package(
 # ---------------------------------------------------------------------------
 
 
-def _write_pyproject_toml(pkg_dir: Path, data: dict[str, Any]) -> None:
-    """Produce a minimal pyproject.toml from a nested dict."""
+def _write_pyproject_toml(pkg_dir: Path, data: Mapping[str, Any] | str) -> None:
+    """Produce a minimal pyproject.toml from a nested dict or TOML text."""
+    if isinstance(data, str):
+        # Already serialized: skip the dict walk entirely
+        (pkg_dir / "pyproject.toml").write_text(textwrap.dedent(data), encoding="utf-8")
+        return
+
     lines: list[str] = []
     _toml_section(lines, data, prefix="")
     (pkg_dir / "pyproject.toml").write_text("\n".join(lines) + "\n", encoding="utf-8")
 
 
-def _toml_section(lines: list[str], data: dict[str, Any], prefix: str) -> None:
+def _toml_section(lines: list[str], data: Mapping[str, Any], prefix: str) -> None:
     """Recursively serialize a dict into TOML-ish text.
 
     Good enough for the simple structures we need (no arrays-of-tables, etc.).
@@ -102,7 +116,7 @@ def _toml_section(lines: list[str], data: dict[str, Any], prefix: str) -> None:
     tables: dict[str, Any] = {}
 
     for k, v in data.items():
-        if isinstance(v, dict):
+        if isinstance(v, Mapping):
             tables[k] = v
         else:
             scalars[k] = v
@@ -133,11 +147,11 @@ def _toml_value(v: Any) -> str:
         return "true" if v else "false"
     if isinstance(v, int | float):
         return str(v)
-    if isinstance(v, dict):
+    if isinstance(v, Mapping):
         # Inline table: {key = "value", ...}
         parts = [f"{k} = {_toml_value(val)}" for k, val in v.items()]
         return "{" + ", ".join(parts) + "}"
-    if isinstance(v, list):
+    if isinstance(v, list | tuple):
         inner = ", ".join(_toml_value(i) for i in v)
         return f"[{inner}]"
     return f'"{v}"'
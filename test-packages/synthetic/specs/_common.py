@@ -0,0 +1,124 @@
+"""
+Shared building blocks for GDG spec modules.
+
+Many specs repeat the same ``pyproject.toml``, ``__init__.py``, and ``.qmd``
+boilerplate.  The helpers here let a spec declare only what is unique to it
+while the common pieces are shared across every spec that uses them.
+"""
+
+from __future__ import annotations
+
+import textwrap
+from types import MappingProxyType
+from typing import Any, Mapping
+
+# ── pyproject.toml boilerplate ────────────────────────────────────────────────
+
+BUILD_SYSTEM_SETUPTOOLS: Mapping[str, Any] = MappingProxyType(
+    {
+        "requires": ("setuptools",),
+        "build-backend": "setuptools.build_meta",
+    }
+)
+
+SETUPTOOLS_SRC_LAYOUT: Mapping[str, Any] = MappingProxyType(
+    {"setuptools": MappingProxyType({"package-dir": MappingProxyType({"": "src"})})}
+)
+
+
+def make_pyproject(
+    name: str,
+    description: str,
+    *,
+    version: str = "0.1.0",
+    tool: Mapping[str, Any] | None = None,
+) -> dict[str, Any]:
+    """
+    Build a ``pyproject_toml`` spec entry for a setuptools-based package.
+
+    Parameters
+    ----------
+    name
+        The distribution (PyPI) name, e.g. ``"gdtest-src-no-all"``.
+    description
+        The one-line project description.
+    version
+        The project version.
+    tool
+        Optional ``[tool]`` table (e.g. :data:`SETUPTOOLS_SRC_LAYOUT`).
+
+    Returns
+    -------
+    dict
+        A nested dict suitable for the spec's ``"pyproject_toml"`` key.
+    """
+    data: dict[str, Any] = {
+        "project": {
+            "name": name,
+            "version": version,
+            "description": description,
+        },
+        "build-system": BUILD_SYSTEM_SETUPTOOLS,
+    }
+    if tool is not None:
+        data["tool"] = tool
+    return data
+
+
+# ── __init__.py boilerplate ───────────────────────────────────────────────────
+
+
+def init_py(docstring: str, exports: tuple[str, ...] | None, body: str) -> str:
+    """
+    Compose a package ``__init__.py`` from its docstring, exports, and body.
+
+    Every generated package starts with the same prologue (module docstring,
+    ``__version__``, and optionally ``__all__``), so specs declare only the
+    parts that differ.
+
+    Parameters
+    ----------
+    docstring
+        The one-line module docstring (without quotes).
+    exports
+        Names for ``__all__``, or ``None`` to omit ``__all__`` entirely.
+    body
+        The rest of the module; dedented before it is appended.
+
+    Returns
+    -------
+    str
+        The full ``__init__.py`` source.
+    """
+    header = f'"""{docstring}"""\n\n__version__ = "0.1.0"\n'
+    if exports is not None:
+        names = ", ".join(f'"{name}"' for name in exports)
+        header += f"__all__ = [{names}]\n"
+    return header + "\n\n" + textwrap.dedent(body)
+
+
+# ── .qmd front matter ─────────────────────────────────────────────────────────
+
+
+def qmd_page(title: str, body: str, *, guide_section: str | None = None) -> str:
+    """
+    Compose a user-guide ``.qmd`` page with a simple YAML front matter block.
+
+    Parameters
+    ----------
+    title
+        The page title.
+    body
+        The page content; dedented before it is appended.
+    guide_section
+        Optional ``guide-section`` value used to group pages in the sidebar.
+
+    Returns
+    -------
+    str
+        The full ``.qmd`` source.
+    """
+    header = f"---\ntitle: {title}\n"
+    if guide_section is not None:
+        header += f"guide-section: {guide_section}\n"
+    return header + "---\n\n" + textwrap.dedent(body)
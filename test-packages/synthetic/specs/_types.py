@@ -0,0 +1,38 @@
+"""
+Type declarations for GDG spec dicts.
+
+Specs stay plain dict literals so they remain easy to read and edit; these
+``TypedDict`` declarations only describe their shape for type checkers.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Mapping, Required, TypedDict
+
+
+class Expected(TypedDict, total=False):
+    """Expected outcomes for a spec (only the common keys are listed)."""
+
+    detected_name: str
+    detected_module: str
+    detected_parser: str
+    export_names: list[str] | tuple[str, ...]
+    num_exports: int
+    section_titles: list[str] | tuple[str, ...]
+    has_user_guide: bool
+    user_guide_files: list[str] | tuple[str, ...]
+    has_cli: bool
+
+
+class Spec(TypedDict, total=False):
+    """A GDG package specification."""
+
+    name: Required[str]
+    description: str
+    dimensions: list[str] | tuple[str, ...]
+    pyproject_toml: Mapping[str, Any] | str
+    setup_cfg: str
+    setup_py: str
+    files: Required[dict[str, str]]
+    config: dict[str, Any]
+    expected: Expected
@@ -6,33 +6,25 @@ Focus: Config-level export exclusion combined with CLI docs. Verifies
        excluded items don't appear while CLI section does.
 """
 
+from ._common import init_py, make_pyproject
+
 SPEC = {
     "name": "gdtest_exclude_cli",
     "description": "Config exclusion with CLI documentation",
-    "dimensions": ["A1", "B5", "C1", "D1", "E6", "F6", "G1", "H7"],
-    "pyproject_toml": {
-        "project": {
-            "name": "gdtest-exclude-cli",
-            "version": "0.1.0",
-            "description": "Test config exclusion with CLI docs",
-        },
-        "build-system": {
-            "requires": ["setuptools"],
-            "build-backend": "setuptools.build_meta",
-        },
-    },
+    "dimensions": ("A1", "B5", "C1", "D1", "E6", "F6", "G1", "H7"),
+    "pyproject_toml": make_pyproject(
+        "gdtest-exclude-cli",
+        "Test config exclusion with CLI docs",
+    ),
     "config": {
         "exclude": ["hidden_func"],
         "cli": {"enabled": True},
     },
     "files": {
-        "gdtest_exclude_cli/__init__.py": '''\
-            """Package with config exclusion and CLI."""
-
-            __version__ = "0.1.0"
-            __all__ = ["execute", "report", "hidden_func"]
-
-
+        "gdtest_exclude_cli/__init__.py": init_py(
+            "Package with config exclusion and CLI.",
+            ("execute", "report", "hidden_func"),
+            '''\
             def execute(task: str) -> dict:
                 """
                 Execute a task.
@@ -72,6 +64,7 @@ SPEC = {
                 """
                 pass
         ''',
+        ),
         "gdtest_exclude_cli/cli.py": '''\
             """CLI for gdtest_exclude_cli."""
 
@@ -111,7 +104,7 @@ SPEC = {
         "detected_name": "gdtest-exclude-cli",
         "detected_module": "gdtest_exclude_cli",
         "detected_parser": "numpy",
-        "export_names": ["execute", "report"],
+        "export_names": ("execute", "report"),
         "num_exports": 2,
         "section_titles": ["Functions"],
         "has_user_guide": False,
@@ -6,21 +6,16 @@ Focus: Explicit reference config that suppresses big-class method listing
        via members: false, verifying that the method section is absent.
 """
 
+from ._common import init_py, make_pyproject
+
 SPEC = {
     "name": "gdtest_explicit_big_class",
     "description": "Explicit reference with big class members suppressed",
-    "dimensions": ["A1", "B1", "C3", "D1", "E6", "F6", "G1", "H7"],
-    "pyproject_toml": {
-        "project": {
-            "name": "gdtest-explicit-big-class",
-            "version": "0.1.0",
-            "description": "Test explicit reference with big class members=false",
-        },
-        "build-system": {
-            "requires": ["setuptools"],
-            "build-backend": "setuptools.build_meta",
-        },
-    },
+    "dimensions": ("A1", "B1", "C3", "D1", "E6", "F6", "G1", "H7"),
+    "pyproject_toml": make_pyproject(
+        "gdtest-explicit-big-class",
+        "Test explicit reference with big class members=false",
+    ),
     "config": {
         "reference": [
             {
@@ -39,13 +34,10 @@ SPEC = {
         ],
     },
     "files": {
-        "gdtest_explicit_big_class/__init__.py": '''\
-            """Package with explicit reference and big class."""
-
-            __version__ = "0.1.0"
-            __all__ = ["BigEngine", "helper_a", "helper_b"]
-
-
+        "gdtest_explicit_big_class/__init__.py": init_py(
+            "Package with explicit reference and big class.",
+            ("BigEngine", "helper_a", "helper_b"),
+            '''\
             class BigEngine:
                 """
                 A complex engine with many methods.
@@ -151,6 +143,7 @@ SPEC = {
                 """
                 return x * 2
         ''',
+        ),
         "README.md": """\
             # gdtest-explicit-big-class
 
@@ -161,7 +154,7 @@ SPEC = {
         "detected_name": "gdtest-explicit-big-class",
         "detected_module": "gdtest_explicit_big_class",
         "detected_parser": "numpy",
-        "export_names": ["BigEngine", "helper_a", "helper_b"],
+        "export_names": ("BigEngine", "helper_a", "helper_b"),
         "num_exports": 3,
         "section_titles": ["Classes", "BigEngine Methods", "Functions"],
         "has_user_guide": False,
@@ -6,29 +6,21 @@ Focus: All four supporting pages (LICENSE, CITATION.cff, CONTRIBUTING.md,
        CODE_OF_CONDUCT.md) combined with a user guide.
 """
 
+from ._common import init_py, make_pyproject, qmd_page
+
 SPEC = {
     "name": "gdtest_extras_guide",
     "description": "Full extras (license, citation, etc.) plus user guide",
-    "dimensions": ["A1", "B1", "C1", "D1", "E6", "F1", "G1", "H1", "H2", "H3", "H4"],
-    "pyproject_toml": {
-        "project": {
-            "name": "gdtest-extras-guide",
-            "version": "0.1.0",
-            "description": "Test all extras with user guide",
-        },
-        "build-system": {
-            "requires": ["setuptools"],
-            "build-backend": "setuptools.build_meta",
-        },
-    },
+    "dimensions": ("A1", "B1", "C1", "D1", "E6", "F1", "G1", "H1", "H2", "H3", "H4"),
+    "pyproject_toml": make_pyproject(
+        "gdtest-extras-guide",
+        "Test all extras with user guide",
+    ),
     "files": {
-        "gdtest_extras_guide/__init__.py": '''\
-            """Package with full extras and user guide."""
-
-            __version__ = "0.1.0"
-            __all__ = ["start", "stop"]
-
-
+        "gdtest_extras_guide/__init__.py": init_py(
+            "Package with full extras and user guide.",
+            ("start", "stop"),
+            '''\
             def start() -> None:
                 """
                 Start the service.
@@ -50,20 +42,19 @@ SPEC = {
                 """
                 pass
         ''',
-        "user_guide/01-intro.qmd": """\
-            ---
-            title: Introduction
-            ---
-
+        ),
+        "user_guide/01-intro.qmd": qmd_page(
+            "Introduction",
+            """\
             Welcome to the extras-guide package.
         """,
-        "user_guide/02-config.qmd": """\
-            ---
-            title: Configuration
-            ---
-
+        ),
+        "user_guide/02-config.qmd": qmd_page(
+            "Configuration",
+            """\
             Configuration details for the extras-guide package.
         """,
+        ),
         "LICENSE": """\
             MIT License
 
@@ -103,7 +94,7 @@ SPEC = {
         "detected_name": "gdtest-extras-guide",
         "detected_module": "gdtest_extras_guide",
         "detected_parser": "numpy",
-        "export_names": ["start", "stop"],
+        "export_names": ("start", "stop"),
         "num_exports": 2,
         "section_titles": ["Functions"],
         "has_user_guide": True,
@@ -6,29 +6,21 @@ Focus: Big class with all methods documented in Google style to verify
        Google docstring parsing works with the big-class method extraction.
 """
 
+from ._common import init_py, make_pyproject
+
 SPEC = {
     "name": "gdtest_google_big_class",
     "description": "Google docstrings with a big class (>5 methods)",
-    "dimensions": ["A1", "B1", "C3", "D2", "E6", "F6", "G1", "H7"],
-    "pyproject_toml": {
-        "project": {
-            "name": "gdtest-google-big-class",
-            "version": "0.1.0",
-            "description": "Test Google docstrings with big class method extraction",
-        },
-        "build-system": {
-            "requires": ["setuptools"],
-            "build-backend": "setuptools.build_meta",
-        },
-    },
+    "dimensions": ("A1", "B1", "C3", "D2", "E6", "F6", "G1", "H7"),
+    "pyproject_toml": make_pyproject(
+        "gdtest-google-big-class",
+        "Test Google docstrings with big class method extraction",
+    ),
     "files": {
-        "gdtest_google_big_class/__init__.py": '''\
-            """Package with a big class using Google-style docstrings."""
-
-            __version__ = "0.1.0"
-            __all__ = ["DataProcessor", "load_data"]
-
-
+        "gdtest_google_big_class/__init__.py": init_py(
+            "Package with a big class using Google-style docstrings.",
+            ("DataProcessor", "load_data"),
+            '''\
             class DataProcessor:
                 """A processor for tabular data.
 
@@ -124,6 +116,7 @@ SPEC = {
                 """
                 return DataProcessor(path)
         ''',
+        ),
         "README.md": """\
             # gdtest-google-big-class
 
@@ -134,7 +127,7 @@ SPEC = {
         "detected_name": "gdtest-google-big-class",
         "detected_module": "gdtest_google_big_class",
         "detected_parser": "google",
-        "export_names": ["DataProcessor", "load_data"],
+        "export_names": ("DataProcessor", "load_data"),
         "num_exports": 2,
         "section_titles": ["Classes", "DataProcessor Methods", "Functions"],
         "has_user_guide": False,
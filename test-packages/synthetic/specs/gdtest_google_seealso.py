@@ -6,29 +6,21 @@ Focus: Google-style docstrings with %seealso cross-references to verify
        both render together correctly.
 """
 
+from ._common import init_py, make_pyproject
+
 SPEC = {
     "name": "gdtest_google_seealso",
     "description": "Google docstrings with %seealso cross-references",
-    "dimensions": ["A1", "B1", "C1", "D2", "E3", "F6", "G1", "H7"],
-    "pyproject_toml": {
-        "project": {
-            "name": "gdtest-google-seealso",
-            "version": "0.1.0",
-            "description": "Test Google docstrings with %seealso",
-        },
-        "build-system": {
-            "requires": ["setuptools"],
-            "build-backend": "setuptools.build_meta",
-        },
-    },
+    "dimensions": ("A1", "B1", "C1", "D2", "E3", "F6", "G1", "H7"),
+    "pyproject_toml": make_pyproject(
+        "gdtest-google-seealso",
+        "Test Google docstrings with %seealso",
+    ),
     "files": {
-        "gdtest_google_seealso/__init__.py": '''\
-            """Package with Google docstrings and %seealso directives."""
-
-            __version__ = "0.1.0"
-            __all__ = ["encode", "decode", "compress", "decompress"]
-
-
+        "gdtest_google_seealso/__init__.py": init_py(
+            "Package with Google docstrings and %seealso directives.",
+            ("encode", "decode", "compress", "decompress"),
+            '''\
             def encode(data: str) -> bytes:
                 """Encode a string to bytes.
 
@@ -84,6 +76,7 @@ SPEC = {
                 """
                 return data
         ''',
+        ),
         "README.md": """\
             # gdtest-google-seealso
 
@@ -94,7 +87,7 @@ SPEC = {
         "detected_name": "gdtest-google-seealso",
         "detected_module": "gdtest_google_seealso",
         "detected_parser": "google",
-        "export_names": ["encode", "decode", "compress", "decompress"],
+        "export_names": ("encode", "decode", "compress", "decompress"),
         "num_exports": 4,
         "section_titles": ["Functions"],
         "has_user_guide": False,
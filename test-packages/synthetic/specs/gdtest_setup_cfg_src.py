@@ -6,10 +6,12 @@ Focus: No pyproject.toml — metadata from setup.cfg while module lives
        in src/ directory. Tests both fallback paths together.
 """
 
+from ._common import init_py
+
 SPEC = {
     "name": "gdtest_setup_cfg_src",
     "description": "setup.cfg metadata with src/ layout",
-    "dimensions": ["A7", "A2", "B1", "C1", "D1", "E6", "F6", "G1", "H7"],
+    "dimensions": ("A7", "A2", "B1", "C1", "D1", "E6", "F6", "G1", "H7"),
     "setup_cfg": """\
 [metadata]
 name = gdtest-setup-cfg-src
@@ -25,13 +27,10 @@ packages = find:
 where = src
 """,
     "files": {
-        "src/gdtest_setup_cfg_src/__init__.py": '''\
-            """Package using setup.cfg with src/ layout."""
-
-            __version__ = "0.1.0"
-            __all__ = ["parse", "format_text"]
-
-
+        "src/gdtest_setup_cfg_src/__init__.py": init_py(
+            "Package using setup.cfg with src/ layout.",
+            ("parse", "format_text"),
+            '''\
             def parse(text: str) -> list:
                 """
                 Parse text into tokens.
@@ -65,6 +64,7 @@ where = src
                 """
                 return " ".join(tokens)
         ''',
+        ),
         "README.md": """\
             # gdtest-setup-cfg-src
 
@@ -75,7 +75,7 @@ where = src
         "detected_name": "gdtest-setup-cfg-src",
         "detected_module": "gdtest_setup_cfg_src",
         "detected_parser": "numpy",
-        "export_names": ["parse", "format_text"],
+        "export_names": ("parse", "format_text"),
         "num_exports": 2,
         "section_titles": ["Functions"],
         "has_user_guide": False,
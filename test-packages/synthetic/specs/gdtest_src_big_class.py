@@ -6,34 +6,22 @@ Focus: A big class inside a src/ layout to verify method extraction
        works correctly when the module is discovered from src/.
 """
 
+from ._common import SETUPTOOLS_SRC_LAYOUT, init_py, make_pyproject
+
 SPEC = {
     "name": "gdtest_src_big_class",
     "description": "src/ layout with a big class (>5 methods)",
-    "dimensions": ["A2", "B1", "C3", "D1", "E6", "F6", "G1", "H7"],
-    "pyproject_toml": {
-        "project": {
-            "name": "gdtest-src-big-class",
-            "version": "0.1.0",
-            "description": "Test big class method extraction with src/ layout",
-        },
-        "build-system": {
-            "requires": ["setuptools"],
-            "build-backend": "setuptools.build_meta",
-        },
-        "tool": {
-            "setuptools": {
-                "package-dir": {"": "src"},
-            },
-        },
-    },
+    "dimensions": ("A2", "B1", "C3", "D1", "E6", "F6", "G1", "H7"),
+    "pyproject_toml": make_pyproject(
+        "gdtest-src-big-class",
+        "Test big class method extraction with src/ layout",
+        tool=SETUPTOOLS_SRC_LAYOUT,
+    ),
     "files": {
-        "src/gdtest_src_big_class/__init__.py": '''\
-            """Package with a big class inside src/ layout."""
-
-            __version__ = "0.1.0"
-            __all__ = ["Pipeline", "create_pipeline"]
-
-
+        "src/gdtest_src_big_class/__init__.py": init_py(
+            "Package with a big class inside src/ layout.",
+            ("Pipeline", "create_pipeline"),
+            '''\
             class Pipeline:
                 """
                 A data processing pipeline with many stages.
@@ -127,6 +115,7 @@ SPEC = {
                 """
                 return Pipeline(name)
         ''',
+        ),
         "README.md": """\
             # gdtest-src-big-class
 
@@ -137,7 +126,7 @@ SPEC = {
         "detected_name": "gdtest-src-big-class",
         "detected_module": "gdtest_src_big_class",
         "detected_parser": "numpy",
-        "export_names": ["Pipeline", "create_pipeline"],
+        "export_names": ("Pipeline", "create_pipeline"),
         "num_exports": 2,
         "section_titles": ["Classes", "Pipeline Methods", "Functions"],
         "has_user_guide": False,
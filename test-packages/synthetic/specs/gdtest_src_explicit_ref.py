@@ -6,26 +6,17 @@ Focus: Explicit reference sections with module discovered from src/.
        Tests that explicit config and src/ work together.
 """
 
+from ._common import SETUPTOOLS_SRC_LAYOUT, init_py, make_pyproject
+
 SPEC = {
     "name": "gdtest_src_explicit_ref",
     "description": "src/ layout with explicit reference configuration",
-    "dimensions": ["A2", "B1", "C4", "D1", "E6", "F6", "G1", "H7"],
-    "pyproject_toml": {
-        "project": {
-            "name": "gdtest-src-explicit-ref",
-            "version": "0.1.0",
-            "description": "Test src/ layout with explicit reference",
-        },
-        "build-system": {
-            "requires": ["setuptools"],
-            "build-backend": "setuptools.build_meta",
-        },
-        "tool": {
-            "setuptools": {
-                "package-dir": {"": "src"},
-            },
-        },
-    },
+    "dimensions": ("A2", "B1", "C4", "D1", "E6", "F6", "G1", "H7"),
+    "pyproject_toml": make_pyproject(
+        "gdtest-src-explicit-ref",
+        "Test src/ layout with explicit reference",
+        tool=SETUPTOOLS_SRC_LAYOUT,
+    ),
     "config": {
         "reference": [
             {
@@ -39,13 +30,10 @@ SPEC = {
         ],
     },
     "files": {
-        "src/gdtest_src_explicit_ref/__init__.py": '''\
-            """Package in src/ with explicit reference config."""
-
-            __version__ = "0.1.0"
-            __all__ = ["Engine", "run", "format_result"]
-
-
+        "src/gdtest_src_explicit_ref/__init__.py": init_py(
+            "Package in src/ with explicit reference config.",
+            ("Engine", "run", "format_result"),
+            '''\
             class Engine:
                 """
                 Core processing engine.
@@ -104,6 +92,7 @@ SPEC = {
                 """
                 return str(result)
         ''',
+        ),
         "README.md": """\
             # gdtest-src-explicit-ref
 
@@ -114,7 +103,7 @@ SPEC = {
         "detected_name": "gdtest-src-explicit-ref",
         "detected_module": "gdtest_src_explicit_ref",
         "detected_parser": "numpy",
-        "export_names": ["Engine", "run", "format_result"],
+        "export_names": ("Engine", "run", "format_result"),
         "num_exports": 3,
         "section_titles": ["Core", "Utility"],
         "has_user_guide": False,
@@ -6,33 +6,22 @@ Focus: src/ layout where the module omits __all__, relying on griffe
        fallback for public-name discovery.
 """
 
+from ._common import SETUPTOOLS_SRC_LAYOUT, init_py, make_pyproject
+
 SPEC = {
     "name": "gdtest_src_no_all",
     "description": "src/ layout without __all__ (griffe fallback)",
-    "dimensions": ["A2", "B3", "C4", "D1", "E6", "F6", "G1", "H7"],
-    "pyproject_toml": {
-        "project": {
-            "name": "gdtest-src-no-all",
-            "version": "0.1.0",
-            "description": "Test griffe fallback in src/ layout",
-        },
-        "build-system": {
-            "requires": ["setuptools"],
-            "build-backend": "setuptools.build_meta",
-        },
-        "tool": {
-            "setuptools": {
-                "package-dir": {"": "src"},
-            },
-        },
-    },
+    "dimensions": ("A2", "B3", "C4", "D1", "E6", "F6", "G1", "H7"),
+    "pyproject_toml": make_pyproject(
+        "gdtest-src-no-all",
+        "Test griffe fallback in src/ layout",
+        tool=SETUPTOOLS_SRC_LAYOUT,
+    ),
     "files": {
-        "src/gdtest_src_no_all/__init__.py": '''\
-            """Package in src/ layout without __all__."""
-
-            __version__ = "0.1.0"
-
-
+        "src/gdtest_src_no_all/__init__.py": init_py(
+            "Package in src/ layout without __all__.",
+            None,
+            '''\
             class Record:
                 """
                 A data record.
@@ -85,6 +74,7 @@ SPEC = {
                 """Private — should not appear."""
                 return x
         ''',
+        ),
         "README.md": """\
             # gdtest-src-no-all
 
@@ -95,7 +85,7 @@ SPEC = {
         "detected_name": "gdtest-src-no-all",
         "detected_module": "gdtest_src_no_all",
         "detected_parser": "numpy",
-        "export_names": ["Record", "fetch", "store"],
+        "export_names": ("Record", "fetch", "store"),
         "num_exports": 3,
         "section_titles": ["Classes", "Functions"],
         "has_user_guide": False,
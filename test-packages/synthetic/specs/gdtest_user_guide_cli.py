@@ -6,32 +6,24 @@ Focus: Combines auto-discovered user guide with Click CLI docs to
        verify both appear in the sidebar without conflict.
 """
 
+from ._common import init_py, make_pyproject, qmd_page
+
 SPEC = {
     "name": "gdtest_user_guide_cli",
     "description": "User guide combined with CLI documentation",
-    "dimensions": ["A1", "B1", "C1", "D1", "E6", "F1", "G1", "H7"],
-    "pyproject_toml": {
-        "project": {
-            "name": "gdtest-user-guide-cli",
-            "version": "0.1.0",
-            "description": "Test user guide and CLI docs together",
-        },
-        "build-system": {
-            "requires": ["setuptools"],
-            "build-backend": "setuptools.build_meta",
-        },
-    },
+    "dimensions": ("A1", "B1", "C1", "D1", "E6", "F1", "G1", "H7"),
+    "pyproject_toml": make_pyproject(
+        "gdtest-user-guide-cli",
+        "Test user guide and CLI docs together",
+    ),
     "config": {
         "cli": {"enabled": True},
     },
     "files": {
-        "gdtest_user_guide_cli/__init__.py": '''\
-            """Package with API, user guide, and CLI."""
-
-            __version__ = "0.1.0"
-            __all__ = ["process", "analyze"]
-
-
+        "gdtest_user_guide_cli/__init__.py": init_py(
+            "Package with API, user guide, and CLI.",
+            ("process", "analyze"),
+            '''\
             def process(data: str) -> str:
                 """
                 Process input data.
@@ -65,6 +57,7 @@ SPEC = {
                 """
                 return {"length": len(data)}
         ''',
+        ),
         "gdtest_user_guide_cli/cli.py": '''\
             """CLI interface for gdtest_user_guide_cli."""
 
@@ -96,11 +89,9 @@ SPEC = {
                 """Show statistics for the input file."""
                 click.echo(f"Stats for {input_file}")
         ''',
-        "user_guide/01-getting-started.qmd": """\
-            ---
-            title: Getting Started
-            ---
-
+        "user_guide/01-getting-started.qmd": qmd_page(
+            "Getting Started",
+            """\
             ## Introduction
 
             Welcome to gdtest-user-guide-cli. This guide covers basic usage.
@@ -111,11 +102,10 @@ SPEC = {
             pip install gdtest-user-guide-cli
             ```
         """,
-        "user_guide/02-advanced.qmd": """\
-            ---
-            title: Advanced Usage
-            ---
-
+        ),
+        "user_guide/02-advanced.qmd": qmd_page(
+            "Advanced Usage",
+            """\
             ## Configuration
 
             Advanced configuration options for power users.
@@ -124,6 +114,7 @@ SPEC = {
 
             Process multiple files at once using the CLI.
         """,
+        ),
         "README.md": """\
             # gdtest-user-guide-cli
 
@@ -134,7 +125,7 @@ SPEC = {
         "detected_name": "gdtest-user-guide-cli",
         "detected_module": "gdtest_user_guide_cli",
         "detected_parser": "numpy",
-        "export_names": ["process", "analyze"],
+        "export_names": ("process", "analyze"),
         "num_exports": 2,
         "section_titles": ["Functions"],
         "has_user_guide": True,
@@ -1,12 +1,23 @@
 #!/usr/bin/env python3
 """Manual test script to verify integration tests work"""
 
-import subprocess
 import sys
 from pathlib import Path
 
+from click.testing import CliRunner
+
+from great_docs.cli import cli
+
 TEST_PACKAGES_DIR = Path(__file__).parent
-GREAT_DOCS_CMD = TEST_PACKAGES_DIR.parent / ".venv" / "bin" / "great-docs"
+
+# One in-process runner for every package avoids a fresh interpreter (and a
+# fresh import of great_docs) for each command
+RUNNER = CliRunner()
+
+
+def run_command(args):
+    """Invoke the great-docs CLI in-process and return the click `Result`."""
+    return RUNNER.invoke(cli, args, input="", catch_exceptions=True)
 
 
 def test_package(package_name):
@@ -17,48 +28,34 @@ def test_package(package_name):
 
     # Test init
     print("Running: great-docs init --force")
-    result = subprocess.run(
-        [str(GREAT_DOCS_CMD), "init", "--force"],
-        cwd=package_dir,
-        capture_output=True,
-        text=True,
-        input="",
-        timeout=60,
-    )
-
-    print(f"Exit code: {result.returncode}")
-    if result.stdout:
-        print(f"STDOUT:\n{result.stdout}")
-    if result.stderr:
-        print(f"STDERR:\n{result.stderr}")
-
-    if result.returncode == 0:
+    result = run_command(["init", "--force", "--project-path", str(package_dir)])
+
+    print(f"Exit code: {result.exit_code}")
+    if result.output:
+        print(f"OUTPUT:\n{result.output}")
+    if result.exception and not isinstance(result.exception, SystemExit):
+        print(f"EXCEPTION:\n{result.exception!r}")
+
+    if result.exit_code == 0:
         print("✓ Init succeeded")
 
         # Test build
         print("\nRunning: great-docs build")
-        result = subprocess.run(
-            [str(GREAT_DOCS_CMD), "build"],
-            cwd=package_dir,
-            capture_output=True,
-            text=True,
-            input="",
-            timeout=180,
-        )
-
-        print(f"Exit code: {result.returncode}")
-        if result.returncode == 0:
+        result = run_command(["build", "--project-path", str(package_dir)])
+
+        print(f"Exit code: {result.exit_code}")
+        if result.exit_code == 0:
             print("✓ Build succeeded")
         else:
             print("✗ Build failed")
-            if result.stdout:
-                print(f"STDOUT:\n{result.stdout[-1000:]}")  # Last 1000 chars
-            if result.stderr:
-                print(f"STDERR:\n{result.stderr[-1000:]}")
+            if result.output:
+                print(f"OUTPUT:\n{result.output[-1000:]}")  # Last 1000 chars
+            if result.exception and not isinstance(result.exception, SystemExit):
+                print(f"EXCEPTION:\n{result.exception!r}")
     else:
         print("✗ Init failed")
 
-    return result.returncode == 0
+    return result.exit_code == 0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,22 @@
+import pytest
+
+from great_docs import GreatDocs
+
+
+@pytest.fixture(scope="module")
+def great_docs_self():
+    """A `GreatDocs` instance for this repository, shared by read-only tests in a module."""
+    return GreatDocs()
+
+
+@pytest.fixture
+def tmp_docs(tmp_path):
+    """A `GreatDocs` instance rooted in a fresh temporary project directory."""
+    return GreatDocs(project_path=str(tmp_path))
+
+
+@pytest.fixture
+def minimal_project(tmp_path):
+    """A temporary project root containing only a minimal `pyproject.toml`."""
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "test"\nversion = "0.1.0"')
+    return tmp_path
@@ -6,6 +6,8 @@ from unittest.mock import patch
 
 import pytest
 
+from yaml12 import parse_yaml
+
 from great_docs.config import Config, DEFAULT_CONFIG, create_default_config, load_config
 
 
@@ -16,7 +18,12 @@ def tmp_project(tmp_path: Path) -> Path:
 
 
 def _make_config(tmp_path: Path, yaml_text: str) -> Config:
-    """Helper: write *yaml_text* to great-docs.yml and return a Config."""
+    """Helper: build a Config from *yaml_text* as if it were great-docs.yml (no disk I/O)."""
+    return Config.from_mapping(parse_yaml(yaml_text) or {}, tmp_path)
+
+
+def _write_config(tmp_path: Path, yaml_text: str) -> Config:
+    """Helper: write *yaml_text* to great-docs.yml and return a Config loaded from it."""
     (tmp_path / "great-docs.yml").write_text(yaml_text, encoding="utf-8")
     return Config(tmp_path)
 
@@ -27,7 +34,7 @@ class TestConfigInit:
         assert cfg._config == DEFAULT_CONFIG.copy()
 
     def test_loads_user_config(self, tmp_project: Path):
-        cfg = _make_config(tmp_project, "parser: google\n")
+        cfg = _write_config(tmp_project, "parser: google\n")
         assert cfg.parser == "google"
 
     def test_yaml_error_prints_warning(self, tmp_project: Path, capsys):
@@ -50,6 +57,16 @@ class TestConfigInit:
         assert "Warning: Could not read great-docs.yml" in captured.out
         assert cfg.parser == "numpy"
 
+    def test_same_size_rewrite_is_not_served_stale(self, tmp_project: Path):
+        assert _write_config(tmp_project, "parser: google\n").parser == "google"
+        assert _write_config(tmp_project, "parser: sphinx\n").parser == "sphinx"
+
+    def test_cached_parse_is_not_shared_between_instances(self, tmp_project: Path):
+        cfg1 = _write_config(tmp_project, "exclude:\n  - a\n")
+        cfg1._config["exclude"].append("b")
+        cfg2 = Config(tmp_project)
+        assert cfg2.get("exclude") == ["a"]
+
 
 class TestMergeConfig:
     def test_deep_merge_nested_dicts(self, tmp_project: Path):
@@ -697,7 +714,7 @@ class TestContentStyle:
 
 class TestExistsAndToDict:
     def test_exists_true(self, tmp_project: Path):
-        cfg = _make_config(tmp_project, "parser: google\n")
+        cfg = _write_config(tmp_project, "parser: google\n")
         assert cfg.exists() is True
 
     def test_exists_false(self, tmp_project: Path):
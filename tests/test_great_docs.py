@@ -335,21 +335,19 @@ def test_init_refuses_when_config_exists():
         assert (project_path / "great-docs.yml").exists()
 
 
-def test_parse_package_exports_real_project():
+def test_parse_package_exports_real_project(great_docs_self):
     """Test parsing __all__ from __init__.py."""
     # Test on great-docs's own __init__.py
-    docs = GreatDocs()
-    exports = docs._parse_package_exports("great_docs")
+    exports = great_docs_self._parse_package_exports("great_docs")
 
     assert exports is not None
     assert "GreatDocs" in exports
     assert "main" in exports
 
 
-def test_create_api_sections():
+def test_create_api_sections(great_docs_self):
     """Test auto-generation of API reference sections."""
-    docs = GreatDocs()
-    sections = docs._create_api_sections("great_docs")
+    sections = great_docs_self._create_api_sections("great_docs")
 
     assert sections is not None
     assert len(sections) > 0
@@ -359,19 +357,17 @@ def test_create_api_sections():
     assert has_contents
 
 
-def test_detect_package_name_from_pyproject_real_project():
+def test_detect_package_name_from_pyproject_real_project(great_docs_self):
     """Test package name detection from pyproject.toml."""
     # Test on great-docs's own pyproject.toml
-    docs = GreatDocs()
-    package_name = docs._detect_package_name()
+    package_name = great_docs_self._detect_package_name()
 
     assert package_name == "great-docs"
 
 
-def test_find_package_init():
+def test_find_package_init(great_docs_self):
     """Test finding __init__.py in standard location."""
-    docs = GreatDocs()
-    init_file = docs._find_package_init("great_docs")
+    init_file = great_docs_self._find_package_init("great_docs")
 
     assert init_file is not None
     assert init_file.exists()
@@ -398,6 +394,26 @@ def test_find_package_init_with_nested_structure():
         assert found_init == init_file.resolve()
 
 
+def test_find_package_init_caches_successful_lookup():
+    """Test that a found __init__.py is reused until it disappears."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        package_dir = Path(tmp_dir) / "mypackage"
+        package_dir.mkdir()
+        init_file = package_dir / "__init__.py"
+        init_file.write_text('__all__ = ["MyClass"]\n')
+
+        docs = GreatDocs(project_path=tmp_dir)
+        first = docs._find_package_init("mypackage")
+
+        with patch.object(docs, "_locate_package_init") as mock_locate:
+            assert docs._find_package_init("mypackage") == first
+            mock_locate.assert_not_called()
+
+        # A cached path that no longer exists triggers a fresh search
+        init_file.unlink()
+        assert docs._find_package_init("mypackage") is None
+
+
 def test_cli_import():
     """Test that CLI module can be imported."""
     assert callable(main)
@@ -1085,11 +1101,10 @@ api-reference:
         assert "https://example.com/docs/reference/foo.html" in content
 
 
-def test_get_github_repo_info():
+def test_get_github_repo_info(great_docs_self):
     """Test GitHub repository info extraction from pyproject.toml."""
     # Test on great-docs's own pyproject.toml
-    docs = GreatDocs()
-    owner, repo, base_url = docs._get_github_repo_info()
+    owner, repo, base_url = great_docs_self._get_github_repo_info()
 
     assert owner == "posit-dev"
     assert repo == "great-docs"
@@ -1367,10 +1382,9 @@ version = "0.1.0"
         assert base_url is None
 
 
-def test_get_source_location():
+def test_get_source_location(great_docs_self):
     """Test source location detection for classes and methods."""
-    docs = GreatDocs()
-    source_loc = docs._get_source_location("great_docs", "GreatDocs")
+    source_loc = great_docs_self._get_source_location("great_docs", "GreatDocs")
 
     assert source_loc is not None
     assert "file" in source_loc
@@ -1381,10 +1395,9 @@ def test_get_source_location():
     assert "core.py" in source_loc["file"]
 
 
-def test_get_source_location_method_real_project():
+def test_get_source_location_method_real_project(great_docs_self):
     """Test source location detection for methods."""
-    docs = GreatDocs()
-    source_loc = docs._get_source_location("great_docs", "GreatDocs.install")
+    source_loc = great_docs_self._get_source_location("great_docs", "GreatDocs.install")
 
     assert source_loc is not None
     assert "file" in source_loc
@@ -1392,25 +1405,56 @@ def test_get_source_location_method_real_project():
     assert source_loc["start_line"] > 0
 
 
-def test_get_source_location_not_found_real_project():
+def test_get_source_location_not_found_real_project(great_docs_self):
     """Test source location returns None for non-existent items."""
-    docs = GreatDocs()
-    source_loc = docs._get_source_location("great_docs", "NonExistentClass")
+    source_loc = great_docs_self._get_source_location("great_docs", "NonExistentClass")
 
     assert source_loc is None
 
 
-def test_build_github_source_url():
-    """Test GitHub source URL construction."""
-    docs = GreatDocs()
+def test_load_griffe_package_reuses_until_sources_change():
+    """Test griffe packages are loaded once per instance and reloaded after a source edit."""
+    import griffe
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pkg_dir = Path(tmp_dir) / "cachedpkg"
+        pkg_dir.mkdir()
+        (pkg_dir / "__init__.py").write_text("from .mod import first\n")
+        (pkg_dir / "mod.py").write_text("def first():\n    pass\n")
+
+        docs = GreatDocs(project_path=tmp_dir)
+
+        with patch("griffe.load", wraps=griffe.load) as mock_load:
+            pkg1 = docs._load_griffe_package("cachedpkg", [tmp_dir])
+            pkg2 = docs._load_griffe_package("cachedpkg", [tmp_dir])
+            assert pkg1 is pkg2
+            assert mock_load.call_count == 1
+
+            # Another instance never shares the loaded (mutable) package object
+            other = GreatDocs(project_path=tmp_dir)
+            assert other._load_griffe_package("cachedpkg", [tmp_dir]) is not pkg1
+            assert mock_load.call_count == 2
+
+            # Editing a submodule invalidates the cached package
+            (pkg_dir / "mod.py").write_text("def first():\n    pass\n\n\ndef second():\n    pass\n")
+            pkg3 = docs._load_griffe_package("cachedpkg", [tmp_dir])
+            assert mock_load.call_count == 3
+            assert "second" in pkg3.members["mod"].members
 
+            # uninstall() drops it along with the other per-instance caches
+            docs.uninstall()
+            assert docs._load_griffe_package("cachedpkg", [tmp_dir]) is not pkg3
+
+
+def test_build_github_source_url(great_docs_self):
+    """Test GitHub source URL construction."""
     source_loc = {
         "file": "/path/to/great_docs/core.py",
         "start_line": 42,
         "end_line": 58,
     }
 
-    url = docs._build_github_source_url(source_loc, branch="main")
+    url = great_docs_self._build_github_source_url(source_loc, branch="main")
 
     assert url is not None
     assert "https://github.com/posit-dev/great-docs" in url
@@ -1418,17 +1462,15 @@ def test_build_github_source_url():
     assert "#L42-L58" in url
 
 
-def test_build_github_source_url_single_line_hardcoded_path():
+def test_build_github_source_url_single_line_hardcoded_path(great_docs_self):
     """Test GitHub source URL with single line."""
-    docs = GreatDocs()
-
     source_loc = {
         "file": "/path/to/great_docs/core.py",
         "start_line": 42,
         "end_line": 42,
     }
 
-    url = docs._build_github_source_url(source_loc, branch="main")
+    url = great_docs_self._build_github_source_url(source_loc, branch="main")
 
     assert url is not None
     assert "#L42" in url
@@ -1458,6 +1500,47 @@ version = "0.1.0"
         assert metadata.get("source_link_placement", "usage") == "usage"
 
 
+def test_get_package_metadata_reused_until_files_change(tmp_path):
+    """Test package metadata is rebuilt only when its source files change."""
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "test-package"\n')
+    (tmp_path / "great-docs.yml").write_text("source:\n  branch: main\n")
+
+    docs = GreatDocs(project_path=str(tmp_path))
+    # Construction already reads the metadata (for the GitHub repo info); start from cold
+    docs._metadata_cache = None
+
+    with patch.object(docs, "_read_package_metadata", wraps=docs._read_package_metadata) as m:
+        first = docs._get_package_metadata()
+        first["source_link_branch"] = "mutated"
+        second = docs._get_package_metadata()
+        assert m.call_count == 1
+        assert second["source_link_branch"] == "main"
+
+        (tmp_path / "great-docs.yml").write_text("source:\n  branch: dev\n")
+        third = docs._get_package_metadata()
+        assert m.call_count == 2
+        assert third["source_link_branch"] == "dev"
+
+
+def test_get_package_metadata_cache_hit_leaves_config_alone(tmp_path):
+    """Test a metadata cache hit keeps runtime changes to (and replacements of) the config."""
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "test-package"\n')
+    (tmp_path / "great-docs.yml").write_text("changelog:\n  max_releases: 5\n")
+
+    docs = GreatDocs(project_path=str(tmp_path))
+    docs._get_package_metadata()
+
+    # Runtime override, as the `changelog` CLI command does for `--max-releases`
+    docs._config._config.setdefault("changelog", {})["max_releases"] = 2
+    docs._get_package_metadata()
+    assert docs._config.changelog_max_releases == 2
+
+    replacement = Config(tmp_path)
+    docs._config = replacement
+    docs._get_package_metadata()
+    assert docs._config is replacement
+
+
 def test_source_link_config_custom():
     """Test custom source link configuration."""
     with tempfile.TemporaryDirectory() as tmp_dir:
@@ -1552,6 +1635,29 @@ https://example.com/page
         assert len(results["broken"]) == 0
 
 
+def test_check_links_ignore_patterns_mixed_regex_and_literal(tmp_docs, tmp_path):
+    """Test regex and invalid-regex (literal) ignore patterns combine correctly."""
+    docs_dir = tmp_path / "user_guide"
+    docs_dir.mkdir()
+    (docs_dir / "test.md").write_text(
+        "https://API.example.org/v1\nhttps://site.test/a[b\nhttps://keep.test/page\n"
+    )
+
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.headers = {}
+
+    with patch("requests.head", return_value=mock_response):
+        results = tmp_docs.check_links(
+            include_source=False,
+            include_docs=True,
+            ignore_patterns=[r"api\.example\.(org|com)", "a[b"],
+        )
+
+    assert sorted(results["skipped"]) == ["https://API.example.org/v1", "https://site.test/a[b"]
+    assert results["ok"] == ["https://keep.test/page"]
+
+
 def test_check_links_url_cleaning():
     """Test that URLs are properly cleaned of trailing punctuation."""
     with tempfile.TemporaryDirectory() as tmp_dir:
@@ -1613,6 +1719,74 @@ def test_check_links_returns_correct_structure():
         assert isinstance(results["by_file"], dict)
 
 
+def test_check_links_scans_nested_doc_files():
+    """Test that check_links finds .qmd/.md files in nested user_guide directories."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        nested_dir = Path(tmp_dir) / "user_guide" / "advanced" / "deep"
+        nested_dir.mkdir(parents=True)
+
+        (nested_dir / "page.qmd").write_text("See https://localhost:8000/qmd\n")
+        (nested_dir / "notes.md").write_text("See https://localhost:8000/md\n")
+        (nested_dir / "data.txt").write_text("See https://localhost:8000/txt\n")
+
+        docs = GreatDocs(project_path=tmp_dir)
+        results = docs.check_links(
+            include_source=False,
+            include_docs=True,
+            ignore_patterns=["localhost"],
+        )
+
+        assert sorted(results["skipped"]) == [
+            "https://localhost:8000/md",
+            "https://localhost:8000/qmd",
+        ]
+        assert sorted(results["by_file"]) == [
+            str(Path("user_guide/advanced/deep/notes.md")),
+            str(Path("user_guide/advanced/deep/page.qmd")),
+        ]
+
+
+def test_check_links_ignore_patterns_keep_their_own_groups():
+    """Test that ignore patterns with groups and backreferences keep their meaning."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        docs_dir = Path(tmp_dir) / "user_guide"
+        docs_dir.mkdir()
+        (docs_dir / "page.qmd").write_text(
+            "See https://foobar.test/a and https://mirror.mirror.test/b\n"
+        )
+
+        docs = GreatDocs(project_path=tmp_dir)
+        results = docs.check_links(
+            include_source=False,
+            include_docs=True,
+            # Folded into one alternation, "\1" would refer to the "(foo)" group instead
+            ignore_patterns=["(foo)bar", r"//(\w+)\.\1\.test", "localhost"],
+        )
+
+        assert sorted(results["skipped"]) == [
+            "https://foobar.test/a",
+            "https://mirror.mirror.test/b",
+        ]
+        assert results["total"] == 2
+
+
+def test_read_toml_cached_returns_copies_and_sees_edits():
+    """Test that the cached TOML reader never shares state and tracks file edits."""
+    from great_docs.core import _read_toml_cached
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pyproject = Path(tmp_dir) / "pyproject.toml"
+        pyproject.write_text('[project]\nname = "first"\nkeywords = ["a"]\n')
+
+        data = _read_toml_cached(pyproject)
+        data["project"]["keywords"].append("mutated")
+        assert _read_toml_cached(pyproject)["project"]["keywords"] == ["a"]
+
+        # Same size, different content: must not return the stale parse
+        pyproject.write_text('[project]\nname = "secnd"\nkeywords = ["a"]\n')
+        assert _read_toml_cached(pyproject)["project"]["name"] == "secnd"
+
+
 def test_config_defaults():
     """Test that Config provides sensible defaults when no file exists."""
     with tempfile.TemporaryDirectory() as tmp_dir:
@@ -1865,13 +2039,9 @@ def my_function(x, y):
 '''
         (package_dir / "__init__.py").write_text(init_content)
 
-        sys.path.insert(0, tmp_dir)
-        try:
-            docs = GreatDocs(project_path=tmp_dir)
-            style = docs._detect_docstring_style("numpypkg")
-            assert style == "numpy"
-        finally:
-            sys.path.remove(tmp_dir)
+        docs = GreatDocs(project_path=tmp_dir)
+        style = docs._detect_docstring_style("numpypkg")
+        assert style == "numpy"
 
 
 def test_detect_docstring_style_google():
@@ -1920,14 +2090,10 @@ class MyClass:
 '''
         (package_dir / "__init__.py").write_text(init_content)
 
-        sys.path.insert(0, tmp_dir)
-        try:
-            docs = GreatDocs(project_path=tmp_dir)
-            style = docs._detect_docstring_style("googlepkg")
+        docs = GreatDocs(project_path=tmp_dir)
+        style = docs._detect_docstring_style("googlepkg")
 
-            assert style == "google"
-        finally:
-            sys.path.remove(tmp_dir)
+        assert style == "google"
 
 
 def test_detect_docstring_style_sphinx():
@@ -1957,14 +2123,10 @@ def my_function(x, y):
 '''
         (package_dir / "__init__.py").write_text(init_content)
 
-        sys.path.insert(0, tmp_dir)
-        try:
-            docs = GreatDocs(project_path=tmp_dir)
-            style = docs._detect_docstring_style("sphinxpkg")
+        docs = GreatDocs(project_path=tmp_dir)
+        style = docs._detect_docstring_style("sphinxpkg")
 
-            assert style == "sphinx"
-        finally:
-            sys.path.remove(tmp_dir)
+        assert style == "sphinx"
 
 
 def test_detect_docstring_style_defaults_to_numpy():
@@ -1984,14 +2146,10 @@ def my_function(x, y):
 """
         (package_dir / "__init__.py").write_text(init_content)
 
-        sys.path.insert(0, tmp_dir)
-        try:
-            docs = GreatDocs(project_path=tmp_dir)
-            style = docs._detect_docstring_style("nodocspkg")
+        docs = GreatDocs(project_path=tmp_dir)
+        style = docs._detect_docstring_style("nodocspkg")
 
-            assert style == "numpy"  # Default when no docstrings found
-        finally:
-            sys.path.remove(tmp_dir)
+        assert style == "numpy"  # Default when no docstrings found
 
 
 def test_config_parser_property():
@@ -2144,23 +2302,19 @@ reference:
 """
         (Path(tmp_dir) / "great-docs.yml").write_text(config_content)
 
-        sys.path.insert(0, tmp_dir)
-        try:
-            docs = GreatDocs(project_path=tmp_dir)
+        docs = GreatDocs(project_path=tmp_dir)
 
-            # The reference config should be loaded
-            assert docs._config.reference is not None
-            assert len(docs._config.reference) == 1
-            assert docs._config.reference[0]["title"] == "Functions"
+        # The reference config should be loaded
+        assert docs._config.reference is not None
+        assert len(docs._config.reference) == 1
+        assert docs._config.reference[0]["title"] == "Functions"
 
-            # Build sections from config should work
-            sections = docs._build_sections_from_reference_config(docs._config.reference)
+        # Build sections from config should work
+        sections = docs._build_sections_from_reference_config(docs._config.reference)
 
-            assert sections is not None
-            assert len(sections) == 1
-            assert "my_func" in sections[0]["contents"]
-        finally:
-            sys.path.remove(tmp_dir)
+        assert sections is not None
+        assert len(sections) == 1
+        assert "my_func" in sections[0]["contents"]
 
 
 def test_get_quarto_env_returns_current_python():
@@ -2213,7 +2367,7 @@ def test_get_quarto_env_preserves_existing_env():
         assert env["PATH"] == os.environ.get("PATH")
 
 
-def test_detect_dynamic_mode_returns_true_for_simple_package():
+def test_detect_dynamic_mode_returns_true_for_simple_package(monkeypatch):
     """Test that _detect_dynamic_mode returns True for packages without cyclic aliases."""
 
     with tempfile.TemporaryDirectory() as tmp_dir:
@@ -2233,14 +2387,13 @@ class MyClass:
 '''
         )
 
-        sys.path.insert(0, tmp_dir)
-        try:
-            docs = GreatDocs(project_path=tmp_dir)
-            result = docs._detect_dynamic_mode("simple_pkg")
-            # Should return True for a simple package
-            assert result is True
-        finally:
-            sys.path.remove(tmp_dir)
+        # Dynamic mode imports the package, so it must be importable
+        monkeypatch.syspath_prepend(tmp_dir)
+
+        docs = GreatDocs(project_path=tmp_dir)
+        result = docs._detect_dynamic_mode("simple_pkg")
+        # Should return True for a simple package
+        assert result is True
 
 
 def test_detect_dynamic_mode_returns_true_with_no_package():
@@ -2289,147 +2442,50 @@ def test_config_dynamic_property_default():
         assert config.dynamic is True
 
 
-def test_citation_year_from_date_released():
-    """Test that citation year is parsed from date-released field."""
-
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
-
-        # Create a minimal pyproject.toml
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test-package"\nversion = "0.1.0"')
-
-        # Create CITATION.cff with date-released
-        citation_cff = project_path / "CITATION.cff"
-        citation_data = {
-            "cff-version": "1.2.0",
-            "title": "Test Package",
-            "authors": [{"given-names": "John", "family-names": "Doe"}],
-            "version": "0.1.0",
-            "date-released": "2023-05-15",
-            "url": "https://example.com",
-        }
-        citation_cff.write_text(format_yaml(citation_data))
-
-        # Create README.md
-        readme = project_path / "README.md"
-        readme.write_text("# Test Package\n\nA test package.")
-
-        # Create great-docs directory
-        docs_dir = project_path / "great-docs"
-        docs_dir.mkdir(parents=True, exist_ok=True)
-
-        docs = GreatDocs(project_path=tmp_dir)
-        docs._create_index_from_readme()
-
-        # Check that citation.qmd was created
-        citation_qmd = docs_dir / "citation.qmd"
-
-        assert citation_qmd.exists()
-
-        content = citation_qmd.read_text()
-
-        # Check that 2023 appears in the citation (from date-released)
-        assert "2023" in content
-        assert "year = {2023}" in content
-
-
-def test_citation_year_defaults_to_current():
-    """Test that citation year defaults to current year when date-released is missing."""
-
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
-
-        # Create a minimal pyproject.toml
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test-package"\nversion = "0.1.0"')
-
-        # Create CITATION.cff WITHOUT date-released
-        citation_cff = project_path / "CITATION.cff"
-        citation_data = {
-            "cff-version": "1.2.0",
-            "title": "Test Package",
-            "authors": [{"given-names": "Jane", "family-names": "Smith"}],
-            "version": "0.2.0",
-            "url": "https://example.com",
-        }
-        citation_cff.write_text(format_yaml(citation_data))
-
-        # Create README.md
-        readme = project_path / "README.md"
-        readme.write_text("# Test Package\n\nA test package.")
-
-        # Create great-docs directory
-        docs_dir = project_path / "great-docs"
-        docs_dir.mkdir(parents=True, exist_ok=True)
-
-        docs = GreatDocs(project_path=tmp_dir)
-        docs._create_index_from_readme()
-
-        # Check that citation.qmd was created
-        citation_qmd = docs_dir / "citation.qmd"
-
-        assert citation_qmd.exists()
-
-        content = citation_qmd.read_text()
-
-        # Check that current year appears in the citation
-        current_year = str(datetime.now().year)
-
-        assert current_year in content
-        assert f"year = {{{current_year}}}" in content
-
-
-def test_citation_year_handles_invalid_date():
-    """Test that citation year falls back to current year for invalid dates."""
-
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
-
-        # Create a minimal pyproject.toml
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test-package"\nversion = "0.1.0"')
-
-        # Create CITATION.cff with invalid date-released
-        citation_cff = project_path / "CITATION.cff"
-        citation_data = {
-            "cff-version": "1.2.0",
-            "title": "Test Package",
-            "authors": [{"given-names": "Bob", "family-names": "Johnson"}],
-            "version": "0.3.0",
-            "date-released": "invalid-date-format",
-            "url": "https://example.com",
-        }
-        citation_cff.write_text(format_yaml(citation_data))
-
-        # Create README.md
-        readme = project_path / "README.md"
-        readme.write_text("# Test Package\n\nA test package.")
-
-        # Create great-docs directory
-        docs_dir = project_path / "great-docs"
-        docs_dir.mkdir(parents=True, exist_ok=True)
-
-        docs = GreatDocs(project_path=tmp_dir)
-        docs._create_index_from_readme()
-
-        # Check that citation.qmd was created
-        citation_qmd = docs_dir / "citation.qmd"
+@pytest.mark.parametrize(
+    "date_released, expected_year",
+    [
+        ("2023-05-15", "2023"),
+        (None, None),  # missing date-released falls back to the current year
+        ("invalid-date-format", None),  # unparseable date falls back to the current year
+    ],
+    ids=["from_date_released", "defaults_to_current", "handles_invalid_date"],
+)
+def test_citation_year(tmp_path, date_released, expected_year):
+    """Test that the citation year comes from date-released, else the current year."""
+    # Create a minimal pyproject.toml
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "test-package"\nversion = "0.1.0"')
+
+    # Create CITATION.cff, with date-released only when given
+    citation_data = {
+        "cff-version": "1.2.0",
+        "title": "Test Package",
+        "authors": [{"given-names": "John", "family-names": "Doe"}],
+        "version": "0.1.0",
+        "url": "https://example.com",
+    }
+    if date_released is not None:
+        citation_data["date-released"] = date_released
+    (tmp_path / "CITATION.cff").write_text(format_yaml(citation_data))
 
-        assert citation_qmd.exists()
+    # Create README.md and the great-docs directory
+    (tmp_path / "README.md").write_text("# Test Package\n\nA test package.")
+    docs_dir = tmp_path / "great-docs"
+    docs_dir.mkdir(parents=True, exist_ok=True)
 
-        content = citation_qmd.read_text()
+    docs = GreatDocs(project_path=str(tmp_path))
+    docs._create_index_from_readme()
 
-        # Check that current year appears (fallback from invalid date)
-        current_year = str(datetime.now().year)
+    # Check that citation.qmd was created with the expected year
+    citation_qmd = docs_dir / "citation.qmd"
 
-        assert current_year in content
-        assert f"year = {{{current_year}}}" in content
+    assert citation_qmd.exists()
 
-        current_year = str(datetime.now().year)
+    content = citation_qmd.read_text()
+    year = expected_year or str(datetime.now().year)
 
-        assert current_year in content
-        assert f"year = {{{current_year}}}" in content
+    assert year in content
+    assert f"year = {{{year}}}" in content
 
 
 def test_extract_authors_from_pyproject_with_authors():
@@ -2536,804 +2592,747 @@ def test_extract_authors_from_pyproject_no_file():
         assert authors == []
 
 
-def test_format_authors_yaml_basic_single_with_comments():
+def test_format_authors_yaml_basic_single_with_comments(minimal_project):
     """Test formatting authors as YAML."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
-
-        # Create minimal pyproject.toml
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
-
-        docs = GreatDocs(project_path=tmp_dir)
+    docs = GreatDocs(project_path=str(minimal_project))
 
-        authors = [{"name": "Test Author", "role": "Maintainer", "email": "test@example.com"}]
-        yaml_output = docs._format_authors_yaml(authors)
+    authors = [{"name": "Test Author", "role": "Maintainer", "email": "test@example.com"}]
+    yaml_output = docs._format_authors_yaml(authors)
 
-        assert "# Author Information" in yaml_output
-        assert "authors:" in yaml_output
-        assert "- name: Test Author" in yaml_output
-        assert "role: Maintainer" in yaml_output
-        assert "email: test@example.com" in yaml_output
-        assert "# github:" in yaml_output
-        assert "# orcid:" in yaml_output
+    assert "# Author Information" in yaml_output
+    assert "authors:" in yaml_output
+    assert "- name: Test Author" in yaml_output
+    assert "role: Maintainer" in yaml_output
+    assert "email: test@example.com" in yaml_output
+    assert "# github:" in yaml_output
+    assert "# orcid:" in yaml_output
 
 
-def test_format_authors_yaml_empty_with_project():
+def test_format_authors_yaml_empty_with_project(minimal_project):
     """Test formatting empty authors list."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
-
-        # Create minimal pyproject.toml
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
-
-        docs = GreatDocs(project_path=tmp_dir)
-        yaml_output = docs._format_authors_yaml([])
+    docs = GreatDocs(project_path=str(minimal_project))
+    yaml_output = docs._format_authors_yaml([])
 
-        assert yaml_output == ""
+    assert yaml_output == ""
 
 
-def test_format_authors_yaml_no_email():
+def test_format_authors_yaml_no_email(minimal_project):
     """Test formatting authors without email."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
-
-        # Create minimal pyproject.toml
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
+    docs = GreatDocs(project_path=str(minimal_project))
 
-        docs = GreatDocs(project_path=tmp_dir)
-
-        authors = [{"name": "No Email Author", "role": "Author"}]
-        yaml_output = docs._format_authors_yaml(authors)
+    authors = [{"name": "No Email Author", "role": "Author"}]
+    yaml_output = docs._format_authors_yaml(authors)
 
-        assert "- name: No Email Author" in yaml_output
-        assert "role: Author" in yaml_output
-        assert "# email:" in yaml_output  # Should be commented out placeholder
+    assert "- name: No Email Author" in yaml_output
+    assert "role: Author" in yaml_output
+    assert "# email:" in yaml_output  # Should be commented out placeholder
 
 
-def test_strip_numeric_prefix_single_digit():
+def test_strip_numeric_prefix_single_digit(minimal_project):
     """Test stripping single-digit numeric prefix like 1-, 2-, etc."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        pyproject = Path(tmp_dir) / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
-
-        docs = GreatDocs(project_path=tmp_dir)
+    docs = GreatDocs(project_path=str(minimal_project))
 
-        assert docs._strip_numeric_prefix("1-getting-started.qmd") == "getting-started.qmd"
-        assert docs._strip_numeric_prefix("2-configuration.qmd") == "configuration.qmd"
-        assert docs._strip_numeric_prefix("9-advanced.qmd") == "advanced.qmd"
+    assert docs._strip_numeric_prefix("1-getting-started.qmd") == "getting-started.qmd"
+    assert docs._strip_numeric_prefix("2-configuration.qmd") == "configuration.qmd"
+    assert docs._strip_numeric_prefix("9-advanced.qmd") == "advanced.qmd"
 
 
-def test_strip_numeric_prefix_two_digit():
+def test_strip_numeric_prefix_two_digit(minimal_project):
     """Test stripping two-digit numeric prefix like 00-, 01-, etc."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        pyproject = Path(tmp_dir) / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
-
-        docs = GreatDocs(project_path=tmp_dir)
+    docs = GreatDocs(project_path=str(minimal_project))
 
-        assert docs._strip_numeric_prefix("00-introduction.qmd") == "introduction.qmd"
-        assert docs._strip_numeric_prefix("01-installation.qmd") == "installation.qmd"
-        assert docs._strip_numeric_prefix("09-conclusion.qmd") == "conclusion.qmd"
-        assert docs._strip_numeric_prefix("10-appendix.qmd") == "appendix.qmd"
-        assert docs._strip_numeric_prefix("99-final.qmd") == "final.qmd"
+    assert docs._strip_numeric_prefix("00-introduction.qmd") == "introduction.qmd"
+    assert docs._strip_numeric_prefix("01-installation.qmd") == "installation.qmd"
+    assert docs._strip_numeric_prefix("09-conclusion.qmd") == "conclusion.qmd"
+    assert docs._strip_numeric_prefix("10-appendix.qmd") == "appendix.qmd"
+    assert docs._strip_numeric_prefix("99-final.qmd") == "final.qmd"
 
 
-def test_strip_numeric_prefix_three_digit():
+def test_strip_numeric_prefix_three_digit(minimal_project):
     """Test stripping three-digit numeric prefix like 001-, 010-, etc."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        pyproject = Path(tmp_dir) / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
-
-        docs = GreatDocs(project_path=tmp_dir)
+    docs = GreatDocs(project_path=str(minimal_project))
 
-        assert docs._strip_numeric_prefix("001-overview.qmd") == "overview.qmd"
-        assert docs._strip_numeric_prefix("010-details.qmd") == "details.qmd"
-        assert docs._strip_numeric_prefix("0100-reference.qmd") == "reference.qmd"
+    assert docs._strip_numeric_prefix("001-overview.qmd") == "overview.qmd"
+    assert docs._strip_numeric_prefix("010-details.qmd") == "details.qmd"
+    assert docs._strip_numeric_prefix("0100-reference.qmd") == "reference.qmd"
 
 
-def test_strip_numeric_prefix_underscore():
+def test_strip_numeric_prefix_underscore(minimal_project):
     """Test stripping numeric prefix with underscore separator."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        pyproject = Path(tmp_dir) / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
+    docs = GreatDocs(project_path=str(minimal_project))
 
-        docs = GreatDocs(project_path=tmp_dir)
-
-        assert docs._strip_numeric_prefix("01_introduction.qmd") == "introduction.qmd"
-        assert docs._strip_numeric_prefix("1_getting_started.qmd") == "getting_started.qmd"
+    assert docs._strip_numeric_prefix("01_introduction.qmd") == "introduction.qmd"
+    assert docs._strip_numeric_prefix("1_getting_started.qmd") == "getting_started.qmd"
 
 
-def test_strip_numeric_prefix_no_prefix():
+def test_strip_numeric_prefix_no_prefix(minimal_project):
     """Test that filenames without numeric prefix are unchanged."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        pyproject = Path(tmp_dir) / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
-
-        docs = GreatDocs(project_path=tmp_dir)
+    docs = GreatDocs(project_path=str(minimal_project))
 
-        assert docs._strip_numeric_prefix("introduction.qmd") == "introduction.qmd"
-        assert docs._strip_numeric_prefix("index.qmd") == "index.qmd"
-        assert docs._strip_numeric_prefix("getting-started.qmd") == "getting-started.qmd"
+    assert docs._strip_numeric_prefix("introduction.qmd") == "introduction.qmd"
+    assert docs._strip_numeric_prefix("index.qmd") == "index.qmd"
+    assert docs._strip_numeric_prefix("getting-started.qmd") == "getting-started.qmd"
 
 
-def test_strip_numeric_prefix_preserves_internal_numbers():
+def test_strip_numeric_prefix_preserves_internal_numbers(minimal_project):
     """Test that numbers within filename are preserved."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        pyproject = Path(tmp_dir) / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
-
-        docs = GreatDocs(project_path=tmp_dir)
+    docs = GreatDocs(project_path=str(minimal_project))
 
-        assert docs._strip_numeric_prefix("01-python3-setup.qmd") == "python3-setup.qmd"
-        assert docs._strip_numeric_prefix("02-chapter-10.qmd") == "chapter-10.qmd"
+    assert docs._strip_numeric_prefix("01-python3-setup.qmd") == "python3-setup.qmd"
+    assert docs._strip_numeric_prefix("02-chapter-10.qmd") == "chapter-10.qmd"
 
 
-def test_user_guide_files_renamed_on_copy():
+def test_user_guide_files_renamed_on_copy(tmp_path):
     """Test that user guide files are renamed when copied to docs directory."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
+    project_path = tmp_path
 
-        # Create minimal pyproject.toml
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
+    # Create minimal pyproject.toml
+    pyproject = project_path / "pyproject.toml"
+    pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
 
-        # Create user_guide directory with numbered files
-        user_guide = project_path / "user_guide"
-        user_guide.mkdir()
+    # Create user_guide directory with numbered files
+    user_guide = project_path / "user_guide"
+    user_guide.mkdir()
 
-        (user_guide / "00-introduction.qmd").write_text("""---
+    (user_guide / "00-introduction.qmd").write_text("""---
 title: Introduction
 guide-section: Getting Started
 ---
 # Introduction
 """)
-        (user_guide / "01-installation.qmd").write_text("""---
+    (user_guide / "01-installation.qmd").write_text("""---
 title: Installation
 guide-section: Getting Started
 ---
 # Installation
 """)
 
-        docs = GreatDocs(project_path=tmp_dir)
+    docs = GreatDocs(project_path=str(tmp_path))
 
-        # Process the user guide
-        user_guide_info = docs._discover_user_guide()
+    # Process the user guide
+    user_guide_info = docs._discover_user_guide()
 
-        assert user_guide_info is not None
+    assert user_guide_info is not None
 
-        copied_files = docs._copy_user_guide_to_docs(user_guide_info)
+    copied_files = docs._copy_user_guide_to_docs(user_guide_info)
 
-        # Check that files were copied with clean names
-        assert "user-guide/introduction.qmd" in copied_files
-        assert "user-guide/installation.qmd" in copied_files
+    # Check that files were copied with clean names
+    assert "user-guide/introduction.qmd" in copied_files
+    assert "user-guide/installation.qmd" in copied_files
 
-        # Check files exist with clean names
-        docs_user_guide = docs.project_path / "user-guide"
+    # Check files exist with clean names
+    docs_user_guide = docs.project_path / "user-guide"
 
-        assert (docs_user_guide / "introduction.qmd").exists()
-        assert (docs_user_guide / "installation.qmd").exists()
+    assert (docs_user_guide / "introduction.qmd").exists()
+    assert (docs_user_guide / "installation.qmd").exists()
 
-        # Check numbered versions do NOT exist
-        assert not (docs_user_guide / "00-introduction.qmd").exists()
-        assert not (docs_user_guide / "01-installation.qmd").exists()
+    # Check numbered versions do NOT exist
+    assert not (docs_user_guide / "00-introduction.qmd").exists()
+    assert not (docs_user_guide / "01-installation.qmd").exists()
 
 
-def test_user_guide_discovers_mixed_extensions_and_nested_files():
+def test_user_guide_discovers_mixed_extensions_and_nested_files(minimal_project):
     """Test that user guide discovery finds .qmd and .md files at any nesting depth."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
+    # Create user_guide directory with mixed extensions and nesting
+    user_guide = minimal_project / "user_guide"
+    user_guide.mkdir()
 
-        # Create minimal pyproject.toml
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
+    # Top-level .qmd file
+    (user_guide / "intro.qmd").write_text("---\ntitle: Intro QMD\n---\n\n# Intro\n")
 
-        # Create user_guide directory with mixed extensions and nesting
-        user_guide = project_path / "user_guide"
-        user_guide.mkdir()
+    # Top-level .md file
+    (user_guide / "setup.md").write_text("---\ntitle: Setup MD\n---\n\n# Setup\n")
 
-        # Top-level .qmd file
-        (user_guide / "intro.qmd").write_text("---\ntitle: Intro QMD\n---\n\n# Intro\n")
+    # One-level nested .qmd file
+    section1 = user_guide / "section1"
+    section1.mkdir()
+    (section1 / "overview.qmd").write_text("---\ntitle: Section 1 Overview\n---\n\n# Overview\n")
 
-        # Top-level .md file
-        (user_guide / "setup.md").write_text("---\ntitle: Setup MD\n---\n\n# Setup\n")
+    # One-level nested .md file
+    (section1 / "details.md").write_text("---\ntitle: Section 1 Details\n---\n\n# Details\n")
 
-        # One-level nested .qmd file
-        section1 = user_guide / "section1"
-        section1.mkdir()
-        (section1 / "overview.qmd").write_text(
-            "---\ntitle: Section 1 Overview\n---\n\n# Overview\n"
-        )
+    # Deeply nested .qmd file (2 levels)
+    topic = section1 / "topic1"
+    topic.mkdir()
+    (topic / "deep.qmd").write_text("---\ntitle: Deep Topic\n---\n\n# Deep Topic\n")
 
-        # One-level nested .md file
-        (section1 / "details.md").write_text("---\ntitle: Section 1 Details\n---\n\n# Details\n")
+    # Deeply nested .md file (2 levels)
+    (topic / "deep-notes.md").write_text("---\ntitle: Deep Notes\n---\n\n# Deep Notes\n")
 
-        # Deeply nested .qmd file (2 levels)
-        topic = section1 / "topic1"
-        topic.mkdir()
-        (topic / "deep.qmd").write_text("---\ntitle: Deep Topic\n---\n\n# Deep Topic\n")
+    docs = GreatDocs(project_path=str(minimal_project))
 
-        # Deeply nested .md file (2 levels)
-        (topic / "deep-notes.md").write_text("---\ntitle: Deep Notes\n---\n\n# Deep Notes\n")
+    # Discover user guide
+    user_guide_info = docs._discover_user_guide()
+    assert user_guide_info is not None
 
-        docs = GreatDocs(project_path=tmp_dir)
+    discovered_names = {f["path"].name for f in user_guide_info["files"]}
+
+    # All 6 files should be discovered regardless of extension or depth
+    assert "intro.qmd" in discovered_names
+    assert "setup.md" in discovered_names
+    assert "overview.qmd" in discovered_names
+    assert "details.md" in discovered_names
+    assert "deep.qmd" in discovered_names
+    assert "deep-notes.md" in discovered_names
+    assert len(user_guide_info["files"]) == 6
+
+    # Copy files and verify they end up in the right places
+    copied_files = docs._copy_user_guide_to_docs(user_guide_info)
+
+    assert len(copied_files) == 6
+
+    docs_ug = docs.project_path / "user-guide"
 
-        # Discover user guide
-        user_guide_info = docs._discover_user_guide()
-        assert user_guide_info is not None
+    # Top-level files
+    assert (docs_ug / "intro.qmd").exists()
+    assert (docs_ug / "setup.md").exists()
 
-        discovered_names = {f["path"].name for f in user_guide_info["files"]}
+    # One-level nested files
+    assert (docs_ug / "section1" / "overview.qmd").exists()
+    assert (docs_ug / "section1" / "details.md").exists()
 
-        # All 6 files should be discovered regardless of extension or depth
-        assert "intro.qmd" in discovered_names
-        assert "setup.md" in discovered_names
-        assert "overview.qmd" in discovered_names
-        assert "details.md" in discovered_names
-        assert "deep.qmd" in discovered_names
-        assert "deep-notes.md" in discovered_names
-        assert len(user_guide_info["files"]) == 6
+    # Deeply nested files
+    assert (docs_ug / "section1" / "topic1" / "deep.qmd").exists()
+    assert (docs_ug / "section1" / "topic1" / "deep-notes.md").exists()
 
-        # Copy files and verify they end up in the right places
-        copied_files = docs._copy_user_guide_to_docs(user_guide_info)
 
-        assert len(copied_files) == 6
+def test_discover_user_guide_reused_until_files_change(tmp_path):
+    """Test that user guide discovery is reused until a guide file is added or edited."""
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "test"\nversion = "0.1.0"')
+    user_guide = tmp_path / "user_guide"
+    user_guide.mkdir()
+    (user_guide / "01-intro.qmd").write_text("---\ntitle: Intro\n---\n\n# Intro\n")
 
-        docs_ug = docs.project_path / "user-guide"
+    docs = GreatDocs(project_path=str(tmp_path))
 
-        # Top-level files
-        assert (docs_ug / "intro.qmd").exists()
-        assert (docs_ug / "setup.md").exists()
+    with patch.object(docs, "_parse_user_guide_file", wraps=docs._parse_user_guide_file) as parse:
+        first = docs._discover_user_guide()
+        first["files"].clear()  # callers get their own copy
+        second = docs._discover_user_guide()
+        assert parse.call_count == 1
+        assert [f["title"] for f in second["files"]] == ["Intro"]
 
-        # One-level nested files
-        assert (docs_ug / "section1" / "overview.qmd").exists()
-        assert (docs_ug / "section1" / "details.md").exists()
+        (user_guide / "01-intro.qmd").write_text("---\ntitle: Introduction\n---\n\n# Intro\n")
+        (user_guide / "02-usage.qmd").write_text("---\ntitle: Usage\n---\n\n# Usage\n")
+        third = docs._discover_user_guide()
 
-        # Deeply nested files
-        assert (docs_ug / "section1" / "topic1" / "deep.qmd").exists()
-        assert (docs_ug / "section1" / "topic1" / "deep-notes.md").exists()
+    assert parse.call_count == 3
+    assert [f["title"] for f in third["files"]] == ["Introduction", "Usage"]
 
 
-def test_user_guide_sidebar_uses_clean_urls():
+def test_user_guide_sidebar_uses_clean_urls(tmp_path):
     """Test that the generated sidebar uses clean URLs without numeric prefixes."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
+    project_path = tmp_path
 
-        # Create minimal pyproject.toml
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
+    # Create minimal pyproject.toml
+    pyproject = project_path / "pyproject.toml"
+    pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
 
-        # Create user_guide directory with numbered files
-        user_guide = project_path / "user_guide"
-        user_guide.mkdir()
+    # Create user_guide directory with numbered files
+    user_guide = project_path / "user_guide"
+    user_guide.mkdir()
 
-        (user_guide / "00-introduction.qmd").write_text("""---
+    (user_guide / "00-introduction.qmd").write_text("""---
 title: Introduction
 guide-section: Getting Started
 ---
 # Introduction
 """)
-        (user_guide / "01-installation.qmd").write_text("""---
+    (user_guide / "01-installation.qmd").write_text("""---
 title: Installation
 guide-section: Getting Started
 ---
 # Installation
 """)
 
-        docs = GreatDocs(project_path=tmp_dir)
+    docs = GreatDocs(project_path=str(tmp_path))
 
-        # Discover and generate sidebar
-        user_guide_info = docs._discover_user_guide()
-        assert user_guide_info is not None
+    # Discover and generate sidebar
+    user_guide_info = docs._discover_user_guide()
+    assert user_guide_info is not None
 
-        sidebar_config = docs._generate_user_guide_sidebar(user_guide_info)
+    sidebar_config = docs._generate_user_guide_sidebar(user_guide_info)
 
-        # Check sidebar structure
-        assert sidebar_config["id"] == "user-guide"
-        assert sidebar_config["title"] == "User Guide"
+    # Check sidebar structure
+    assert sidebar_config["id"] == "user-guide"
+    assert sidebar_config["title"] == "User Guide"
 
-        # Find the contents and verify clean URLs
-        contents = sidebar_config["contents"]
-        assert len(contents) > 0
+    # Find the contents and verify clean URLs
+    contents = sidebar_config["contents"]
+    assert len(contents) > 0
 
-        # Flatten all hrefs from sections
-        all_hrefs = []
-        for item in contents:
-            if isinstance(item, dict) and "contents" in item:
-                for sub_item in item["contents"]:
-                    if isinstance(sub_item, str):
-                        all_hrefs.append(sub_item)
-                    elif isinstance(sub_item, dict):
-                        all_hrefs.append(sub_item.get("href", ""))
-            elif isinstance(item, str):
-                all_hrefs.append(item)
+    # Flatten all hrefs from sections
+    all_hrefs = []
+    for item in contents:
+        if isinstance(item, dict) and "contents" in item:
+            for sub_item in item["contents"]:
+                if isinstance(sub_item, str):
+                    all_hrefs.append(sub_item)
+                elif isinstance(sub_item, dict):
+                    all_hrefs.append(sub_item.get("href", ""))
+        elif isinstance(item, str):
+            all_hrefs.append(item)
 
-        # Verify clean URLs (no numeric prefixes)
-        assert "user-guide/introduction.qmd" in all_hrefs
-        assert "user-guide/installation.qmd" in all_hrefs
-        assert "user-guide/00-introduction.qmd" not in all_hrefs
-        assert "user-guide/01-installation.qmd" not in all_hrefs
+    # Verify clean URLs (no numeric prefixes)
+    assert "user-guide/introduction.qmd" in all_hrefs
+    assert "user-guide/installation.qmd" in all_hrefs
+    assert "user-guide/00-introduction.qmd" not in all_hrefs
+    assert "user-guide/01-installation.qmd" not in all_hrefs
 
 
-def test_copy_assets_basic():
+def test_copy_assets_basic(minimal_project):
     """Test that assets directory is copied to docs directory."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
-
-        # Create minimal pyproject.toml
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
-
-        # Create assets directory with files
-        assets = project_path / "assets"
-        assets.mkdir()
+    # Create assets directory with files
+    assets = minimal_project / "assets"
+    assets.mkdir()
 
-        (assets / "image.png").write_text("fake png content")
-        (assets / "style.css").write_text("body { color: red; }")
-        (assets / "data.json").write_text('{"key": "value"}')
+    (assets / "image.png").write_text("fake png content")
+    (assets / "style.css").write_text("body { color: red; }")
+    (assets / "data.json").write_text('{"key": "value"}')
 
-        docs = GreatDocs(project_path=tmp_dir)
+    docs = GreatDocs(project_path=str(minimal_project))
 
-        # Copy assets
-        result = docs._copy_assets()
+    # Copy assets
+    result = docs._copy_assets()
 
-        # Check that method returns True
-        assert result is True
+    # Check that method returns True
+    assert result is True
 
-        # Check that files were copied
-        docs_assets = docs.project_path / "assets"
+    # Check that files were copied
+    docs_assets = docs.project_path / "assets"
 
-        assert docs_assets.exists()
-        assert (docs_assets / "image.png").exists()
-        assert (docs_assets / "style.css").exists()
-        assert (docs_assets / "data.json").exists()
+    assert docs_assets.exists()
+    assert (docs_assets / "image.png").exists()
+    assert (docs_assets / "style.css").exists()
+    assert (docs_assets / "data.json").exists()
 
-        # Verify content
-        assert (docs_assets / "image.png").read_text() == "fake png content"
-        assert (docs_assets / "style.css").read_text() == "body { color: red; }"
-        assert (docs_assets / "data.json").read_text() == '{"key": "value"}'
+    # Verify content
+    assert (docs_assets / "image.png").read_text() == "fake png content"
+    assert (docs_assets / "style.css").read_text() == "body { color: red; }"
+    assert (docs_assets / "data.json").read_text() == '{"key": "value"}'
 
 
-def test_copy_assets_nested_directories():
+def test_copy_assets_nested_directories(minimal_project):
     """Test that nested asset directories are copied correctly."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
+    # Create assets directory with nested structure
+    assets = minimal_project / "assets"
+    (assets / "images" / "icons").mkdir(parents=True)
+    (assets / "css").mkdir()
+    (assets / "js").mkdir()
 
-        # Create minimal pyproject.toml
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
-
-        # Create assets directory with nested structure
-        assets = project_path / "assets"
-        (assets / "images" / "icons").mkdir(parents=True)
-        (assets / "css").mkdir()
-        (assets / "js").mkdir()
+    (assets / "images" / "logo.png").write_text("logo")
+    (assets / "images" / "icons" / "star.svg").write_text("<svg>star</svg>")
+    (assets / "css" / "theme.css").write_text("/* theme */")
+    (assets / "js" / "app.js").write_text("console.log('app');")
 
-        (assets / "images" / "logo.png").write_text("logo")
-        (assets / "images" / "icons" / "star.svg").write_text("<svg>star</svg>")
-        (assets / "css" / "theme.css").write_text("/* theme */")
-        (assets / "js" / "app.js").write_text("console.log('app');")
+    docs = GreatDocs(project_path=str(minimal_project))
 
-        docs = GreatDocs(project_path=tmp_dir)
-
-        # Copy assets
-        result = docs._copy_assets()
+    # Copy assets
+    result = docs._copy_assets()
 
-        assert result is True
+    assert result is True
 
-        # Check nested structure was preserved
-        docs_assets = docs.project_path / "assets"
+    # Check nested structure was preserved
+    docs_assets = docs.project_path / "assets"
 
-        assert (docs_assets / "images" / "logo.png").exists()
-        assert (docs_assets / "images" / "icons" / "star.svg").exists()
-        assert (docs_assets / "css" / "theme.css").exists()
-        assert (docs_assets / "js" / "app.js").exists()
+    assert (docs_assets / "images" / "logo.png").exists()
+    assert (docs_assets / "images" / "icons" / "star.svg").exists()
+    assert (docs_assets / "css" / "theme.css").exists()
+    assert (docs_assets / "js" / "app.js").exists()
 
-        # Verify content
-        assert (docs_assets / "images" / "icons" / "star.svg").read_text() == "<svg>star</svg>"
+    # Verify content
+    assert (docs_assets / "images" / "icons" / "star.svg").read_text() == "<svg>star</svg>"
 
 
-def test_copy_assets_no_directory():
+def test_copy_assets_no_directory(minimal_project):
     """Test that _copy_assets returns False when no assets directory exists."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
-
-        # Create minimal pyproject.toml
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
-
-        docs = GreatDocs(project_path=tmp_dir)
+    docs = GreatDocs(project_path=str(minimal_project))
 
-        # Try to copy assets when none exist
-        result = docs._copy_assets()
+    # Try to copy assets when none exist
+    result = docs._copy_assets()
 
-        # Should return False
-        assert result is False
+    # Should return False
+    assert result is False
 
-        # Assets directory should not exist in docs
-        docs_assets = docs.project_path / "assets"
-        assert not docs_assets.exists()
+    # Assets directory should not exist in docs
+    docs_assets = docs.project_path / "assets"
+    assert not docs_assets.exists()
 
 
-def test_copy_assets_replaces_existing():
+def test_copy_assets_replaces_existing(minimal_project):
     """Test that copying assets replaces existing assets directory."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
+    # Create assets directory
+    assets = minimal_project / "assets"
+    assets.mkdir()
+    (assets / "new_file.txt").write_text("new content")
 
-        # Create minimal pyproject.toml
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
+    docs = GreatDocs(project_path=str(minimal_project))
 
-        # Create assets directory
-        assets = project_path / "assets"
-        assets.mkdir()
-        (assets / "new_file.txt").write_text("new content")
-
-        docs = GreatDocs(project_path=tmp_dir)
+    # Create existing assets in docs directory
+    docs_assets = docs.project_path / "assets"
+    docs_assets.mkdir(parents=True)
+    (docs_assets / "old_file.txt").write_text("old content")
 
-        # Create existing assets in docs directory
-        docs_assets = docs.project_path / "assets"
-        docs_assets.mkdir(parents=True)
-        (docs_assets / "old_file.txt").write_text("old content")
+    # Copy assets
+    result = docs._copy_assets()
 
-        # Copy assets
-        result = docs._copy_assets()
+    assert result is True
 
-        assert result is True
+    # Check that old file was removed and new file exists
+    assert not (docs_assets / "old_file.txt").exists()
+    assert (docs_assets / "new_file.txt").exists()
+    assert (docs_assets / "new_file.txt").read_text() == "new content"
 
-        # Check that old file was removed and new file exists
-        assert not (docs_assets / "old_file.txt").exists()
-        assert (docs_assets / "new_file.txt").exists()
-        assert (docs_assets / "new_file.txt").read_text() == "new content"
 
+def test_copy_assets_keeps_directory_metadata(minimal_project):
+    """Test that copied directories keep their mtimes once all file copies have finished."""
+    assets = minimal_project / "assets"
+    (assets / "images").mkdir(parents=True)
+    for i in range(20):
+        (assets / "images" / f"img{i}.png").write_bytes(b"x" * 1024)
+    os.utime(assets / "images", (1_000_000_000, 1_000_000_000))
+    os.utime(assets, (1_000_000_000, 1_000_000_000))
 
-def test_assets_added_to_quarto_config():
-    """Test that assets directory is added to Quarto config resources."""
+    docs = GreatDocs(project_path=str(minimal_project))
+    assert docs._copy_assets() is True
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
+    docs_assets = docs.project_path / "assets"
+    assert len(list((docs_assets / "images").iterdir())) == 20
+    assert (docs_assets / "images").stat().st_mtime == 1_000_000_000
+    assert docs_assets.stat().st_mtime == 1_000_000_000
 
-        # Create minimal pyproject.toml
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
 
-        # Create assets directory
-        assets = project_path / "assets"
-        assets.mkdir()
-        (assets / "test.txt").write_text("test")
+def test_copy_assets_failed_copy_removes_staging_dir(minimal_project):
+    """Test that a failing file copy leaves the existing assets and no staging directory."""
+    assets = minimal_project / "assets"
+    (assets / "sub").mkdir(parents=True)
+    (assets / "good.txt").write_text("good")
+    (assets / "sub" / "bad.txt").write_text("bad")
 
-        docs = GreatDocs(project_path=tmp_dir)
+    docs = GreatDocs(project_path=str(minimal_project))
+    docs_assets = docs.project_path / "assets"
+    docs_assets.mkdir(parents=True)
+    (docs_assets / "old_file.txt").write_text("old content")
 
-        # Copy assets first
-        docs._copy_assets()
+    real_copy2 = shutil.copy2
 
-        # Update Quarto config
-        docs._update_quarto_config()
+    def failing_copy2(src, dst, *args, **kwargs):
+        if Path(src).name == "bad.txt":
+            raise OSError("disk full")
+        return real_copy2(src, dst, *args, **kwargs)
 
-        # Read the generated _quarto.yml
-        quarto_yml = docs.project_path / "_quarto.yml"
-        assert quarto_yml.exists()
+    with patch("shutil.copy2", side_effect=failing_copy2):
+        with pytest.raises(OSError, match="disk full"):
+            docs._copy_assets()
 
-        with open(quarto_yml, "r") as f:
-            config = read_yaml(f)
+    assert not docs_assets.with_name("assets.new").exists()
+    assert (docs_assets / "old_file.txt").read_text() == "old content"
 
-        # Check that assets/** is in resources
-        assert "project" in config
-        assert "resources" in config["project"]
-        assert "assets/**" in config["project"]["resources"]
 
+def test_assets_added_to_quarto_config(minimal_project):
+    """Test that assets directory is added to Quarto config resources."""
 
-def test_assets_not_added_to_quarto_config_when_missing():
-    """Test that assets/** is not added to Quarto config when assets don't exist."""
+    # Create assets directory
+    assets = minimal_project / "assets"
+    assets.mkdir()
+    (assets / "test.txt").write_text("test")
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
+    docs = GreatDocs(project_path=str(minimal_project))
 
-        # Create minimal pyproject.toml
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
+    # Copy assets first
+    docs._copy_assets()
 
-        docs = GreatDocs(project_path=tmp_dir)
+    # Update Quarto config
+    docs._update_quarto_config()
 
-        # Create great-docs directory (required for _quarto.yml)
-        docs.project_path.mkdir(parents=True, exist_ok=True)
+    # Read the generated _quarto.yml
+    quarto_yml = docs.project_path / "_quarto.yml"
+    assert quarto_yml.exists()
 
-        # Update Quarto config without assets
-        docs._update_quarto_config()
+    with open(quarto_yml, "r") as f:
+        config = read_yaml(f)
 
-        # Read the generated _quarto.yml
-        quarto_yml = docs.project_path / "_quarto.yml"
+    # Check that assets/** is in resources
+    assert "project" in config
+    assert "resources" in config["project"]
+    assert "assets/**" in config["project"]["resources"]
 
-        assert quarto_yml.exists()
 
-        with open(quarto_yml, "r") as f:
-            config = read_yaml(f)
+def test_assets_not_added_to_quarto_config_when_missing(minimal_project):
+    """Test that assets/** is not added to Quarto config when assets don't exist."""
 
-        # Check that assets/** is NOT in resources
-        assert "project" in config
-        assert "resources" in config["project"]
-        assert "assets/**" not in config["project"]["resources"]
+    docs = GreatDocs(project_path=str(minimal_project))
 
+    # Create great-docs directory (required for _quarto.yml)
+    docs.project_path.mkdir(parents=True, exist_ok=True)
 
-def test_assets_added_to_config_after_copy():
-    """Test that _update_quarto_config() adds assets/** after copying assets."""
+    # Update Quarto config without assets
+    docs._update_quarto_config()
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
+    # Read the generated _quarto.yml
+    quarto_yml = docs.project_path / "_quarto.yml"
 
-        # Create minimal pyproject.toml
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
+    assert quarto_yml.exists()
 
-        # Create assets directory
-        assets = project_path / "assets"
-        assets.mkdir()
-        (assets / "image.png").write_text("fake image")
+    with open(quarto_yml, "r") as f:
+        config = read_yaml(f)
 
-        docs = GreatDocs(project_path=tmp_dir)
+    # Check that assets/** is NOT in resources
+    assert "project" in config
+    assert "resources" in config["project"]
+    assert "assets/**" not in config["project"]["resources"]
 
-        # Create great-docs directory and initial config (simulating _prepare_build_directory)
-        docs.project_path.mkdir(parents=True, exist_ok=True)
-        docs._update_quarto_config()
 
-        # Read initial config - should NOT have assets/**
-        quarto_yml = docs.project_path / "_quarto.yml"
-        with open(quarto_yml, "r") as f:
-            initial_config = read_yaml(f)
+def test_assets_added_to_config_after_copy(minimal_project):
+    """Test that _update_quarto_config() adds assets/** after copying assets."""
 
-        assert "assets/**" not in initial_config["project"]["resources"]
+    # Create assets directory
+    assets = minimal_project / "assets"
+    assets.mkdir()
+    (assets / "image.png").write_text("fake image")
 
-        # Now copy assets and update config again (simulating build flow)
-        assets_copied = docs._copy_assets()
+    docs = GreatDocs(project_path=str(minimal_project))
 
-        assert assets_copied is True
+    # Create great-docs directory and initial config (simulating _prepare_build_directory)
+    docs.project_path.mkdir(parents=True, exist_ok=True)
+    docs._update_quarto_config()
 
-        docs._update_quarto_config()
+    # Read initial config - should NOT have assets/**
+    quarto_yml = docs.project_path / "_quarto.yml"
+    with open(quarto_yml, "r") as f:
+        initial_config = read_yaml(f)
 
-        # Read updated config - should NOW have assets/**
-        with open(quarto_yml, "r") as f:
-            updated_config = read_yaml(f)
+    assert "assets/**" not in initial_config["project"]["resources"]
 
-        assert "project" in updated_config
-        assert "resources" in updated_config["project"]
-        assert "assets/**" in updated_config["project"]["resources"]
+    # Now copy assets and update config again (simulating build flow)
+    assets_copied = docs._copy_assets()
 
+    assert assets_copied is True
 
-def test_assets_config_update_only_when_copied():
-    """Test that config is updated conditionally based on whether assets were copied."""
+    docs._update_quarto_config()
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
+    # Read updated config - should NOW have assets/**
+    with open(quarto_yml, "r") as f:
+        updated_config = read_yaml(f)
 
-        # Create minimal pyproject.toml
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
+    assert "project" in updated_config
+    assert "resources" in updated_config["project"]
+    assert "assets/**" in updated_config["project"]["resources"]
 
-        docs = GreatDocs(project_path=tmp_dir)
 
-        # Create great-docs directory and initial config
-        docs.project_path.mkdir(parents=True, exist_ok=True)
-        docs._update_quarto_config()
+def test_assets_config_update_only_when_copied(minimal_project):
+    """Test that config is updated conditionally based on whether assets were copied."""
 
-        # Try to copy assets when none exist: should return False
-        assets_copied = docs._copy_assets()
+    docs = GreatDocs(project_path=str(minimal_project))
 
-        assert assets_copied is False
+    # Create great-docs directory and initial config
+    docs.project_path.mkdir(parents=True, exist_ok=True)
+    docs._update_quarto_config()
 
-        # Config should still not have assets/** since copy returned False
-        quarto_yml = docs.project_path / "_quarto.yml"
-        with open(quarto_yml, "r") as f:
-            config = read_yaml(f)
+    # Try to copy assets when none exist: should return False
+    assets_copied = docs._copy_assets()
 
-        assert "assets/**" not in config["project"]["resources"]
+    assert assets_copied is False
 
+    # Config should still not have assets/** since copy returned False
+    quarto_yml = docs.project_path / "_quarto.yml"
+    with open(quarto_yml, "r") as f:
+        config = read_yaml(f)
 
-def test_user_guide_config_option_overrides_default_dir():
-    """Test that user_guide config option takes precedence over user_guide/ directory."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
+    assert "assets/**" not in config["project"]["resources"]
 
-        # Create minimal pyproject.toml
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
 
-        # Create conventional user_guide/ directory with a file
-        conventional_dir = project_path / "user_guide"
-        conventional_dir.mkdir()
-        (conventional_dir / "00-from-default.qmd").write_text(
-            "---\ntitle: From Default\n---\n# Default\n"
-        )
+def test_user_guide_config_option_overrides_default_dir(minimal_project):
+    """Test that user_guide config option takes precedence over user_guide/ directory."""
+    # Create conventional user_guide/ directory with a file
+    conventional_dir = minimal_project / "user_guide"
+    conventional_dir.mkdir()
+    (conventional_dir / "00-from-default.qmd").write_text(
+        "---\ntitle: From Default\n---\n# Default\n"
+    )
 
-        # Create custom directory with a different file
-        custom_dir = project_path / "docs" / "guides"
-        custom_dir.mkdir(parents=True)
-        (custom_dir / "00-from-custom.qmd").write_text("---\ntitle: From Custom\n---\n# Custom\n")
+    # Create custom directory with a different file
+    custom_dir = minimal_project / "docs" / "guides"
+    custom_dir.mkdir(parents=True)
+    (custom_dir / "00-from-custom.qmd").write_text("---\ntitle: From Custom\n---\n# Custom\n")
 
-        # Configure great-docs.yml to use the custom path
-        config_path = project_path / "great-docs.yml"
-        config_path.write_text("user_guide: docs/guides\n")
+    # Configure great-docs.yml to use the custom path
+    config_path = minimal_project / "great-docs.yml"
+    config_path.write_text("user_guide: docs/guides\n")
 
-        docs = GreatDocs(project_path=tmp_dir)
-        user_guide_info = docs._discover_user_guide()
+    docs = GreatDocs(project_path=str(minimal_project))
+    user_guide_info = docs._discover_user_guide()
 
-        assert user_guide_info is not None
-        assert len(user_guide_info["files"]) == 1
-        assert user_guide_info["files"][0]["title"] == "From Custom"
-        assert user_guide_info["source_dir"] == custom_dir.resolve()
+    assert user_guide_info is not None
+    assert len(user_guide_info["files"]) == 1
+    assert user_guide_info["files"][0]["title"] == "From Custom"
+    assert user_guide_info["source_dir"] == custom_dir.resolve()
 
 
-def test_user_guide_config_option_custom_directory():
+def test_user_guide_config_option_custom_directory(tmp_path):
     """Test that user_guide config option works with a subdirectory path."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
+    project_path = tmp_path
 
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
+    pyproject = project_path / "pyproject.toml"
+    pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
 
-        # Create a nested custom directory
-        custom_dir = project_path / "content" / "user-docs"
-        custom_dir.mkdir(parents=True)
-        (custom_dir / "intro.qmd").write_text("---\ntitle: Intro\n---\n# Intro\n")
+    # Create a nested custom directory
+    custom_dir = project_path / "content" / "user-docs"
+    custom_dir.mkdir(parents=True)
+    (custom_dir / "intro.qmd").write_text("---\ntitle: Intro\n---\n# Intro\n")
 
-        config_path = project_path / "great-docs.yml"
-        config_path.write_text("user_guide: content/user-docs\n")
+    config_path = project_path / "great-docs.yml"
+    config_path.write_text("user_guide: content/user-docs\n")
 
-        docs = GreatDocs(project_path=tmp_dir)
-        user_guide_info = docs._discover_user_guide()
+    docs = GreatDocs(project_path=str(tmp_path))
+    user_guide_info = docs._discover_user_guide()
 
-        assert user_guide_info is not None
-        assert len(user_guide_info["files"]) == 1
-        assert user_guide_info["source_dir"] == custom_dir.resolve()
+    assert user_guide_info is not None
+    assert len(user_guide_info["files"]) == 1
+    assert user_guide_info["source_dir"] == custom_dir.resolve()
 
 
-def test_user_guide_config_option_nonexistent_dir(capsys):
+def test_user_guide_config_option_nonexistent_dir(tmp_path, capsys):
     """Test warning when user_guide config points to a nonexistent directory."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
+    project_path = tmp_path
 
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
+    pyproject = project_path / "pyproject.toml"
+    pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
 
-        config_path = project_path / "great-docs.yml"
-        config_path.write_text("user_guide: nonexistent/dir\n")
+    config_path = project_path / "great-docs.yml"
+    config_path.write_text("user_guide: nonexistent/dir\n")
 
-        docs = GreatDocs(project_path=tmp_dir)
-        result = docs._discover_user_guide()
+    docs = GreatDocs(project_path=str(tmp_path))
+    result = docs._discover_user_guide()
 
-        assert result is None
+    assert result is None
 
-        captured = capsys.readouterr()
+    captured = capsys.readouterr()
 
-        assert "does not exist" in captured.out
+    assert "does not exist" in captured.out
 
 
-def test_user_guide_warns_on_empty_directory(capsys):
+def test_user_guide_warns_on_empty_directory(tmp_path, capsys):
     """Test warning when user guide directory is empty."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
+    project_path = tmp_path
 
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
+    pyproject = project_path / "pyproject.toml"
+    pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
 
-        # Create empty user_guide directory
-        empty_dir = project_path / "user_guide"
-        empty_dir.mkdir()
+    # Create empty user_guide directory
+    empty_dir = project_path / "user_guide"
+    empty_dir.mkdir()
 
-        docs = GreatDocs(project_path=tmp_dir)
-        result = docs._discover_user_guide()
+    docs = GreatDocs(project_path=str(tmp_path))
+    result = docs._discover_user_guide()
 
-        assert result is None
+    assert result is None
 
-        captured = capsys.readouterr()
+    captured = capsys.readouterr()
 
-        assert "is empty" in captured.out
+    assert "is empty" in captured.out
 
 
-def test_user_guide_warns_on_no_guide_files(capsys):
+def test_user_guide_warns_on_no_guide_files(tmp_path, capsys):
     """Test warning when user guide directory has no .qmd or .md files."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
+    project_path = tmp_path
 
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
+    pyproject = project_path / "pyproject.toml"
+    pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
 
-        # Create user_guide directory with only non-guide files
-        ug_dir = project_path / "user_guide"
-        ug_dir.mkdir()
-        (ug_dir / "notes.txt").write_text("just a text file")
-        (ug_dir / "data.csv").write_text("a,b,c")
+    # Create user_guide directory with only non-guide files
+    ug_dir = project_path / "user_guide"
+    ug_dir.mkdir()
+    (ug_dir / "notes.txt").write_text("just a text file")
+    (ug_dir / "data.csv").write_text("a,b,c")
 
-        docs = GreatDocs(project_path=tmp_dir)
-        result = docs._discover_user_guide()
+    docs = GreatDocs(project_path=str(tmp_path))
+    result = docs._discover_user_guide()
 
-        assert result is None
+    assert result is None
 
-        captured = capsys.readouterr()
+    captured = capsys.readouterr()
 
-        assert "contains no .qmd or .md files" in captured.out
+    assert "contains no .qmd or .md files" in captured.out
 
 
-def test_user_guide_config_warns_when_both_exist(capsys):
+def test_user_guide_config_warns_when_both_exist(tmp_path, capsys):
     """Test warning when both config option and conventional directory exist."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
+    project_path = tmp_path
 
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
+    pyproject = project_path / "pyproject.toml"
+    pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
 
-        # Create conventional user_guide/ directory
-        conventional_dir = project_path / "user_guide"
-        conventional_dir.mkdir()
-        (conventional_dir / "default.qmd").write_text("---\ntitle: Default\n---\n# Default\n")
+    # Create conventional user_guide/ directory
+    conventional_dir = project_path / "user_guide"
+    conventional_dir.mkdir()
+    (conventional_dir / "default.qmd").write_text("---\ntitle: Default\n---\n# Default\n")
 
-        # Create custom directory
-        custom_dir = project_path / "my_guides"
-        custom_dir.mkdir()
-        (custom_dir / "custom.qmd").write_text("---\ntitle: Custom\n---\n# Custom\n")
+    # Create custom directory
+    custom_dir = project_path / "my_guides"
+    custom_dir.mkdir()
+    (custom_dir / "custom.qmd").write_text("---\ntitle: Custom\n---\n# Custom\n")
 
-        config_path = project_path / "great-docs.yml"
-        config_path.write_text("user_guide: my_guides\n")
+    config_path = project_path / "great-docs.yml"
+    config_path.write_text("user_guide: my_guides\n")
 
-        docs = GreatDocs(project_path=tmp_dir)
-        user_guide_info = docs._discover_user_guide()
+    docs = GreatDocs(project_path=str(tmp_path))
+    user_guide_info = docs._discover_user_guide()
 
-        assert user_guide_info is not None
+    assert user_guide_info is not None
 
-        # Config option should win
-        assert user_guide_info["source_dir"] == custom_dir.resolve()
+    # Config option should win
+    assert user_guide_info["source_dir"] == custom_dir.resolve()
 
-        captured = capsys.readouterr()
+    captured = capsys.readouterr()
 
-        assert "using configured path" in captured.out
+    assert "using configured path" in captured.out
 
 
-def test_user_guide_fallback_without_config():
+def test_user_guide_fallback_without_config(tmp_path):
     """Test that default user_guide/ directory is used when no config option is set."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
+    project_path = tmp_path
 
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
+    pyproject = project_path / "pyproject.toml"
+    pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
 
-        # Create conventional user_guide/ directory
-        ug_dir = project_path / "user_guide"
-        ug_dir.mkdir()
-        (ug_dir / "intro.qmd").write_text("---\ntitle: Intro\n---\n# Intro\n")
+    # Create conventional user_guide/ directory
+    ug_dir = project_path / "user_guide"
+    ug_dir.mkdir()
+    (ug_dir / "intro.qmd").write_text("---\ntitle: Intro\n---\n# Intro\n")
 
-        # No great-docs.yml or one without user_guide key
-        config_path = project_path / "great-docs.yml"
-        config_path.write_text("display_name: Test\n")
+    # No great-docs.yml or one without user_guide key
+    config_path = project_path / "great-docs.yml"
+    config_path.write_text("display_name: Test\n")
 
-        docs = GreatDocs(project_path=tmp_dir)
-        user_guide_info = docs._discover_user_guide()
+    docs = GreatDocs(project_path=str(tmp_path))
+    user_guide_info = docs._discover_user_guide()
 
-        assert user_guide_info is not None
-        assert user_guide_info["source_dir"] == ug_dir.resolve()
+    assert user_guide_info is not None
+    assert user_guide_info["source_dir"] == ug_dir.resolve()
 
 
-def test_user_guide_config_empty_dir_warns(capsys):
+def test_user_guide_config_empty_dir_warns(tmp_path, capsys):
     """Test warning when user_guide config points to an empty directory."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
+    project_path = tmp_path
 
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
+    pyproject = project_path / "pyproject.toml"
+    pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
 
-        empty_dir = project_path / "empty_guides"
-        empty_dir.mkdir()
+    empty_dir = project_path / "empty_guides"
+    empty_dir.mkdir()
 
-        config_path = project_path / "great-docs.yml"
-        config_path.write_text("user_guide: empty_guides\n")
+    config_path = project_path / "great-docs.yml"
+    config_path.write_text("user_guide: empty_guides\n")
 
-        docs = GreatDocs(project_path=tmp_dir)
-        result = docs._discover_user_guide()
+    docs = GreatDocs(project_path=str(tmp_path))
+    result = docs._discover_user_guide()
 
-        assert result is None
+    assert result is None
 
-        captured = capsys.readouterr()
+    captured = capsys.readouterr()
 
-        assert "is empty" in captured.out
+    assert "is empty" in captured.out
 
 
 def test_copy_user_guide_files_uses_config():
@@ -3365,31 +3364,55 @@ def test_copy_user_guide_files_uses_config():
         assert (dest / "guide.md").exists()
 
 
-def test_user_guide_explicit_config_discovery():
-    """Test that explicit user_guide config (list) discovers files correctly."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
+@pytest.fixture(scope="module")
+def explicit_ug_project(tmp_path_factory):
+    """
+    A project with a `user_guide/` directory holding every page the explicit-config tests use.
 
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
+    The pages are written once per module; each test only writes its own `great-docs.yml`, and
+    explicit configs pick up nothing but the files they list.
+    """
+    project_path = tmp_path_factory.mktemp("explicit_ug")
+    (project_path / "pyproject.toml").write_text('[project]\nname = "test"\nversion = "0.1.0"')
+
+    user_guide = project_path / "user_guide"
+    user_guide.mkdir()
+
+    pages = {
+        "index.qmd": "---\ntitle: Welcome\n---\n# Welcome\n",
+        "quickstart.qmd": "---\ntitle: Quick Start\n---\n# Quick Start\n",
+        "installation.qmd": "---\ntitle: Installation\n---\n# Installation\n",
+        "advanced.qmd": "---\ntitle: Advanced Topics\n---\n# Advanced\n",
+        # Names that would sort differently alphabetically
+        "zebra.qmd": "---\ntitle: Zebra\n---\n# Zebra\n",
+        "apple.qmd": "---\ntitle: Apple\n---\n# Apple\n",
+        "mango.qmd": "---\ntitle: Mango\n---\n# Mango\n",
+        # Numeric prefixes (kept as-is in explicit mode)
+        "01-intro.qmd": "---\ntitle: Intro\n---\n# Intro\n",
+        "02-setup.qmd": "---\ntitle: Setup\n---\n# Setup\n",
+        "exists.qmd": "---\ntitle: Exists\n---\n# Exists\n",
+        # Has a guide-section in frontmatter that the config will override
+        "intro.qmd": "---\ntitle: Intro\nguide-section: Old Section\n---\n# Intro\n",
+        "page.qmd": "---\ntitle: Page\n---\n# Page\n",
+    }
+    for name, content in pages.items():
+        (user_guide / name).write_text(content)
 
-        # Create user_guide directory with files (no numeric prefixes)
-        user_guide = project_path / "user_guide"
-        user_guide.mkdir()
+    return project_path
 
-        (user_guide / "index.qmd").write_text("---\ntitle: Welcome\n---\n# Welcome\n")
-        (user_guide / "quickstart.qmd").write_text("---\ntitle: Quick Start\n---\n# Quick Start\n")
-        (user_guide / "installation.qmd").write_text(
-            "---\ntitle: Installation\n---\n# Installation\n"
-        )
-        (user_guide / "advanced.qmd").write_text("---\ntitle: Advanced Topics\n---\n# Advanced\n")
 
-        # Write config with explicit ordering
-        config_path = project_path / "great-docs.yml"
-        config_path.write_text("""user_guide:
+@pytest.fixture(scope="module")
+def explicit_ug_discovered(explicit_ug_project):
+    """
+    A `GreatDocs` instance and its discovered user guide for a two-section explicit config.
+
+    Discovery runs once per module; tests taking this fixture only read the result.
+    """
+    # Write config with explicit ordering
+    (explicit_ug_project / "great-docs.yml").write_text("""user_guide:
   - section: "Get Started"
     contents:
-      - text: "Welcome"
+      - text: "Welcome to Package"
         href: index.qmd
       - quickstart.qmd
       - installation.qmd
@@ -3398,37 +3421,27 @@ def test_user_guide_explicit_config_discovery():
       - advanced.qmd
 """)
 
-        docs = GreatDocs(project_path=tmp_dir)
-        result = docs._discover_user_guide()
-
-        assert result is not None
-        assert result["explicit"] is True
-        assert len(result["files"]) == 4
-        assert result["has_index"] is True
-        assert "Get Started" in result["sections"]
-        assert "Advanced" in result["sections"]
-        assert len(result["sections"]["Get Started"]) == 3
-        assert len(result["sections"]["Advanced"]) == 1
-
+    docs = GreatDocs(project_path=str(explicit_ug_project))
+    return docs, docs._discover_user_guide()
 
-def test_user_guide_explicit_config_preserves_order():
-    """Test that explicit config preserves file ordering as specified."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
 
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
+def test_user_guide_explicit_config_discovery(explicit_ug_discovered):
+    """Test that explicit user_guide config (list) discovers files correctly."""
+    _, result = explicit_ug_discovered
 
-        user_guide = project_path / "user_guide"
-        user_guide.mkdir()
+    assert result is not None
+    assert result["explicit"] is True
+    assert len(result["files"]) == 4
+    assert result["has_index"] is True
+    assert "Get Started" in result["sections"]
+    assert "Advanced" in result["sections"]
+    assert len(result["sections"]["Get Started"]) == 3
+    assert len(result["sections"]["Advanced"]) == 1
 
-        # Create files that would sort differently alphabetically
-        (user_guide / "zebra.qmd").write_text("---\ntitle: Zebra\n---\n# Zebra\n")
-        (user_guide / "apple.qmd").write_text("---\ntitle: Apple\n---\n# Apple\n")
-        (user_guide / "mango.qmd").write_text("---\ntitle: Mango\n---\n# Mango\n")
 
-        config_path = project_path / "great-docs.yml"
-        config_path.write_text("""user_guide:
+def test_user_guide_explicit_config_preserves_order(explicit_ug_project):
+    """Test that explicit config preserves file ordering as specified."""
+    (explicit_ug_project / "great-docs.yml").write_text("""user_guide:
   - section: "Fruits"
     contents:
       - zebra.qmd
@@ -3436,612 +3449,502 @@ def test_user_guide_explicit_config_preserves_order():
       - mango.qmd
 """)
 
-        docs = GreatDocs(project_path=tmp_dir)
-        result = docs._discover_user_guide()
+    docs = GreatDocs(project_path=str(explicit_ug_project))
+    result = docs._discover_user_guide()
 
-        # Files should be in config order, not alphabetical
-        assert result["files"][0]["path"].name == "zebra.qmd"
-        assert result["files"][1]["path"].name == "apple.qmd"
-        assert result["files"][2]["path"].name == "mango.qmd"
+    # Files should be in config order, not alphabetical
+    assert result["files"][0]["path"].name == "zebra.qmd"
+    assert result["files"][1]["path"].name == "apple.qmd"
+    assert result["files"][2]["path"].name == "mango.qmd"
 
 
-def test_user_guide_explicit_config_sidebar_generation():
+def test_user_guide_explicit_config_sidebar_generation(explicit_ug_discovered):
     """Test sidebar generation from explicit config."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
-
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
+    docs, user_guide_info = explicit_ug_discovered
+    sidebar = docs._generate_user_guide_sidebar(user_guide_info)
 
-        user_guide = project_path / "user_guide"
-        user_guide.mkdir()
+    assert sidebar["id"] == "user-guide"
+    assert sidebar["title"] == "User Guide"
+    assert len(sidebar["contents"]) == 2
 
-        (user_guide / "index.qmd").write_text("---\ntitle: Welcome\n---\n# Welcome\n")
-        (user_guide / "quickstart.qmd").write_text("---\ntitle: Quick Start\n---\n# Quick Start\n")
-        (user_guide / "installation.qmd").write_text(
-            "---\ntitle: Installation\n---\n# Installation\n"
-        )
-        (user_guide / "advanced.qmd").write_text("---\ntitle: Advanced\n---\n# Advanced\n")
+    # Check first section
+    section1 = sidebar["contents"][0]
 
-        config_path = project_path / "great-docs.yml"
-        config_path.write_text("""user_guide:
-  - section: "Get Started"
-    contents:
-      - text: "Welcome to Package"
-        href: index.qmd
-      - quickstart.qmd
-      - installation.qmd
-  - section: "Advanced"
-    contents:
-      - advanced.qmd
-""")
+    assert section1["section"] == "Get Started"
+    assert len(section1["contents"]) == 3
 
-        docs = GreatDocs(project_path=tmp_dir)
-        user_guide_info = docs._discover_user_guide()
-        sidebar = docs._generate_user_guide_sidebar(user_guide_info)
-
-        assert sidebar["id"] == "user-guide"
-        assert sidebar["title"] == "User Guide"
-        assert len(sidebar["contents"]) == 2
-
-        # Check first section
-        section1 = sidebar["contents"][0]
-
-        assert section1["section"] == "Get Started"
-        assert len(section1["contents"]) == 3
-
-        # First item has custom text
-        assert section1["contents"][0] == {
-            "text": "Welcome to Package",
-            "href": "user-guide/index.qmd",
-        }
+    # First item has custom text
+    assert section1["contents"][0] == {
+        "text": "Welcome to Package",
+        "href": "user-guide/index.qmd",
+    }
 
-        # Other items are plain hrefs
-        assert section1["contents"][1] == "user-guide/quickstart.qmd"
-        assert section1["contents"][2] == "user-guide/installation.qmd"
+    # Other items are plain hrefs
+    assert section1["contents"][1] == "user-guide/quickstart.qmd"
+    assert section1["contents"][2] == "user-guide/installation.qmd"
 
-        # Check second section
-        section2 = sidebar["contents"][1]
+    # Check second section
+    section2 = sidebar["contents"][1]
 
-        assert section2["section"] == "Advanced"
-        assert section2["contents"] == ["user-guide/advanced.qmd"]
+    assert section2["section"] == "Advanced"
+    assert section2["contents"] == ["user-guide/advanced.qmd"]
 
 
-def test_user_guide_explicit_config_no_prefix_stripping():
+def test_user_guide_explicit_config_no_prefix_stripping(explicit_ug_project):
     """Test that explicit config does NOT strip numeric prefixes from filenames."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
-
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
-
-        user_guide = project_path / "user_guide"
-        user_guide.mkdir()
-
-        # Files WITH numeric prefixes (user chose to keep them)
-        (user_guide / "01-intro.qmd").write_text("---\ntitle: Intro\n---\n# Intro\n")
-        (user_guide / "02-setup.qmd").write_text("---\ntitle: Setup\n---\n# Setup\n")
-
-        config_path = project_path / "great-docs.yml"
-        config_path.write_text("""user_guide:
+    # Files WITH numeric prefixes (user chose to keep them)
+    (explicit_ug_project / "great-docs.yml").write_text("""user_guide:
   - section: "Basics"
     contents:
       - 01-intro.qmd
       - 02-setup.qmd
 """)
 
-        docs = GreatDocs(project_path=tmp_dir)
-        user_guide_info = docs._discover_user_guide()
+    docs = GreatDocs(project_path=str(explicit_ug_project))
+    user_guide_info = docs._discover_user_guide()
 
-        # Copy files - should preserve names
-        docs.project_path.mkdir(parents=True, exist_ok=True)
-        copied_files = docs._copy_user_guide_to_docs(user_guide_info)
+    # Copy files - should preserve names
+    docs.project_path.mkdir(parents=True, exist_ok=True)
+    copied_files = docs._copy_user_guide_to_docs(user_guide_info)
 
-        assert "user-guide/01-intro.qmd" in copied_files
-        assert "user-guide/02-setup.qmd" in copied_files
+    assert "user-guide/01-intro.qmd" in copied_files
+    assert "user-guide/02-setup.qmd" in copied_files
 
-        # Verify files exist with original names
-        docs_ug = docs.project_path / "user-guide"
+    # Verify files exist with original names
+    docs_ug = docs.project_path / "user-guide"
 
-        assert (docs_ug / "01-intro.qmd").exists()
-        assert (docs_ug / "02-setup.qmd").exists()
+    assert (docs_ug / "01-intro.qmd").exists()
+    assert (docs_ug / "02-setup.qmd").exists()
 
-        # Sidebar should also use original names
-        sidebar = docs._generate_user_guide_sidebar(user_guide_info)
-        section_contents = sidebar["contents"][0]["contents"]
+    # Sidebar should also use original names
+    sidebar = docs._generate_user_guide_sidebar(user_guide_info)
+    section_contents = sidebar["contents"][0]["contents"]
 
-        assert section_contents[0] == "user-guide/01-intro.qmd"
-        assert section_contents[1] == "user-guide/02-setup.qmd"
+    assert section_contents[0] == "user-guide/01-intro.qmd"
+    assert section_contents[1] == "user-guide/02-setup.qmd"
 
 
-def test_user_guide_explicit_config_missing_file(capsys):
+def test_user_guide_explicit_config_missing_file(explicit_ug_project, capsys):
     """Test warning when explicit config references a non-existent file."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
-
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
-
-        user_guide = project_path / "user_guide"
-        user_guide.mkdir()
-
-        (user_guide / "exists.qmd").write_text("---\ntitle: Exists\n---\n# Exists\n")
-
-        config_path = project_path / "great-docs.yml"
-        config_path.write_text("""user_guide:
+    (explicit_ug_project / "great-docs.yml").write_text("""user_guide:
   - section: "Docs"
     contents:
       - exists.qmd
       - missing.qmd
 """)
 
-        docs = GreatDocs(project_path=tmp_dir)
-        result = docs._discover_user_guide()
+    docs = GreatDocs(project_path=str(explicit_ug_project))
+    result = docs._discover_user_guide()
 
-        assert result is not None
+    assert result is not None
 
-        # Only the existing file should be included
-        assert len(result["files"]) == 1
-        assert result["files"][0]["path"].name == "exists.qmd"
+    # Only the existing file should be included
+    assert len(result["files"]) == 1
+    assert result["files"][0]["path"].name == "exists.qmd"
 
-        captured = capsys.readouterr()
+    captured = capsys.readouterr()
 
-        assert "missing.qmd" in captured.out
-        assert "does not exist" in captured.out
+    assert "missing.qmd" in captured.out
+    assert "does not exist" in captured.out
 
 
-def test_user_guide_explicit_config_custom_text():
+def test_user_guide_explicit_config_custom_text(explicit_ug_project):
     """Test that custom text entries are preserved in file info."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
-
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
-
-        user_guide = project_path / "user_guide"
-        user_guide.mkdir()
-
-        (user_guide / "index.qmd").write_text("---\ntitle: Home\n---\n# Home\n")
-
-        config_path = project_path / "great-docs.yml"
-        config_path.write_text("""user_guide:
+    (explicit_ug_project / "great-docs.yml").write_text("""user_guide:
   - section: "Start"
     contents:
       - text: "Welcome to the Package"
         href: index.qmd
 """)
 
-        docs = GreatDocs(project_path=tmp_dir)
-        result = docs._discover_user_guide()
+    docs = GreatDocs(project_path=str(explicit_ug_project))
+    result = docs._discover_user_guide()
 
-        assert result is not None
-        assert result["files"][0].get("custom_text") == "Welcome to the Package"
+    assert result is not None
+    assert result["files"][0].get("custom_text") == "Welcome to the Package"
 
 
-def test_user_guide_explicit_overrides_frontmatter_sections():
+def test_user_guide_explicit_overrides_frontmatter_sections(explicit_ug_project):
     """Test that explicit config sections override frontmatter guide-section keys."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
-
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
-
-        user_guide = project_path / "user_guide"
-        user_guide.mkdir()
-
-        # File has guide-section in frontmatter, but config will override
-        (user_guide / "intro.qmd").write_text(
-            "---\ntitle: Intro\nguide-section: Old Section\n---\n# Intro\n"
-        )
-
-        config_path = project_path / "great-docs.yml"
-        config_path.write_text("""user_guide:
+    (explicit_ug_project / "great-docs.yml").write_text("""user_guide:
   - section: "New Section"
     contents:
       - intro.qmd
 """)
 
-        docs = GreatDocs(project_path=tmp_dir)
-        result = docs._discover_user_guide()
+    docs = GreatDocs(project_path=str(explicit_ug_project))
+    result = docs._discover_user_guide()
 
-        assert result is not None
+    assert result is not None
 
-        # Section should come from config, not frontmatter
-        assert result["files"][0]["section"] == "New Section"
-        assert "New Section" in result["sections"]
-        assert "Old Section" not in result["sections"]
+    # Section should come from config, not frontmatter
+    assert result["files"][0]["section"] == "New Section"
+    assert "New Section" in result["sections"]
+    assert "Old Section" not in result["sections"]
 
 
-def test_user_guide_explicit_with_conventional_dir():
+def test_user_guide_explicit_with_conventional_dir(explicit_ug_project):
     """Test that explicit config works with auto-discovered user_guide/ directory."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
-
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
-
-        # Use conventional user_guide/ directory
-        user_guide = project_path / "user_guide"
-        user_guide.mkdir()
-
-        (user_guide / "page.qmd").write_text("---\ntitle: Page\n---\n# Page\n")
-
-        config_path = project_path / "great-docs.yml"
-        config_path.write_text("""user_guide:
+    (explicit_ug_project / "great-docs.yml").write_text("""user_guide:
   - section: "Main"
     contents:
       - page.qmd
 """)
 
-        docs = GreatDocs(project_path=tmp_dir)
-        result = docs._discover_user_guide()
+    docs = GreatDocs(project_path=str(explicit_ug_project))
+    result = docs._discover_user_guide()
 
-        assert result is not None
-        assert result["explicit"] is True
-        assert result["source_dir"] == user_guide.resolve()
+    assert result is not None
+    assert result["explicit"] is True
+    assert result["source_dir"] == (explicit_ug_project / "user_guide").resolve()
 
 
-def test_user_guide_string_config_still_works():
+def test_user_guide_string_config_still_works(tmp_path):
     """Test that string user_guide config (directory path) still works as before."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
+    project_path = tmp_path
 
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
+    pyproject = project_path / "pyproject.toml"
+    pyproject.write_text('[project]\nname = "test"\nversion = "0.1.0"')
 
-        custom_dir = project_path / "my_guides"
-        custom_dir.mkdir()
-        (custom_dir / "intro.qmd").write_text(
-            "---\ntitle: Intro\nguide-section: Start\n---\n# Intro\n"
-        )
+    custom_dir = project_path / "my_guides"
+    custom_dir.mkdir()
+    (custom_dir / "intro.qmd").write_text("---\ntitle: Intro\nguide-section: Start\n---\n# Intro\n")
 
-        config_path = project_path / "great-docs.yml"
-        config_path.write_text("user_guide: my_guides\n")
+    config_path = project_path / "great-docs.yml"
+    config_path.write_text("user_guide: my_guides\n")
 
-        docs = GreatDocs(project_path=tmp_dir)
-        result = docs._discover_user_guide()
+    docs = GreatDocs(project_path=str(tmp_path))
+    result = docs._discover_user_guide()
 
-        assert result is not None
-        assert result.get("explicit", False) is False
-        assert result["source_dir"] == custom_dir.resolve()
-        assert len(result["files"]) == 1
+    assert result is not None
+    assert result.get("explicit", False) is False
+    assert result["source_dir"] == custom_dir.resolve()
+    assert len(result["files"]) == 1
 
 
-def test_landing_page_generated_when_no_readme():
+def test_landing_page_generated_when_no_readme(tmp_path):
     """Test that a landing page is auto-generated when no README/index files exist."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
+    project_path = tmp_path
 
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text(
-            '[project]\nname = "my-package"\nversion = "1.0"\ndescription = "A great package"\n'
-        )
+    pyproject = project_path / "pyproject.toml"
+    pyproject.write_text(
+        '[project]\nname = "my-package"\nversion = "1.0"\ndescription = "A great package"\n'
+    )
 
-        config_path = project_path / "great-docs.yml"
-        config_path.write_text("")
+    config_path = project_path / "great-docs.yml"
+    config_path.write_text("")
 
-        pkg_dir = project_path / "my_package"
-        pkg_dir.mkdir()
-        (pkg_dir / "__init__.py").write_text("")
+    pkg_dir = project_path / "my_package"
+    pkg_dir.mkdir()
+    (pkg_dir / "__init__.py").write_text("")
 
-        docs = GreatDocs(project_path=tmp_dir)
-        docs.project_path.mkdir(parents=True, exist_ok=True)
-        docs._create_index_from_readme()
+    docs = GreatDocs(project_path=str(tmp_path))
+    docs.project_path.mkdir(parents=True, exist_ok=True)
+    docs._create_index_from_readme()
 
-        index_qmd = docs.project_path / "index.qmd"
+    index_qmd = docs.project_path / "index.qmd"
 
-        assert index_qmd.exists()
+    assert index_qmd.exists()
 
-        content = index_qmd.read_text()
+    content = index_qmd.read_text()
 
-        assert "my-package" in content
-        assert "A great package" in content
-        assert "pip install my-package" in content
-        assert "API Reference" in content
+    assert "my-package" in content
+    assert "A great package" in content
+    assert "pip install my-package" in content
+    assert "API Reference" in content
 
 
-def test_landing_page_includes_description_from_pyproject():
+def test_landing_page_includes_description_from_pyproject(tmp_path):
     """Test that the landing page uses the description from pyproject.toml."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
+    project_path = tmp_path
 
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text(
-            '[project]\nname = "fancy-lib"\nversion = "2.0"\n'
-            'description = "Fancy library for doing fancy things"\n'
-        )
+    pyproject = project_path / "pyproject.toml"
+    pyproject.write_text(
+        '[project]\nname = "fancy-lib"\nversion = "2.0"\n'
+        'description = "Fancy library for doing fancy things"\n'
+    )
 
-        config_path = project_path / "great-docs.yml"
-        config_path.write_text("")
+    config_path = project_path / "great-docs.yml"
+    config_path.write_text("")
 
-        pkg_dir = project_path / "fancy_lib"
-        pkg_dir.mkdir()
-        (pkg_dir / "__init__.py").write_text("")
+    pkg_dir = project_path / "fancy_lib"
+    pkg_dir.mkdir()
+    (pkg_dir / "__init__.py").write_text("")
 
-        docs = GreatDocs(project_path=tmp_dir)
-        metadata = docs._get_package_metadata()
+    docs = GreatDocs(project_path=str(tmp_path))
+    metadata = docs._get_package_metadata()
 
-        content = docs._generate_landing_page_content(metadata)
+    content = docs._generate_landing_page_content(metadata)
 
-        assert "## fancy-lib" in content
-        assert "Fancy library for doing fancy things" in content
-        assert "pip install fancy-lib" in content
+    assert "## fancy-lib" in content
+    assert "Fancy library for doing fancy things" in content
+    assert "pip install fancy-lib" in content
 
 
-def test_landing_page_metadata_fallback_to_setup_cfg():
+def test_landing_page_metadata_fallback_to_setup_cfg(tmp_path):
     """Test that metadata falls back to setup.cfg when pyproject.toml lacks [project]."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
-
-        # pyproject.toml without [project] section
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text("[build-system]\nrequires = ['setuptools']\n")
-
-        setup_cfg = project_path / "setup.cfg"
-        setup_cfg.write_text(
-            "[metadata]\n"
-            "name = my-tool\n"
-            "description = A CLI tool for developers\n"
-            "author = Jane Doe\n"
-            "author_email = jane@example.com\n"
-            "license = MIT\n"
-            "url = https://github.com/jane/my-tool\n"
-            "project_urls =\n"
-            "    Documentation = https://my-tool.readthedocs.io\n"
-            "    Source = https://github.com/jane/my-tool\n"
-            "\n[options]\n"
-            "python_requires = >=3.8\n"
-        )
+    project_path = tmp_path
+
+    # pyproject.toml without [project] section
+    pyproject = project_path / "pyproject.toml"
+    pyproject.write_text("[build-system]\nrequires = ['setuptools']\n")
+
+    setup_cfg = project_path / "setup.cfg"
+    setup_cfg.write_text(
+        "[metadata]\n"
+        "name = my-tool\n"
+        "description = A CLI tool for developers\n"
+        "author = Jane Doe\n"
+        "author_email = jane@example.com\n"
+        "license = MIT\n"
+        "url = https://github.com/jane/my-tool\n"
+        "project_urls =\n"
+        "    Documentation = https://my-tool.readthedocs.io\n"
+        "    Source = https://github.com/jane/my-tool\n"
+        "\n[options]\n"
+        "python_requires = >=3.8\n"
+    )
 
-        config_path = project_path / "great-docs.yml"
-        config_path.write_text("")
+    config_path = project_path / "great-docs.yml"
+    config_path.write_text("")
 
-        pkg_dir = project_path / "my_tool"
-        pkg_dir.mkdir()
-        (pkg_dir / "__init__.py").write_text("")
+    pkg_dir = project_path / "my_tool"
+    pkg_dir.mkdir()
+    (pkg_dir / "__init__.py").write_text("")
 
-        docs = GreatDocs(project_path=tmp_dir)
-        metadata = docs._get_package_metadata()
+    docs = GreatDocs(project_path=str(tmp_path))
+    metadata = docs._get_package_metadata()
 
-        assert metadata["description"] == "A CLI tool for developers"
-        assert metadata["license"] == "MIT"
-        assert metadata["requires_python"] == ">=3.8"
-        assert metadata["authors"] == [{"name": "Jane Doe", "email": "jane@example.com"}]
-        assert "Repository" in metadata["urls"]
-        assert "Source" in metadata["urls"]
+    assert metadata["description"] == "A CLI tool for developers"
+    assert metadata["license"] == "MIT"
+    assert metadata["requires_python"] == ">=3.8"
+    assert metadata["authors"] == [{"name": "Jane Doe", "email": "jane@example.com"}]
+    assert "Repository" in metadata["urls"]
+    assert "Source" in metadata["urls"]
 
 
-def test_landing_page_not_generated_when_readme_exists():
+def test_landing_page_not_generated_when_readme_exists(tmp_path):
     """Test that the landing page is NOT generated when README.md exists."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
-
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "1.0"\n')
-
-        readme = project_path / "README.md"
-        readme.write_text("# My Package\n\nThis is the readme.\n")
-
-        config_path = project_path / "great-docs.yml"
-        config_path.write_text("")
+    project_path = tmp_path
 
-        pkg_dir = project_path / "test"
-        pkg_dir.mkdir()
-        (pkg_dir / "__init__.py").write_text("")
+    pyproject = project_path / "pyproject.toml"
+    pyproject.write_text('[project]\nname = "test"\nversion = "1.0"\n')
 
-        docs = GreatDocs(project_path=tmp_dir)
-        docs.project_path.mkdir(parents=True, exist_ok=True)
-        docs._create_index_from_readme()
+    readme = project_path / "README.md"
+    readme.write_text("# My Package\n\nThis is the readme.\n")
 
-        index_qmd = docs.project_path / "index.qmd"
+    config_path = project_path / "great-docs.yml"
+    config_path.write_text("")
 
-        assert index_qmd.exists()
+    pkg_dir = project_path / "test"
+    pkg_dir.mkdir()
+    (pkg_dir / "__init__.py").write_text("")
 
-        content = index_qmd.read_text()
+    docs = GreatDocs(project_path=str(tmp_path))
+    docs.project_path.mkdir(parents=True, exist_ok=True)
+    docs._create_index_from_readme()
 
-        # Should use the README content, not the auto-generated landing page
-        assert "This is the readme" in content
-        assert "pip install" not in content
+    index_qmd = docs.project_path / "index.qmd"
 
+    assert index_qmd.exists()
 
-def test_landing_page_has_sidebar_metadata():
-    """Test that the auto-generated landing page includes the sidebar."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
+    content = index_qmd.read_text()
 
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text(
-            '[project]\nname = "sidebar-test"\nversion = "1.0"\n'
-            'description = "Test sidebar"\n'
-            'requires-python = ">=3.9"\n'
-        )
+    # Should use the README content, not the auto-generated landing page
+    assert "This is the readme" in content
+    assert "pip install" not in content
 
-        license_file = project_path / "LICENSE"
-        license_file.write_text("MIT License")
 
-        config_path = project_path / "great-docs.yml"
-        config_path.write_text("")
+def test_landing_page_has_sidebar_metadata(tmp_path):
+    """Test that the auto-generated landing page includes the sidebar."""
+    project_path = tmp_path
 
-        pkg_dir = project_path / "sidebar_test"
-        pkg_dir.mkdir()
-        (pkg_dir / "__init__.py").write_text("")
+    pyproject = project_path / "pyproject.toml"
+    pyproject.write_text(
+        '[project]\nname = "sidebar-test"\nversion = "1.0"\n'
+        'description = "Test sidebar"\n'
+        'requires-python = ">=3.9"\n'
+    )
 
-        docs = GreatDocs(project_path=tmp_dir)
-        docs.project_path.mkdir(parents=True, exist_ok=True)
-        docs._create_index_from_readme()
+    license_file = project_path / "LICENSE"
+    license_file.write_text("MIT License")
 
-        index_qmd = docs.project_path / "index.qmd"
-        content = index_qmd.read_text()
+    config_path = project_path / "great-docs.yml"
+    config_path.write_text("")
 
-        # Should have sidebar with metadata
-        assert ".column-margin" in content
-        assert "View on PyPI" in content
-        assert "Full license" in content
-        assert ">=3.9" in content
+    pkg_dir = project_path / "sidebar_test"
+    pkg_dir.mkdir()
+    (pkg_dir / "__init__.py").write_text("")
 
+    docs = GreatDocs(project_path=str(tmp_path))
+    docs.project_path.mkdir(parents=True, exist_ok=True)
+    docs._create_index_from_readme()
 
-def test_landing_page_with_no_metadata():
-    """Test landing page generation when minimal metadata is available."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
+    index_qmd = docs.project_path / "index.qmd"
+    content = index_qmd.read_text()
 
-        # Only a package directory, no pyproject.toml or setup.cfg
-        pkg_dir = project_path / "minimal_pkg"
-        pkg_dir.mkdir()
-        (pkg_dir / "__init__.py").write_text("")
+    # Should have sidebar with metadata
+    assert ".column-margin" in content
+    assert "View on PyPI" in content
+    assert "Full license" in content
+    assert ">=3.9" in content
 
-        config_path = project_path / "great-docs.yml"
-        config_path.write_text("")
 
-        docs = GreatDocs(project_path=tmp_dir)
-        metadata = docs._get_package_metadata()
+def test_landing_page_with_no_metadata(tmp_path):
+    """Test landing page generation when minimal metadata is available."""
+    project_path = tmp_path
 
-        content = docs._generate_landing_page_content(metadata)
+    # Only a package directory, no pyproject.toml or setup.cfg
+    pkg_dir = project_path / "minimal_pkg"
+    pkg_dir.mkdir()
+    (pkg_dir / "__init__.py").write_text("")
 
-        assert "## minimal_pkg" in content
-        assert "pip install minimal_pkg" in content
+    config_path = project_path / "great-docs.yml"
+    config_path.write_text("")
 
+    docs = GreatDocs(project_path=str(tmp_path))
+    metadata = docs._get_package_metadata()
 
-def test_find_index_source_priority_order():
-    """Test that _find_index_source_file returns files in correct priority order."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "1.0"\n')
-        config_path = project_path / "great-docs.yml"
-        config_path.write_text("")
+    content = docs._generate_landing_page_content(metadata)
 
-        # If only README.rst exists, it should find it
-        (project_path / "README.rst").write_text("Title\n=====\n")
-        docs = GreatDocs(project_path=tmp_dir)
-        source, warnings = docs._find_index_source_file()
+    assert "## minimal_pkg" in content
+    assert "pip install minimal_pkg" in content
 
-        assert source is not None
-        assert source.name == "README.rst"
-        assert len(warnings) == 0
 
-        # If README.md exists, it should prefer it over README.rst
-        (project_path / "README.md").write_text("# Title\n")
-        source, warnings = docs._find_index_source_file()
+_INDEX_SOURCE_CONTENT = {
+    "README.rst": "Title\n=====\n",
+    "README.md": "# Title\n",
+    "index.md": "# Index\n",
+    "index.qmd": "---\ntitle: Index\n---\n",
+}
 
-        assert source.name == "README.md"
-        assert len(warnings) == 1
-        assert "README.rst" in warnings[0]
 
-        # If index.md exists, it should prefer it
-        (project_path / "index.md").write_text("# Index\n")
-        source, warnings = docs._find_index_source_file()
+@pytest.mark.parametrize(
+    "present, expected",
+    [
+        (("README.rst",), "README.rst"),
+        (("README.rst", "README.md"), "README.md"),
+        (("README.rst", "README.md", "index.md"), "index.md"),
+        (("README.rst", "README.md", "index.md", "index.qmd"), "index.qmd"),
+    ],
+)
+def test_find_index_source_priority_order(minimal_project, present, expected):
+    """Test that _find_index_source_file returns files in correct priority order."""
+    (minimal_project / "great-docs.yml").write_text("")
+    for name in present:
+        (minimal_project / name).write_text(_INDEX_SOURCE_CONTENT[name])
 
-        assert source.name == "index.md"
+    docs = GreatDocs(project_path=str(minimal_project))
+    source, warnings = docs._find_index_source_file()
 
-        # If index.qmd exists, it should prefer it
-        (project_path / "index.qmd").write_text("---\ntitle: Index\n---\n")
-        source, warnings = docs._find_index_source_file()
+    assert source is not None
+    assert source.name == expected
 
-        assert source.name == "index.qmd"
+    # Every lower-priority file that is present is named in a single warning
+    if len(present) == 1:
+        assert warnings == []
+    else:
+        assert len(warnings) == 1
+        for name in present:
+            if name != expected:
+                assert name in warnings[0]
 
 
-def test_find_index_source_no_files():
+def test_find_index_source_no_files(tmp_path):
     """Test that _find_index_source_file returns None when no source files exist."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
-        config_path = project_path / "great-docs.yml"
-        config_path.write_text("")
+    project_path = tmp_path
+    config_path = project_path / "great-docs.yml"
+    config_path.write_text("")
 
-        docs = GreatDocs(project_path=tmp_dir)
-        source, warnings = docs._find_index_source_file()
+    docs = GreatDocs(project_path=str(tmp_path))
+    source, warnings = docs._find_index_source_file()
 
-        assert source is None
-        assert len(warnings) == 0
+    assert source is None
+    assert len(warnings) == 0
 
 
-def test_readme_rst_creates_index():
+def test_readme_rst_creates_index(tmp_path):
     """Test that README.rst is converted and used for index.qmd."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "1.0"\n')
-        config_path = project_path / "great-docs.yml"
-        config_path.write_text("")
+    project_path = tmp_path
+    pyproject = project_path / "pyproject.toml"
+    pyproject.write_text('[project]\nname = "test"\nversion = "1.0"\n')
+    config_path = project_path / "great-docs.yml"
+    config_path.write_text("")
 
-        rst_content = "My Package\n==========\n\nThis is a great package.\n\nFeatures\n--------\n\n- Feature one\n- Feature two\n"
-        (project_path / "README.rst").write_text(rst_content)
+    rst_content = "My Package\n==========\n\nThis is a great package.\n\nFeatures\n--------\n\n- Feature one\n- Feature two\n"
+    (project_path / "README.rst").write_text(rst_content)
 
-        pkg_dir = project_path / "test"
-        pkg_dir.mkdir()
-        (pkg_dir / "__init__.py").write_text("")
+    pkg_dir = project_path / "test"
+    pkg_dir.mkdir()
+    (pkg_dir / "__init__.py").write_text("")
 
-        docs = GreatDocs(project_path=tmp_dir)
-        docs.project_path.mkdir(parents=True, exist_ok=True)
-        docs._create_index_from_readme()
+    docs = GreatDocs(project_path=str(tmp_path))
+    docs.project_path.mkdir(parents=True, exist_ok=True)
+    docs._create_index_from_readme()
 
-        index_qmd = docs.project_path / "index.qmd"
+    index_qmd = docs.project_path / "index.qmd"
 
-        assert index_qmd.exists()
+    assert index_qmd.exists()
 
-        content = index_qmd.read_text()
+    content = index_qmd.read_text()
 
-        # Pandoc converts RST headings to Markdown headings
-        # The heading adjustment then bumps them up one level
-        assert "My Package" in content
-        assert "great package" in content
-        assert "Feature one" in content
+    # Pandoc converts RST headings to Markdown headings
+    # The heading adjustment then bumps them up one level
+    assert "My Package" in content
+    assert "great package" in content
+    assert "Feature one" in content
 
 
-def test_readme_rst_not_used_when_readme_md_exists():
+def test_readme_rst_not_used_when_readme_md_exists(tmp_path):
     """Test that README.md takes priority over README.rst."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
-        pyproject = project_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "test"\nversion = "1.0"\n')
-        config_path = project_path / "great-docs.yml"
-        config_path.write_text("")
+    project_path = tmp_path
+    pyproject = project_path / "pyproject.toml"
+    pyproject.write_text('[project]\nname = "test"\nversion = "1.0"\n')
+    config_path = project_path / "great-docs.yml"
+    config_path.write_text("")
 
-        (project_path / "README.md").write_text("# Markdown README\n\nThis is the MD readme.\n")
-        (project_path / "README.rst").write_text(
-            "RST README\n==========\n\nThis is the RST readme.\n"
-        )
+    (project_path / "README.md").write_text("# Markdown README\n\nThis is the MD readme.\n")
+    (project_path / "README.rst").write_text("RST README\n==========\n\nThis is the RST readme.\n")
 
-        pkg_dir = project_path / "test"
-        pkg_dir.mkdir()
-        (pkg_dir / "__init__.py").write_text("")
+    pkg_dir = project_path / "test"
+    pkg_dir.mkdir()
+    (pkg_dir / "__init__.py").write_text("")
 
-        docs = GreatDocs(project_path=tmp_dir)
-        docs.project_path.mkdir(parents=True, exist_ok=True)
-        docs._create_index_from_readme()
+    docs = GreatDocs(project_path=str(tmp_path))
+    docs.project_path.mkdir(parents=True, exist_ok=True)
+    docs._create_index_from_readme()
 
-        index_qmd = docs.project_path / "index.qmd"
-        content = index_qmd.read_text()
+    index_qmd = docs.project_path / "index.qmd"
+    content = index_qmd.read_text()
 
-        assert "Markdown README" in content
-        assert "RST readme" not in content
+    assert "Markdown README" in content
+    assert "RST readme" not in content
 
 
-def test_convert_rst_to_markdown_real_pandoc():
+def test_convert_rst_to_markdown_real_pandoc(tmp_path):
     """Test RST to Markdown conversion via pandoc."""
 
     # Skip if neither quarto nor pandoc is available
     if not shutil.which("quarto") and not shutil.which("pandoc"):
         pytest.skip("quarto/pandoc not available")
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        project_path = Path(tmp_dir)
-        config_path = project_path / "great-docs.yml"
-        config_path.write_text("")
+    project_path = tmp_path
+    config_path = project_path / "great-docs.yml"
+    config_path.write_text("")
 
-        rst_file = project_path / "test.rst"
-        rst_file.write_text(
-            "Title\n=====\n\nParagraph text.\n\nSubtitle\n--------\n\n- Item 1\n- Item 2\n"
-        )
+    rst_file = project_path / "test.rst"
+    rst_file.write_text(
+        "Title\n=====\n\nParagraph text.\n\nSubtitle\n--------\n\n- Item 1\n- Item 2\n"
+    )
 
-        docs = GreatDocs(project_path=tmp_dir)
-        result = docs._convert_rst_to_markdown(rst_file)
+    docs = GreatDocs(project_path=str(tmp_path))
+    result = docs._convert_rst_to_markdown(rst_file)
 
-        # Should have Markdown headings
-        assert "# Title" in result
-        assert "## Subtitle" in result or "Subtitle" in result
-        assert "Paragraph text" in result
-        assert "Item 1" in result
+    # Should have Markdown headings
+    assert "# Title" in result
+    assert "## Subtitle" in result or "Subtitle" in result
+    assert "Paragraph text" in result
+    assert "Item 1" in result
 
 
 def test_fetch_github_releases_success():
@@ -8322,43 +8225,40 @@ def test_update_navbar_github_link_creates_right_section_from_empty():
         assert len(config["website"]["navbar"]["right"]) == 1
 
 
-def test_find_index_source_file_readme_returns_tuple():
+def test_find_index_source_file_readme_returns_tuple(tmp_path):
     """_find_index_source_file finds README.md."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        (Path(tmp_dir) / "pyproject.toml").write_text('[project]\nname="p"\n')
-        (Path(tmp_dir) / "README.md").write_text("# Hello\n")
+    (tmp_path / "pyproject.toml").write_text('[project]\nname="p"\n')
+    (tmp_path / "README.md").write_text("# Hello\n")
 
-        docs = GreatDocs(project_path=tmp_dir)
-        source, warnings = docs._find_index_source_file()
+    docs = GreatDocs(project_path=str(tmp_path))
+    source, warnings = docs._find_index_source_file()
 
-        assert source is not None
-        assert source.name == "README.md"
+    assert source is not None
+    assert source.name == "README.md"
 
 
-def test_find_index_source_file_index_qmd_priority():
+def test_find_index_source_file_index_qmd_priority(tmp_path):
     """_find_index_source_file prefers index.qmd over README.md."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        (Path(tmp_dir) / "pyproject.toml").write_text('[project]\nname="p"\n')
-        (Path(tmp_dir) / "index.qmd").write_text("---\ntitle: Main\n---\n")
-        (Path(tmp_dir) / "README.md").write_text("# Hello\n")
+    (tmp_path / "pyproject.toml").write_text('[project]\nname="p"\n')
+    (tmp_path / "index.qmd").write_text("---\ntitle: Main\n---\n")
+    (tmp_path / "README.md").write_text("# Hello\n")
 
-        docs = GreatDocs(project_path=tmp_dir)
-        source, warnings = docs._find_index_source_file()
+    docs = GreatDocs(project_path=str(tmp_path))
+    source, warnings = docs._find_index_source_file()
 
-        assert source is not None
-        assert source.name == "index.qmd"
-        assert len(warnings) == 1  # warns about multiple candidates
+    assert source is not None
+    assert source.name == "index.qmd"
+    assert len(warnings) == 1  # warns about multiple candidates
 
 
-def test_find_index_source_file_none_empty_dir():
+def test_find_index_source_file_none_empty_dir(tmp_path):
     """_find_index_source_file returns None when no source file exists."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        (Path(tmp_dir) / "pyproject.toml").write_text('[project]\nname="p"\n')
+    (tmp_path / "pyproject.toml").write_text('[project]\nname="p"\n')
 
-        docs = GreatDocs(project_path=tmp_dir)
-        source, warnings = docs._find_index_source_file()
+    docs = GreatDocs(project_path=str(tmp_path))
+    source, warnings = docs._find_index_source_file()
 
-        assert source is None
+    assert source is None
 
 
 def test_format_preserved_extras_yaml_with_values_simple_funding():
@@ -9785,40 +9685,39 @@ def test_add_section_sidebar_dir_titles_override():
         assert "Advanced" in section_titles
 
 
-def test_user_guide_sidebar_auto_strips_numeric_prefix_from_subdirs():
+def test_user_guide_sidebar_auto_strips_numeric_prefix_from_subdirs(tmp_path):
     """_generate_user_guide_sidebar_auto strips numeric prefixes from subdir section titles."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        tmp = Path(tmp_dir)
-        src = tmp / "user_guide"
-        src.mkdir()
-        sub1 = src / "01-basics"
-        sub1.mkdir()
-        (sub1 / "intro.qmd").write_text("Intro\n")
-        sub2 = src / "02-advanced-topics"
-        sub2.mkdir()
-        (sub2 / "deep.qmd").write_text("Deep\n")
-
-        guide_info = {
-            "files": [
-                {"path": sub1 / "intro.qmd", "title": "Intro", "section": None},
-                {"path": sub2 / "deep.qmd", "title": "Deep", "section": None},
-            ],
-            "source_dir": src,
-            "sections": {},
-        }
+    tmp = tmp_path
+    src = tmp / "user_guide"
+    src.mkdir()
+    sub1 = src / "01-basics"
+    sub1.mkdir()
+    (sub1 / "intro.qmd").write_text("Intro\n")
+    sub2 = src / "02-advanced-topics"
+    sub2.mkdir()
+    (sub2 / "deep.qmd").write_text("Deep\n")
+
+    guide_info = {
+        "files": [
+            {"path": sub1 / "intro.qmd", "title": "Intro", "section": None},
+            {"path": sub2 / "deep.qmd", "title": "Deep", "section": None},
+        ],
+        "source_dir": src,
+        "sections": {},
+    }
 
-        docs = GreatDocs(project_path=tmp_dir)
-        result = docs._generate_user_guide_sidebar_auto(guide_info)
+    docs = GreatDocs(project_path=str(tmp_path))
+    result = docs._generate_user_guide_sidebar_auto(guide_info)
 
-        section_items = [c for c in result["contents"] if isinstance(c, dict) and "section" in c]
-        section_titles = [s["section"] for s in section_items]
+    section_items = [c for c in result["contents"] if isinstance(c, dict) and "section" in c]
+    section_titles = [s["section"] for s in section_items]
 
-        # Numeric prefixes should be stripped
-        assert "Basics" in section_titles
-        assert "Advanced Topics" in section_titles
-        # Raw prefixed names should NOT appear
-        assert "01 Basics" not in section_titles
-        assert "02 Advanced Topics" not in section_titles
+    # Numeric prefixes should be stripped
+    assert "Basics" in section_titles
+    assert "Advanced Topics" in section_titles
+    # Raw prefixed names should NOT appear
+    assert "01 Basics" not in section_titles
+    assert "02 Advanced Topics" not in section_titles
 
 
 def test_inject_section_body_class_adds_class():
@@ -10683,60 +10582,56 @@ def test_format_cli_yaml_none():
     assert "# cli:" in result
 
 
-def test_find_index_source_file_readme_v2():
+def test_find_index_source_file_readme_v2(tmp_path):
     """_find_index_source_file finds README.md."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        tmp = Path(tmp_dir)
-        (tmp / "pyproject.toml").write_text('[project]\nname = "mypkg"\n')
-        (tmp / "README.md").write_text("# My Package\n")
+    tmp = tmp_path
+    (tmp / "pyproject.toml").write_text('[project]\nname = "mypkg"\n')
+    (tmp / "README.md").write_text("# My Package\n")
 
-        docs = GreatDocs(project_path=tmp_dir)
-        winner, warnings = docs._find_index_source_file()
+    docs = GreatDocs(project_path=str(tmp_path))
+    winner, warnings = docs._find_index_source_file()
 
-        assert winner is not None
-        assert winner.name == "README.md"
-        assert len(warnings) == 0
+    assert winner is not None
+    assert winner.name == "README.md"
+    assert len(warnings) == 0
 
 
-def test_find_index_source_file_priority():
+def test_find_index_source_file_priority(tmp_path):
     """_find_index_source_file prefers index.qmd over README.md."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        tmp = Path(tmp_dir)
-        (tmp / "pyproject.toml").write_text('[project]\nname = "mypkg"\n')
-        (tmp / "index.qmd").write_text("---\ntitle: Home\n---\n")
-        (tmp / "README.md").write_text("# My Package\n")
+    tmp = tmp_path
+    (tmp / "pyproject.toml").write_text('[project]\nname = "mypkg"\n')
+    (tmp / "index.qmd").write_text("---\ntitle: Home\n---\n")
+    (tmp / "README.md").write_text("# My Package\n")
 
-        docs = GreatDocs(project_path=tmp_dir)
-        winner, warnings = docs._find_index_source_file()
+    docs = GreatDocs(project_path=str(tmp_path))
+    winner, warnings = docs._find_index_source_file()
 
-        assert winner.name == "index.qmd"
-        assert len(warnings) == 1  # warns about README.md being ignored
+    assert winner.name == "index.qmd"
+    assert len(warnings) == 1  # warns about README.md being ignored
 
 
-def test_find_index_source_file_none_v2():
+def test_find_index_source_file_none_v2(tmp_path):
     """_find_index_source_file returns None when no candidates exist."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        tmp = Path(tmp_dir)
-        (tmp / "pyproject.toml").write_text('[project]\nname = "mypkg"\n')
+    tmp = tmp_path
+    (tmp / "pyproject.toml").write_text('[project]\nname = "mypkg"\n')
 
-        docs = GreatDocs(project_path=tmp_dir)
-        winner, warnings = docs._find_index_source_file()
+    docs = GreatDocs(project_path=str(tmp_path))
+    winner, warnings = docs._find_index_source_file()
 
-        assert winner is None
+    assert winner is None
 
 
-def test_find_index_source_file_rst():
+def test_find_index_source_file_rst(tmp_path):
     """_find_index_source_file finds README.rst as lowest priority."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        tmp = Path(tmp_dir)
-        (tmp / "pyproject.toml").write_text('[project]\nname = "mypkg"\n')
-        (tmp / "README.rst").write_text("My Package\n==========\n")
+    tmp = tmp_path
+    (tmp / "pyproject.toml").write_text('[project]\nname = "mypkg"\n')
+    (tmp / "README.rst").write_text("My Package\n==========\n")
 
-        docs = GreatDocs(project_path=tmp_dir)
-        winner, warnings = docs._find_index_source_file()
+    docs = GreatDocs(project_path=str(tmp_path))
+    winner, warnings = docs._find_index_source_file()
 
-        assert winner is not None
-        assert winner.name == "README.rst"
+    assert winner is not None
+    assert winner.name == "README.rst"
 
 
 def test_detect_git_ref_configured():
@@ -12162,137 +12057,126 @@ def test_update_navbar_github_link_preserves_non_github_items():
         assert right[2] == {"icon": "github", "href": "https://github.com/o/r"}
 
 
-def test_find_index_source_file_index_qmd_exact_warnings():
+def test_find_index_source_file_index_qmd_exact_warnings(tmp_path):
     """_find_index_source_file prefers index.qmd over others."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        (Path(tmp_dir) / "index.qmd").write_text("# Index", encoding="utf-8")
-        (Path(tmp_dir) / "README.md").write_text("# README", encoding="utf-8")
-        docs = GreatDocs(project_path=tmp_dir)
-        source, warnings = docs._find_index_source_file()
+    (tmp_path / "index.qmd").write_text("# Index", encoding="utf-8")
+    (tmp_path / "README.md").write_text("# README", encoding="utf-8")
+    docs = GreatDocs(project_path=str(tmp_path))
+    source, warnings = docs._find_index_source_file()
 
-        assert source is not None
-        assert source.name == "index.qmd"
-        assert len(warnings) == 1  # warns about multiple candidates
+    assert source is not None
+    assert source.name == "index.qmd"
+    assert len(warnings) == 1  # warns about multiple candidates
 
 
-def test_find_index_source_file_index_md():
+def test_find_index_source_file_index_md(tmp_path):
     """_find_index_source_file picks index.md when no index.qmd."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        (Path(tmp_dir) / "index.md").write_text("# Index", encoding="utf-8")
-        docs = GreatDocs(project_path=tmp_dir)
-        source, warnings = docs._find_index_source_file()
+    (tmp_path / "index.md").write_text("# Index", encoding="utf-8")
+    docs = GreatDocs(project_path=str(tmp_path))
+    source, warnings = docs._find_index_source_file()
 
-        assert source is not None
-        assert source.name == "index.md"
-        assert len(warnings) == 0
+    assert source is not None
+    assert source.name == "index.md"
+    assert len(warnings) == 0
 
 
-def test_find_index_source_file_readme_md():
+def test_find_index_source_file_readme_md(tmp_path):
     """_find_index_source_file picks README.md when no index files."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        (Path(tmp_dir) / "README.md").write_text("# Hello", encoding="utf-8")
-        docs = GreatDocs(project_path=tmp_dir)
-        source, warnings = docs._find_index_source_file()
+    (tmp_path / "README.md").write_text("# Hello", encoding="utf-8")
+    docs = GreatDocs(project_path=str(tmp_path))
+    source, warnings = docs._find_index_source_file()
 
-        assert source is not None
-        assert source.name == "README.md"
-        assert len(warnings) == 0
+    assert source is not None
+    assert source.name == "README.md"
+    assert len(warnings) == 0
 
 
-def test_find_index_source_file_readme_rst():
+def test_find_index_source_file_readme_rst(tmp_path):
     """_find_index_source_file picks README.rst as last resort."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        (Path(tmp_dir) / "README.rst").write_text("Hello\n=====", encoding="utf-8")
-        docs = GreatDocs(project_path=tmp_dir)
-        source, warnings = docs._find_index_source_file()
+    (tmp_path / "README.rst").write_text("Hello\n=====", encoding="utf-8")
+    docs = GreatDocs(project_path=str(tmp_path))
+    source, warnings = docs._find_index_source_file()
 
-        assert source is not None
-        assert source.name == "README.rst"
+    assert source is not None
+    assert source.name == "README.rst"
 
 
-def test_find_index_source_file_none_v3():
+def test_find_index_source_file_none_v3(tmp_path):
     """_find_index_source_file returns None when no candidates exist."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        docs = GreatDocs(project_path=tmp_dir)
-        source, warnings = docs._find_index_source_file()
+    docs = GreatDocs(project_path=str(tmp_path))
+    source, warnings = docs._find_index_source_file()
 
-        assert source is None
-        assert len(warnings) == 0
+    assert source is None
+    assert len(warnings) == 0
 
 
-def test_find_index_source_file_multiple_warns():
+def test_find_index_source_file_multiple_warns(tmp_path):
     """_find_index_source_file warns about multiple candidates."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        (Path(tmp_dir) / "index.md").write_text("x", encoding="utf-8")
-        (Path(tmp_dir) / "README.md").write_text("y", encoding="utf-8")
-        (Path(tmp_dir) / "README.rst").write_text("z", encoding="utf-8")
-        docs = GreatDocs(project_path=tmp_dir)
-        source, warnings = docs._find_index_source_file()
+    (tmp_path / "index.md").write_text("x", encoding="utf-8")
+    (tmp_path / "README.md").write_text("y", encoding="utf-8")
+    (tmp_path / "README.rst").write_text("z", encoding="utf-8")
+    docs = GreatDocs(project_path=str(tmp_path))
+    source, warnings = docs._find_index_source_file()
 
-        assert source.name == "index.md"
-        assert len(warnings) == 1
-        assert "README.md" in warnings[0]
-        assert "README.rst" in warnings[0]
+    assert source.name == "index.md"
+    assert len(warnings) == 1
+    assert "README.md" in warnings[0]
+    assert "README.rst" in warnings[0]
 
 
-def test_convert_rst_to_markdown_no_pandoc(monkeypatch):
+def test_convert_rst_to_markdown_no_pandoc(tmp_path, monkeypatch):
     """_convert_rst_to_markdown falls back to raw RST when pandoc not available."""
     import shutil as shutil_mod
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        rst_file = Path(tmp_dir) / "README.rst"
-        rst_file.write_text("Hello\n=====\n\nWorld", encoding="utf-8")
-        docs = GreatDocs(project_path=tmp_dir)
-        monkeypatch.setattr(shutil_mod, "which", lambda _cmd: None)
-        result = docs._convert_rst_to_markdown(rst_file)
+    rst_file = tmp_path / "README.rst"
+    rst_file.write_text("Hello\n=====\n\nWorld", encoding="utf-8")
+    docs = GreatDocs(project_path=str(tmp_path))
+    monkeypatch.setattr(shutil_mod, "which", lambda _cmd: None)
+    result = docs._convert_rst_to_markdown(rst_file)
 
-        assert result == "Hello\n=====\n\nWorld"
+    assert result == "Hello\n=====\n\nWorld"
 
 
-def test_convert_rst_to_markdown_pandoc_fails(monkeypatch):
+def test_convert_rst_to_markdown_pandoc_fails(tmp_path, monkeypatch):
     """_convert_rst_to_markdown falls back to raw RST when pandoc fails."""
     import shutil as shutil_mod
     import subprocess as subprocess_mod
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        rst_file = Path(tmp_dir) / "README.rst"
-        rst_file.write_text("Hello\n=====", encoding="utf-8")
-        docs = GreatDocs(project_path=tmp_dir)
-        monkeypatch.setattr(
-            shutil_mod, "which", lambda cmd: "/usr/bin/pandoc" if cmd == "pandoc" else None
-        )
+    rst_file = tmp_path / "README.rst"
+    rst_file.write_text("Hello\n=====", encoding="utf-8")
+    docs = GreatDocs(project_path=str(tmp_path))
+    monkeypatch.setattr(
+        shutil_mod, "which", lambda cmd: "/usr/bin/pandoc" if cmd == "pandoc" else None
+    )
 
-        def mock_run(*args, **kwargs):
-            return subprocess_mod.CompletedProcess(
-                args=args, returncode=1, stderr="error", stdout=""
-            )
+    def mock_run(*args, **kwargs):
+        return subprocess_mod.CompletedProcess(args=args, returncode=1, stderr="error", stdout="")
 
-        monkeypatch.setattr(subprocess_mod, "run", mock_run)
-        result = docs._convert_rst_to_markdown(rst_file)
+    monkeypatch.setattr(subprocess_mod, "run", mock_run)
+    result = docs._convert_rst_to_markdown(rst_file)
 
-        assert result == "Hello\n====="
+    assert result == "Hello\n====="
 
 
-def test_convert_rst_to_markdown_pandoc_exception(monkeypatch):
+def test_convert_rst_to_markdown_pandoc_exception(tmp_path, monkeypatch):
     """_convert_rst_to_markdown falls back to raw RST on subprocess exception."""
     import shutil as shutil_mod
     import subprocess as subprocess_mod
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        rst_file = Path(tmp_dir) / "README.rst"
-        rst_file.write_text("Raw RST Content", encoding="utf-8")
-        docs = GreatDocs(project_path=tmp_dir)
-        monkeypatch.setattr(
-            shutil_mod, "which", lambda cmd: "/usr/bin/quarto" if cmd == "quarto" else None
-        )
+    rst_file = tmp_path / "README.rst"
+    rst_file.write_text("Raw RST Content", encoding="utf-8")
+    docs = GreatDocs(project_path=str(tmp_path))
+    monkeypatch.setattr(
+        shutil_mod, "which", lambda cmd: "/usr/bin/quarto" if cmd == "quarto" else None
+    )
 
-        def mock_run(*args, **kwargs):
-            raise OSError("pandoc crashed")
+    def mock_run(*args, **kwargs):
+        raise OSError("pandoc crashed")
 
-        monkeypatch.setattr(subprocess_mod, "run", mock_run)
-        result = docs._convert_rst_to_markdown(rst_file)
+    monkeypatch.setattr(subprocess_mod, "run", mock_run)
+    result = docs._convert_rst_to_markdown(rst_file)
 
-        assert result == "Raw RST Content"
+    assert result == "Raw RST Content"
 
 
 def test_generate_landing_page_content_basic():
@@ -12413,6 +12297,24 @@ def test_get_quarto_env_preserves_existing_pythonpath(monkeypatch):
         assert tmp_dir in env["PYTHONPATH"]
 
 
+def test_get_quarto_env_probes_interpreter_once(monkeypatch):
+    """_get_quarto_env reuses its interpreter probe but always reflects the live environment."""
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        docs = GreatDocs(project_path=tmp_dir)
+
+        with patch.object(
+            GreatDocs, "_probe_quarto_python", wraps=GreatDocs._probe_quarto_python
+        ) as probe:
+            first = docs._get_quarto_env()
+            monkeypatch.setenv("GREAT_DOCS_TEST_VAR", "1")
+            second = docs._get_quarto_env()
+
+        assert probe.call_count == 1
+        assert second["QUARTO_PYTHON"] == first["QUARTO_PYTHON"]
+        assert second["GREAT_DOCS_TEST_VAR"] == "1"
+
+
 def test_detect_module_name_from_pyi():
     """_detect_module_name detects module from .pyi stub files."""
     with tempfile.TemporaryDirectory() as tmp_dir:
@@ -14540,6 +14442,24 @@ def test_write_quarto_yml_adds_header():
         assert "#" in content
 
 
+def test_write_quarto_yml_skips_unchanged_config(tmp_docs):
+    """Test _write_quarto_yml leaves the file untouched when the config has not changed."""
+    quarto_yml = tmp_docs.project_path / "_quarto.yml"
+    quarto_yml.parent.mkdir(parents=True, exist_ok=True)
+
+    config = {"project": {"type": "website"}}
+    tmp_docs._write_quarto_yml(quarto_yml, dict(config))
+    first = quarto_yml.read_text()
+
+    with patch("builtins.open", wraps=open) as mock_open:
+        tmp_docs._write_quarto_yml(quarto_yml, dict(config))
+    mock_open.assert_not_called()
+    assert quarto_yml.read_text() == first
+
+    tmp_docs._write_quarto_yml(quarto_yml, {"project": {"type": "book"}})
+    assert "book" in quarto_yml.read_text()
+
+
 def test_update_sidebar_from_sections_basic():
     """Test _update_sidebar_from_sections builds sidebar from API reference."""
 
@@ -16997,6 +16917,58 @@ def test_create_api_sections_large_class():
         assert {"name": "BigClass", "members": []} in classes_section["contents"]
 
 
+def test_categorize_api_objects_cached_reuses_disk_result(tmp_path, capsys):
+    """Test categorized exports are cached on disk until package sources change."""
+    pkg_dir = tmp_path / "diskpkg"
+    pkg_dir.mkdir()
+    (pkg_dir / "__init__.py").write_text('__all__ = ["Widget"]\n\n\nclass Widget:\n    pass\n')
+
+    docs = GreatDocs(project_path=str(tmp_path))
+    categories = GreatDocs._empty_categories()
+    categories["classes"] = ["Widget"]
+
+    def categorize(package_name, exports):
+        print("Warning: Could not introspect 'Widget'")
+        return categories
+
+    with patch.object(docs, "_categorize_api_objects", side_effect=categorize) as mock_cat:
+        first = docs._categorize_api_objects_cached("diskpkg", ["Widget"])
+        assert "Could not introspect 'Widget'" in capsys.readouterr().out
+
+        # A cache hit replays the warnings printed when the result was computed
+        second = docs._categorize_api_objects_cached("diskpkg", ["Widget"])
+        assert "Could not introspect 'Widget'" in capsys.readouterr().out
+
+        assert mock_cat.call_count == 1
+        assert first == second == categories
+        assert list((tmp_path / ".great-docs-cache" / "api").glob("diskpkg-*.json"))
+
+        # A source edit yields a new cache key
+        (pkg_dir / "__init__.py").write_text('__all__ = ["Widget"]\n\n\nclass Widget:\n    x = 1\n')
+        docs._categorize_api_objects_cached("diskpkg", ["Widget"])
+        assert mock_cat.call_count == 2
+
+        # So does a rebuilt compiled extension module
+        (pkg_dir / "_native.cpython-311-x86_64-linux-gnu.so").write_bytes(b"\0" * 8)
+        docs._categorize_api_objects_cached("diskpkg", ["Widget"])
+        assert mock_cat.call_count == 3
+
+
+def test_categorize_api_objects_cached_never_stores_fallback_result(tmp_path):
+    """Test results from the importlib fallback are not written to the on-disk cache."""
+    pkg_dir = tmp_path / "fallbackpkg"
+    pkg_dir.mkdir()
+    (pkg_dir / "__init__.py").write_text('__all__ = ["helper"]\n\n\ndef helper():\n    pass\n')
+
+    docs = GreatDocs(project_path=str(tmp_path))
+
+    with patch.object(docs, "_load_griffe_package", side_effect=RuntimeError("boom")):
+        result = docs._categorize_api_objects_cached("fallbackpkg", ["helper"])
+
+    assert isinstance(result, dict)
+    assert not list((tmp_path / ".great-docs-cache" / "api").glob("fallbackpkg-*.json"))
+
+
 def test_create_api_sections_no_exports():
     """Test _create_api_sections returns None when no exports."""
 
@@ -17548,63 +17520,59 @@ def test_discover_user_guide_basic_full_project():
         )  # May not find if naming doesn't match convention
 
 
-def test_find_index_source_file():
+def test_find_index_source_file(tmp_path):
     """Test _find_index_source_file finds README.md."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        docs = GreatDocs(project_path=tmp_dir)
+    docs = GreatDocs(project_path=str(tmp_path))
 
-        readme = Path(tmp_dir) / "README.md"
-        readme.write_text("# Hello\n")
+    readme = tmp_path / "README.md"
+    readme.write_text("# Hello\n")
 
-        source_file, warnings = docs._find_index_source_file()
-        assert source_file is not None
-        assert source_file.name == "README.md"
+    source_file, warnings = docs._find_index_source_file()
+    assert source_file is not None
+    assert source_file.name == "README.md"
 
 
-def test_find_index_source_file_index_qmd_v2():
+def test_find_index_source_file_index_qmd_v2(tmp_path):
     """Test _find_index_source_file prefers index.qmd."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        docs = GreatDocs(project_path=tmp_dir)
+    docs = GreatDocs(project_path=str(tmp_path))
 
-        readme = Path(tmp_dir) / "README.md"
-        readme.write_text("# Hello\n")
+    readme = tmp_path / "README.md"
+    readme.write_text("# Hello\n")
 
-        index_qmd = Path(tmp_dir) / "index.qmd"
-        index_qmd.write_text("---\ntitle: Home\n---\n")
+    index_qmd = tmp_path / "index.qmd"
+    index_qmd.write_text("---\ntitle: Home\n---\n")
 
-        source_file, _ = docs._find_index_source_file()
-        assert source_file is not None
-        assert source_file.name == "index.qmd"
+    source_file, _ = docs._find_index_source_file()
+    assert source_file is not None
+    assert source_file.name == "index.qmd"
 
 
-def test_find_index_source_file_none_v4():
+def test_find_index_source_file_none_v4(tmp_path):
     """Test _find_index_source_file returns None when no source file."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        docs = GreatDocs(project_path=tmp_dir)
+    docs = GreatDocs(project_path=str(tmp_path))
 
-        source_file, warnings = docs._find_index_source_file()
-        assert source_file is None
+    source_file, warnings = docs._find_index_source_file()
+    assert source_file is None
 
 
-def test_convert_rst_to_markdown():
+def test_convert_rst_to_markdown(tmp_path):
     """Test _convert_rst_to_markdown handles RST conversion."""
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        docs = GreatDocs(project_path=tmp_dir)
+    docs = GreatDocs(project_path=str(tmp_path))
 
-        rst_file = Path(tmp_dir) / "README.rst"
-        rst_file.write_text("Title\n=====\n\nSome content.\n")
+    rst_file = tmp_path / "README.rst"
+    rst_file.write_text("Title\n=====\n\nSome content.\n")
 
-        # Mock subprocess to simulate pandoc
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "# Title\n\nSome content.\n"
+    # Mock subprocess to simulate pandoc
+    mock_result = MagicMock()
+    mock_result.returncode = 0
+    mock_result.stdout = "# Title\n\nSome content.\n"
 
-        with patch("subprocess.run", return_value=mock_result):
-            result = docs._convert_rst_to_markdown(rst_file)
+    with patch("subprocess.run", return_value=mock_result):
+        result = docs._convert_rst_to_markdown(rst_file)
 
-        assert "Title" in result
-        assert "Some content" in result
+    assert "Title" in result
+    assert "Some content" in result
 
 
 def test_generate_landing_page_content():
@@ -18820,34 +18788,31 @@ def test_copy_user_guide_to_docs_basic():
         assert isinstance(result, list)
 
 
-def test_find_index_source_file_readme():
+def test_find_index_source_file_readme(tmp_path):
     """Test _find_index_source_file finds README.md."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        docs = GreatDocs(project_path=tmp_dir)
-        (Path(tmp_dir) / "README.md").write_text("# My Package\n")
-        result, warnings = docs._find_index_source_file()
-        assert result is not None
-        assert result.name == "README.md"
+    docs = GreatDocs(project_path=str(tmp_path))
+    (tmp_path / "README.md").write_text("# My Package\n")
+    result, warnings = docs._find_index_source_file()
+    assert result is not None
+    assert result.name == "README.md"
 
 
-def test_find_index_source_file_index_qmd():
+def test_find_index_source_file_index_qmd(tmp_path):
     """Test _find_index_source_file prefers index.qmd over README."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        docs = GreatDocs(project_path=tmp_dir)
-        (Path(tmp_dir) / "README.md").write_text("# README\n")
-        (Path(tmp_dir) / "index.qmd").write_text("---\ntitle: Home\n---\n")
-        result, warnings = docs._find_index_source_file()
-        assert result is not None
-        assert result.name == "index.qmd"
-        assert len(warnings) >= 1  # Should warn about multiple candidates
+    docs = GreatDocs(project_path=str(tmp_path))
+    (tmp_path / "README.md").write_text("# README\n")
+    (tmp_path / "index.qmd").write_text("---\ntitle: Home\n---\n")
+    result, warnings = docs._find_index_source_file()
+    assert result is not None
+    assert result.name == "index.qmd"
+    assert len(warnings) >= 1  # Should warn about multiple candidates
 
 
-def test_find_index_source_file_none():
+def test_find_index_source_file_none(tmp_path):
     """Test _find_index_source_file returns None when nothing found."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        docs = GreatDocs(project_path=tmp_dir)
-        result, warnings = docs._find_index_source_file()
-        assert result is None
+    docs = GreatDocs(project_path=str(tmp_path))
+    result, warnings = docs._find_index_source_file()
+    assert result is None
 
 
 def test_get_package_metadata_setup_cfg_license():
@@ -20289,6 +20254,33 @@ def test_detect_docstring_style_no_docstrings():
         assert result == "numpy"
 
 
+def test_detect_docstring_style_cached_per_loaded_package(tmp_path):
+    """Test _detect_docstring_style reuses its verdict until the package sources change."""
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "stylepkg"\nversion = "0.1.0"\n')
+    pkg_dir = tmp_path / "stylepkg"
+    pkg_dir.mkdir()
+    init_py = pkg_dir / "__init__.py"
+    init_py.write_text(
+        'def my_func(x):\n    """Do something.\n\n    Args:\n        x: The value.\n    """\n'
+    )
+
+    docs = GreatDocs(project_path=str(tmp_path))
+
+    with patch.object(docs, "_docstring_style_of", wraps=docs._docstring_style_of) as spy:
+        assert docs._detect_docstring_style("stylepkg") == "google"
+        assert docs._detect_docstring_style("stylepkg") == "google"
+        assert spy.call_count == 1
+
+        # Editing the source yields a freshly loaded package, which is classified afresh
+        init_py.write_text(
+            "def my_func(x):\n"
+            '    """Do something.\n\n    Parameters\n    ----------\n    x\n'
+            '        The value.\n    """\n'
+        )
+        assert docs._detect_docstring_style("stylepkg") == "numpy"
+        assert spy.call_count == 2
+
+
 def test_patch_griffe_adds_missing_exceptions():
     """Test _patch_griffe patches CyclicAliasError and AliasResolutionError onto griffe."""
     import griffe
@@ -25205,75 +25197,94 @@ def test_update_gitignore_interactive_no(monkeypatch):
         assert not gitignore.exists()
 
 
-def test_check_links_with_docs_files():
+def test_check_links_with_docs_files(tmp_docs, tmp_path):
     """Test check_links scans documentation files."""
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        docs = GreatDocs(project_path=tmp_dir)
-        ug_dir = Path(tmp_dir) / "user_guide"
-        ug_dir.mkdir()
-        (ug_dir / "intro.qmd").write_text(
-            "---\ntitle: Intro\n---\n\nVisit https://httpbin.org/status/200\n",
-            encoding="utf-8",
-        )
+    ug_dir = tmp_path / "user_guide"
+    ug_dir.mkdir()
+    (ug_dir / "intro.qmd").write_text(
+        "---\ntitle: Intro\n---\n\nVisit https://httpbin.org/status/200\n",
+        encoding="utf-8",
+    )
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.headers = {}
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.headers = {}
 
-        with patch("requests.head", return_value=mock_response):
-            result = docs.check_links(
-                include_source=False,
-                include_docs=True,
-                timeout=5.0,
-            )
+    with patch("requests.head", return_value=mock_response):
+        result = tmp_docs.check_links(
+            include_source=False,
+            include_docs=True,
+            timeout=5.0,
+        )
 
-        assert result["total"] >= 1
-        assert len(result["ok"]) >= 1
+    assert result["total"] >= 1
+    assert len(result["ok"]) >= 1
 
 
-def test_check_links_skips_code_blocks():
+def test_check_links_skips_code_blocks(tmp_docs, tmp_path):
     """Test check_links skips URLs inside code blocks."""
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        docs = GreatDocs(project_path=tmp_dir)
-        ug_dir = Path(tmp_dir) / "user_guide"
-        ug_dir.mkdir()
-        (ug_dir / "code.qmd").write_text(
-            "---\ntitle: Code\n---\n\n"
-            "```python\nhttps://example.com/in-code\n```\n\n"
-            "Real: https://httpbin.org/status/200\n",
-            encoding="utf-8",
-        )
+    ug_dir = tmp_path / "user_guide"
+    ug_dir.mkdir()
+    (ug_dir / "code.qmd").write_text(
+        "---\ntitle: Code\n---\n\n"
+        "```python\nhttps://example.com/in-code\n```\n\n"
+        "Real: https://httpbin.org/status/200\n",
+        encoding="utf-8",
+    )
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.headers = {}
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.headers = {}
 
-        with patch("requests.head", return_value=mock_response) as mock_head:
-            result = docs.check_links(include_source=False, include_docs=True)
+    with patch("requests.head", return_value=mock_response) as mock_head:
+        result = tmp_docs.check_links(include_source=False, include_docs=True)
+
+    # The code block URL should be excluded
+    checked_urls = result["ok"] + [b["url"] for b in result["broken"]]
+    assert "https://example.com/in-code" not in checked_urls
+
+
+def test_check_links_concurrent_results_keep_order(tmp_docs, tmp_path):
+    """Test check_links reports concurrently checked URLs in discovery order."""
+
+    ug_dir = tmp_path / "user_guide"
+    ug_dir.mkdir()
+    urls = [f"https://site{i}.test/page" for i in range(40)]
+    (ug_dir / "many.qmd").write_text(
+        "---\ntitle: Many\n---\n\n" + "\n".join(urls) + "\n",
+        encoding="utf-8",
+    )
+
+    def fake_head(url, **kwargs):
+        response = MagicMock()
+        response.status_code = 404 if url.endswith("site3.test/page") else 200
+        response.headers = {}
+        return response
 
-        # The code block URL should be excluded
-        checked_urls = result["ok"] + [b["url"] for b in result["broken"]]
-        assert "https://example.com/in-code" not in checked_urls
+    with patch("requests.head", side_effect=fake_head) as mock_head:
+        result = tmp_docs.check_links(include_source=False, include_docs=True)
 
+    assert mock_head.call_count == 40
+    assert result["ok"] == [u for u in urls if u != urls[3]]
+    assert [b["url"] for b in result["broken"]] == [urls[3]]
 
-def test_check_links_gd_no_link():
+
+def test_check_links_gd_no_link(tmp_docs, tmp_path):
     """Test check_links skips URLs marked with {.gd-no-link}."""
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        docs = GreatDocs(project_path=tmp_dir)
-        ug_dir = Path(tmp_dir) / "user_guide"
-        ug_dir.mkdir()
-        (ug_dir / "skip.qmd").write_text(
-            "---\ntitle: Skip\n---\n\nhttps://fake-url.example.com{.gd-no-link}\n",
-            encoding="utf-8",
-        )
+    ug_dir = tmp_path / "user_guide"
+    ug_dir.mkdir()
+    (ug_dir / "skip.qmd").write_text(
+        "---\ntitle: Skip\n---\n\nhttps://fake-url.example.com{.gd-no-link}\n",
+        encoding="utf-8",
+    )
 
-        result = docs.check_links(include_source=False, include_docs=True)
+    result = tmp_docs.check_links(include_source=False, include_docs=True)
 
-        # Should have no URLs to check
-        assert result["total"] == 0
+    # Should have no URLs to check
+    assert result["total"] == 0
 
 
 def test_check_links_ignore_patterns():
@@ -577,6 +577,23 @@ def test_generator_with_config_override(tmp_path: Path):
     assert "google" in content
 
 
+def test_generator_writes_preserialized_pyproject(tmp_path: Path):
+    """A string ``pyproject_toml`` entry is written verbatim (dedented)."""
+    spec = {
+        "name": "gdtest_toml_text",
+        "pyproject_toml": """\
+            [project]
+            name = "gdtest-toml-text"
+            version = "0.1.0"
+        """,
+        "files": {"gdtest_toml_text/__init__.py": '"""Pkg."""\n'},
+    }
+    pkg_dir = generate_package(spec, tmp_path)
+
+    content = (pkg_dir / "pyproject.toml").read_text()
+    assert content == '[project]\nname = "gdtest-toml-text"\nversion = "0.1.0"\n'
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # L3: CLI Sidebar Structure
 # ═══════════════════════════════════════════════════════════════════════════════